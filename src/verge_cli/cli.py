@@ -8,84 +8,54 @@ import click
 import typer
 
 from verge_cli import __version__
-from verge_cli.commands import (
-    alarm,
-    api_key,
-    auth_source,
-    billing,
-    catalog,
-    certificate,
-    cluster,
-    completion,
-    configure,
-    file,
-    gpu,
-    group,
-    log,
-    nas,
-    network,
-    node,
-    oidc,
-    permission,
-    recipe,
-    resource_group,
-    shared_object,
-    site,
-    snapshot,
-    storage,
-    system,
-    tag,
-    task,
-    tenant,
-    tenant_recipe,
-    update,
-    user,
-    vm,
-    webhook,
-)
 from verge_cli.config import get_effective_config
+from verge_cli.lazy import lazy_group
 
+# Command groups are registered by import path; only the group being run
+# (or all of them, for --help) is imported and converted to Click commands.
 app = typer.Typer(
     name="vrg",
     help="Command-line interface for VergeOS.",
     no_args_is_help=True,
+    cls=lazy_group(
+        {
+            "alarm": "verge_cli.commands.alarm:app",
+            "api-key": "verge_cli.commands.api_key:app",
+            "auth-source": "verge_cli.commands.auth_source:app",
+            "billing": "verge_cli.commands.billing:app",
+            "catalog": "verge_cli.commands.catalog:app",
+            "certificate": "verge_cli.commands.certificate:app",
+            "cluster": "verge_cli.commands.cluster:app",
+            "completion": "verge_cli.commands.completion:app",
+            "configure": "verge_cli.commands.configure:app",
+            "file": "verge_cli.commands.file:app",
+            "gpu": "verge_cli.commands.gpu:app",
+            "group": "verge_cli.commands.group:app",
+            "log": "verge_cli.commands.log:app",
+            "nas": "verge_cli.commands.nas:app",
+            "network": "verge_cli.commands.network:app",
+            "node": "verge_cli.commands.node:app",
+            "oidc": "verge_cli.commands.oidc:app",
+            "permission": "verge_cli.commands.permission:app",
+            "recipe": "verge_cli.commands.recipe:app",
+            "resource-group": "verge_cli.commands.resource_group:app",
+            "shared-object": "verge_cli.commands.shared_object:app",
+            "site": "verge_cli.commands.site:app",
+            "snapshot": "verge_cli.commands.snapshot:app",
+            "storage": "verge_cli.commands.storage:app",
+            "system": "verge_cli.commands.system:app",
+            "tag": "verge_cli.commands.tag:app",
+            "task": "verge_cli.commands.task:app",
+            "tenant": "verge_cli.commands.tenant:app",
+            "tenant-recipe": "verge_cli.commands.tenant_recipe:app",
+            "update": "verge_cli.commands.update:app",
+            "user": "verge_cli.commands.user:app",
+            "vm": "verge_cli.commands.vm:app",
+            "webhook": "verge_cli.commands.webhook:app",
+        }
+    ),
 )
 
-# Register sub-commands
-app.add_typer(alarm.app, name="alarm")
-app.add_typer(api_key.app, name="api-key")
-app.add_typer(auth_source.app, name="auth-source")
-app.add_typer(billing.app, name="billing")
-app.add_typer(catalog.app, name="catalog")
-app.add_typer(certificate.app, name="certificate")
-app.add_typer(cluster.app, name="cluster")
-app.add_typer(completion.app, name="completion")
-app.add_typer(configure.app, name="configure")
-app.add_typer(file.app, name="file")
-app.add_typer(gpu.app, name="gpu")
-app.add_typer(group.app, name="group")
-app.add_typer(log.app, name="log")
-app.add_typer(nas.app, name="nas")
-app.add_typer(network.app, name="network")
-app.add_typer(node.app, name="node")
-app.add_typer(oidc.app, name="oidc")
-app.add_typer(permission.app, name="permission")
-app.add_typer(recipe.app, name="recipe")
-app.add_typer(resource_group.app, name="resource-group")
-app.add_typer(shared_object.app, name="shared-object")
-app.add_typer(site.app, name="site")
-app.add_typer(snapshot.app, name="snapshot")
-app.add_typer(storage.app, name="storage")
-app.add_typer(system.app, name="system")
-app.add_typer(tag.app, name="tag")
-app.add_typer(task.app, name="task")
-app.add_typer(tenant.app, name="tenant")
-app.add_typer(tenant_recipe.app, name="tenant-recipe")
-app.add_typer(update.app, name="update")
-app.add_typer(user.app, name="user")
-app.add_typer(vm.app, name="vm")
-app.add_typer(webhook.app, name="webhook")
-
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -154,7 +124,7 @@ def main(
             "--output",
             "-o",
             help="Output format.",
-            click_type=click.Choice(["table", "wide", "json", "csv"]),
+            click_type=click.Choice(["table", "wide", "json", "ndjson", "csv"]),
         ),
     ] = "table",
     query: Annotated[
@@ -92,6 +92,17 @@ def format_bool_yn(value: Any, *, for_csv: bool = False) -> str:
     return str(value)
 
 
+def format_comma_list(value: Any, *, for_csv: bool = False) -> str:
+    """Format a list as a comma-separated string (joined only at render time)."""
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return "" if for_csv else "-"
+        return ", ".join(str(v) for v in value)
+    if value is None:
+        return "" if for_csv else "-"
+    return str(value)
+
+
 def json_serializer(obj: Any) -> str:
     """JSON serializer for datetime and other types."""
     if isinstance(obj, datetime):
@@ -874,7 +885,7 @@ OIDC_APP_COLUMNS: list[ColumnDef] = [
     ColumnDef("name"),
     ColumnDef("client_id", header="Client ID"),
     ColumnDef("enabled", format_fn=format_bool_yn, style_map=BOOL_STYLES),
-    ColumnDef("scopes", header="Scopes"),
+    ColumnDef("scopes", header="Scopes", format_fn=format_comma_list),
     ColumnDef(
         "restrict_access",
         header="Restricted",
@@ -882,7 +893,12 @@ OIDC_APP_COLUMNS: list[ColumnDef] = [
         style_map=FLAG_STYLES,
     ),
     # wide-only
-    ColumnDef("redirect_uris_display", header="Redirect URIs", wide_only=True),
+    ColumnDef(
+        "redirect_uris",
+        header="Redirect URIs",
+        format_fn=format_comma_list,
+        wide_only=True,
+    ),
     ColumnDef("force_auth_source_display", header="Auth Source", wide_only=True),
     ColumnDef("description", wide_only=True),
 ]
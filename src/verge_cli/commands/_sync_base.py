@@ -0,0 +1,158 @@
+"""Shared command factory for incoming and outgoing site syncs."""
+
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+import typer
+
+from verge_cli.columns import ColumnDef
+from verge_cli.context import get_context
+from verge_cli.errors import handle_errors
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    fetch_resource,
+    key_or_name_filter,
+    list_paged,
+    resolve_named_resource_ids,
+)
+
+
+def make_sync_app(
+    direction: str,
+    client_attr: str,
+    columns: list[ColumnDef],
+    fields: tuple[str, ...],
+) -> typer.Typer:
+    """Build the list/get/enable/disable commands for one sync direction.
+
+    Args:
+        direction: "incoming" or "outgoing"; used as the group name and in
+            help and status messages.
+        client_attr: Name of the SDK manager on the client
+            (e.g. "site_syncs_incoming").
+        columns: Column definitions for list output.
+        fields: Row fields shown between name and description.
+
+    Returns:
+        Typer app; callers may register further commands on it.
+    """
+    resource_type = f"{direction.capitalize()} Sync"
+    app = typer.Typer(
+        name=direction,
+        help=f"Manage {direction} site syncs.",
+        no_args_is_help=True,
+    )
+
+    def manager(vctx: Any) -> Any:
+        return getattr(vctx.client, client_attr)
+
+    def sync_to_dict(sync: Any) -> dict[str, Any]:
+        get = sync.get
+        row = {"$key": sync.key, "name": sync.name}
+        row.update((field, get(field)) for field in fields)
+        row["description"] = get("description", "")
+        return row
+
+    @app.command("list", help=f"List all {direction} site syncs.")
+    @handle_errors()
+    def list_cmd(
+        ctx: typer.Context,
+        site: Annotated[
+            str | None,
+            typer.Option("--site", "-s", help="Filter by site (name or key)"),
+        ] = None,
+        enabled: Annotated[
+            bool | None,
+            typer.Option(
+                "--enabled/--disabled",
+                help="Filter by enabled state",
+            ),
+        ] = None,
+        limit: Annotated[
+            int | None,
+            typer.Option("--limit", min=1, help="Maximum number of results."),
+        ] = None,
+        page_size: Annotated[
+            int | None,
+            typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+        ] = None,
+        continuation: Annotated[
+            str | None,
+            typer.Option(
+                "--continuation",
+                help=(
+                    "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                    "added or removed meanwhile can be skipped or repeated."
+                ),
+            ),
+        ] = None,
+        all_pages: Annotated[
+            bool,
+            typer.Option("--all", help="Fetch every page instead of stopping after one."),
+        ] = False,
+    ) -> None:
+        vctx = get_context(ctx)
+        kwargs: dict[str, Any] = {}
+
+        if site is not None:
+            kwargs.update(key_or_name_filter(site, "site_key", "site_name"))
+
+        if enabled is not None:
+            kwargs["enabled"] = enabled
+
+        if limit is not None:
+            kwargs["limit"] = limit
+
+        syncs = list_paged(
+            manager(vctx).list,
+            page_size=page_size,
+            continuation=continuation,
+            all_pages=all_pages,
+            **kwargs,
+        )
+        vctx.emit((sync_to_dict(s) for s in syncs), columns=columns)
+
+    @app.command("get", help=f"Get details of an {direction} site sync.")
+    @handle_errors()
+    def get_cmd(
+        ctx: typer.Context,
+        sync: Annotated[str, typer.Argument(help="Sync name or key (key:N skips the name lookup)")],
+    ) -> None:
+        vctx = get_context(ctx)
+        item = fetch_resource(manager(vctx), sync, resource_type)
+        vctx.emit(sync_to_dict(item))
+
+    @app.command("enable", help=f"Enable one or more {direction} site syncs.")
+    @handle_errors()
+    def enable_cmd(
+        ctx: typer.Context,
+        names: Annotated[
+            list[str],
+            typer.Argument(help="Sync names or keys (key:N skips the name lookup)"),
+        ],
+    ) -> None:
+        vctx = get_context(ctx)
+        syncs = manager(vctx)
+        keys = resolve_named_resource_ids(syncs, names, resource_type)
+        for name, key in zip(names, keys, strict=True):
+            syncs.enable(key)
+            output_success(f"Enabled {direction} sync '{name}'", quiet=vctx.quiet)
+
+    @app.command("disable", help=f"Disable one or more {direction} site syncs.")
+    @handle_errors()
+    def disable_cmd(
+        ctx: typer.Context,
+        names: Annotated[
+            list[str],
+            typer.Argument(help="Sync names or keys (key:N skips the name lookup)"),
+        ],
+    ) -> None:
+        vctx = get_context(ctx)
+        syncs = manager(vctx)
+        keys = resolve_named_resource_ids(syncs, names, resource_type)
+        for name, key in zip(names, keys, strict=True):
+            syncs.disable(key)
+            output_success(f"Disabled {direction} sync '{name}'", quiet=vctx.quiet)
+
+    return app
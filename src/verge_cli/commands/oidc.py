@@ -24,13 +24,16 @@ app.add_typer(oidc_group.app, name="group")
 app.add_typer(oidc_log.app, name="log")
 
 
+def _get_oidc_app(client: Any, identifier: str) -> Any:
+    """Fetch OIDC application by identifier (key or name)."""
+    if identifier.isdigit():
+        return client.oidc_applications.get(key=int(identifier))
+    return client.oidc_applications.get(name=identifier)
+
+
 def _resolve_oidc_app(client: Any, identifier: str) -> int:
     """Resolve OIDC application identifier (key or name) to key."""
-    if identifier.isdigit():
-        oidc_app = client.oidc_applications.get(key=int(identifier))
-    else:
-        oidc_app = client.oidc_applications.get(name=identifier)
-    return int(oidc_app.key)
+    return int(_get_oidc_app(client, identifier).key)
 
 
 def _oidc_app_to_dict(
@@ -47,10 +50,7 @@ def _oidc_app_to_dict(
         "enabled": oidc_app.is_enabled,
         "restrict_access": oidc_app.is_access_restricted,
         "redirect_uris": oidc_app.redirect_uris,
-        "redirect_uris_display": (
-            ", ".join(oidc_app.redirect_uris) if oidc_app.redirect_uris else ""
-        ),
-        "scopes": ", ".join(oidc_app.scopes),
+        "scopes": oidc_app.scopes,
         "scope_profile": oidc_app.get("scope_profile", True),
         "scope_email": oidc_app.get("scope_email", True),
         "scope_groups": oidc_app.get("scope_groups", True),
@@ -92,13 +92,18 @@ def oidc_list(
         typer.echo("Error: --enabled and --disabled are mutually exclusive.", err=True)
         raise typer.Exit(2)
 
-    kwargs: dict[str, Any] = {}
+    # Fold the state flags into a single server-side OData filter
+    filters: list[str] = []
     if filter is not None:
-        kwargs["filter"] = filter
+        filters.append(f"({filter})" if enabled or disabled else filter)
     if enabled:
-        kwargs["enabled"] = True
+        filters.append("enabled eq 1")
     elif disabled:
-        kwargs["enabled"] = False
+        filters.append("enabled eq 0")
+
+    kwargs: dict[str, Any] = {}
+    if filters:
+        kwargs["filter"] = " and ".join(filters)
 
     apps = vctx.client.oidc_applications.list(**kwargs)
 
@@ -405,8 +410,8 @@ def oidc_enable(
     """Enable an OIDC application."""
     vctx = get_context(ctx)
 
-    key = _resolve_oidc_app(vctx.client, oidc_app)
-    app_obj = vctx.client.oidc_applications.get(key=key)
+    # The lookup already returns the application; toggle it in place
+    app_obj = _get_oidc_app(vctx.client, oidc_app)
     app_obj.enable()
 
     output_success(f"Enabled OIDC application '{app_obj.name}'", quiet=vctx.quiet)
@@ -421,8 +426,8 @@ def oidc_disable(
     """Disable an OIDC application."""
     vctx = get_context(ctx)
 
-    key = _resolve_oidc_app(vctx.client, oidc_app)
-    app_obj = vctx.client.oidc_applications.get(key=key)
+    # The lookup already returns the application; toggle it in place
+    app_obj = _get_oidc_app(vctx.client, oidc_app)
     app_obj.disable()
 
     output_success(f"Disabled OIDC application '{app_obj.name}'", quiet=vctx.quiet)
@@ -10,7 +10,12 @@ from verge_cli.columns import PERMISSION_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
 from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.utils import (
+    confirm_action,
+    list_paged,
+    resolve_resource_id,
+    resolve_resource_ids,
+)
 
 app = typer.Typer(
     name="permission",
@@ -21,22 +26,73 @@ app = typer.Typer(
 
 def _permission_to_dict(perm: Any) -> dict[str, Any]:
     """Convert a Permission SDK object to a dictionary for output."""
+    # Read each SDK property once; is_table_level and has_full_control are
+    # derived from the same fields, so compute them locally.
+    row_key = perm.row_key
+    flags = (perm.can_list, perm.can_read, perm.can_create, perm.can_modify, perm.can_delete)
     return {
-        "$key": int(perm.key),
+        "$key": perm.key,
         "identity_name": perm.identity_name,
         "table": perm.table,
-        "row_key": perm.row_key,
-        "row_display": perm.row_display if perm.row_key != 0 else "(all)",
-        "is_table_level": perm.is_table_level,
-        "can_list": perm.can_list,
-        "can_read": perm.can_read,
-        "can_create": perm.can_create,
-        "can_modify": perm.can_modify,
-        "can_delete": perm.can_delete,
-        "has_full_control": perm.has_full_control,
+        "row_key": row_key,
+        "row_display": perm.row_display if row_key != 0 else "(all)",
+        "is_table_level": row_key == 0,
+        "can_list": flags[0],
+        "can_read": flags[1],
+        "can_create": flags[2],
+        "can_modify": flags[3],
+        "can_delete": flags[4],
+        "has_full_control": all(flags),
     }
 
 
+def _check_identity_args(
+    user: str | None,
+    group: str | None,
+    user_key: int | None,
+    group_key: int | None,
+) -> None:
+    """Exit with a usage error unless exactly one identity option is given."""
+    given = [v for v in (user, group, user_key, group_key) if v is not None]
+    if not given:
+        typer.echo("Error: must specify --user or --group.", err=True)
+        raise typer.Exit(2)
+    if len(given) > 1:
+        typer.echo(
+            "Error: specify only one of --user, --group, --user-key or --group-key.",
+            err=True,
+        )
+        raise typer.Exit(2)
+
+
+def _resolve_identities(
+    vctx: Any,
+    user: str | None,
+    group: str | None,
+    user_key: int | None = None,
+    group_key: int | None = None,
+) -> tuple[str, list[int]]:
+    """Resolve --user/--group values to keys.
+
+    Values may be comma-separated to target several identities; all names
+    are resolved from a single listing of users (or groups). Keys given via
+    --user-key/--group-key are used as-is without any lookup.
+
+    Returns:
+        Tuple of (identity kind, keys) where kind is "user" or "group".
+    """
+    if user_key is not None:
+        return "user", [user_key]
+    if group_key is not None:
+        return "group", [group_key]
+    if user is not None:
+        names = [u.strip() for u in user.split(",") if u.strip()]
+        return "user", resolve_resource_ids(vctx.client.users, names, "User")
+    assert group is not None
+    names = [g.strip() for g in group.split(",") if g.strip()]
+    return "group", resolve_resource_ids(vctx.client.groups, names, "Group")
+
+
 @app.command("list")
 @handle_errors()
 def permission_list(
@@ -49,6 +105,14 @@ def permission_list(
         str | None,
         typer.Option("--group", help="Filter by group (name or key)."),
     ] = None,
+    user_key: Annotated[
+        int | None,
+        typer.Option("--user-key", help="User key; skips the name lookup."),
+    ] = None,
+    group_key: Annotated[
+        int | None,
+        typer.Option("--group-key", help="Group key; skips the name lookup."),
+    ] = None,
     table: Annotated[
         str | None,
         typer.Option("--table", help="Filter by resource table (e.g. vms, vnets, /)."),
@@ -57,28 +121,71 @@ def permission_list(
         str | None,
         typer.Option("--filter", help="OData filter expression."),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List permissions."""
     vctx = get_context(ctx)
 
+    # --table/--user/--group are sent as OData filters by the SDK, which
+    # joins them to --filter with "and"; parenthesise the user expression so
+    # an "or" inside it cannot widen the combined filter.
     kwargs: dict[str, Any] = {}
     if filter is not None:
-        kwargs["filter"] = filter
+        narrowed = any(v is not None for v in (table, user, group, user_key, group_key))
+        kwargs["filter"] = f"({filter})" if narrowed else filter
     if table is not None:
         kwargs["table"] = table
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    if user is not None and user_key is not None:
+        typer.echo("Error: specify only one of --user or --user-key.", err=True)
+        raise typer.Exit(2)
+    if group is not None and group_key is not None:
+        typer.echo("Error: specify only one of --group or --group-key.", err=True)
+        raise typer.Exit(2)
 
-    # Resolve user/group to keys for SDK call
+    # Resolve user/group to keys for SDK call (--*-key skips the lookup)
     if user is not None:
         user_key = resolve_resource_id(vctx.client.users, user, "User")
+    if user_key is not None:
         kwargs["user"] = user_key
     if group is not None:
         group_key = resolve_resource_id(vctx.client.groups, group, "Group")
+    if group_key is not None:
         kwargs["group"] = group_key
 
-    perms = vctx.client.permissions.list(**kwargs)
+    perms = list_paged(
+        vctx.client.permissions.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
+    )
 
     output_result(
-        [_permission_to_dict(p) for p in perms],
+        (_permission_to_dict(p) for p in perms),
         output_format=vctx.output_format,
         query=vctx.query,
         columns=PERMISSION_COLUMNS,
@@ -117,11 +224,19 @@ def permission_grant(
     ],
     user: Annotated[
         str | None,
-        typer.Option("--user", help="User to grant to (name or key)."),
+        typer.Option("--user", help="User(s) to grant to (name or key, comma-separated)."),
     ] = None,
     group: Annotated[
         str | None,
-        typer.Option("--group", help="Group to grant to (name or key)."),
+        typer.Option("--group", help="Group(s) to grant to (name or key, comma-separated)."),
+    ] = None,
+    user_key: Annotated[
+        int | None,
+        typer.Option("--user-key", help="User key; skips the name lookup."),
+    ] = None,
+    group_key: Annotated[
+        int | None,
+        typer.Option("--group-key", help="Group key; skips the name lookup."),
     ] = None,
     row: Annotated[
         int,
@@ -155,13 +270,8 @@ def permission_grant(
     """Grant a permission to a user or group."""
     vctx = get_context(ctx)
 
-    # Validate: must specify exactly one of user or group
-    if user is None and group is None:
-        typer.echo("Error: must specify --user or --group.", err=True)
-        raise typer.Exit(2)
-    if user is not None and group is not None:
-        typer.echo("Error: specify only one of --user or --group.", err=True)
-        raise typer.Exit(2)
+    # Validate: must specify exactly one identity
+    _check_identity_args(user, group, user_key, group_key)
 
     # If no permission flags given and not full-control, default to --list only
     if not full_control and not any([can_list, can_read, can_create, can_modify, can_delete]):
@@ -179,21 +289,30 @@ def permission_grant(
         "full_control": full_control,
     }
 
-    if user is not None:
-        user_key = resolve_resource_id(vctx.client.users, user, "User")
-        kwargs["user"] = user_key
-    if group is not None:
-        group_key = resolve_resource_id(vctx.client.groups, group, "Group")
-        kwargs["group"] = group_key
-
-    perm = vctx.client.permissions.grant(**kwargs)
-
-    output_success(f"Granted permission (key: {int(perm.key)})", quiet=vctx.quiet)
-
+    identity_type, identity_keys = _resolve_identities(vctx, user, group, user_key, group_key)
+    perms = [
+        vctx.client.permissions.grant(**{**kwargs, identity_type: identity_key})
+        for identity_key in identity_keys
+    ]
+
+    if len(perms) == 1:
+        perm = perms[0]
+        output_success(f"Granted permission (key: {perm.key})", quiet=vctx.quiet)
+        output_result(
+            _permission_to_dict(perm),
+            output_format=vctx.output_format,
+            query=vctx.query,
+            quiet=vctx.quiet,
+            no_color=vctx.no_color,
+        )
+        return
+
+    output_success(f"Granted {len(perms)} permissions", quiet=vctx.quiet)
     output_result(
-        _permission_to_dict(perm),
+        [_permission_to_dict(p) for p in perms],
         output_format=vctx.output_format,
         query=vctx.query,
+        columns=PERMISSION_COLUMNS,
         quiet=vctx.quiet,
         no_color=vctx.no_color,
     )
@@ -226,11 +345,25 @@ def permission_revoke_all(
     ctx: typer.Context,
     user: Annotated[
         str | None,
-        typer.Option("--user", help="Revoke all permissions for this user (name or key)."),
+        typer.Option(
+            "--user",
+            help="Revoke all permissions for this user (name or key, comma-separated).",
+        ),
     ] = None,
     group: Annotated[
         str | None,
-        typer.Option("--group", help="Revoke all permissions for this group (name or key)."),
+        typer.Option(
+            "--group",
+            help="Revoke all permissions for this group (name or key, comma-separated).",
+        ),
+    ] = None,
+    user_key: Annotated[
+        int | None,
+        typer.Option("--user-key", help="User key; skips the name lookup."),
+    ] = None,
+    group_key: Annotated[
+        int | None,
+        typer.Option("--group-key", help="Group key; skips the name lookup."),
     ] = None,
     table: Annotated[
         str | None,
@@ -244,34 +377,27 @@ def permission_revoke_all(
     """Revoke all permissions for a user or group."""
     vctx = get_context(ctx)
 
-    # Validate: must specify exactly one of user or group
-    if user is None and group is None:
-        typer.echo("Error: must specify --user or --group.", err=True)
-        raise typer.Exit(2)
-    if user is not None and group is not None:
-        typer.echo("Error: specify only one of --user or --group.", err=True)
-        raise typer.Exit(2)
+    # Validate: must specify exactly one identity
+    _check_identity_args(user, group, user_key, group_key)
 
-    identity_label = user if user is not None else group
-    identity_type = "user" if user is not None else "group"
-    table_label = f" on table '{table}'" if table else ""
+    # List the matching permissions up front so the prompt can show how many
+    # will go, then delete exactly those rows by key.
+    identity_type, identity_keys = _resolve_identities(vctx, user, group, user_key, group_key)
+    permissions = vctx.client.permissions
+    perm_keys: list[int] = []
+    for identity_key in identity_keys:
+        filters: dict[str, Any] = {"table": table, identity_type: identity_key}
+        perm_keys.extend(perm.key for perm in permissions.list(**filters))
 
-    if not confirm_action(
-        f"Revoke all permissions for {identity_type} '{identity_label}'{table_label}?",
-        yes=yes,
-    ):
-        typer.echo("Cancelled.")
-        raise typer.Exit(0)
+    label = next(v for v in (user, group, user_key, group_key) if v is not None)
+    scope = f"{identity_type} '{label}'" + (f" on table '{table}'" if table else "")
 
-    if user is not None:
-        user_key = resolve_resource_id(vctx.client.users, user, "User")
-        count = vctx.client.permissions.revoke_for_user(user_key, table=table)
-    else:
-        assert group is not None
-        group_key = resolve_resource_id(vctx.client.groups, group, "Group")
-        count = vctx.client.permissions.revoke_for_group(group_key, table=table)
+    if perm_keys and not yes:
+        if not confirm_action(f"Revoke {len(perm_keys)} permission(s) for {scope}?"):
+            typer.echo("Cancelled.")
+            raise typer.Exit(0)
 
-    output_success(
-        f"Revoked {count} permission(s) for {identity_type} '{identity_label}'{table_label}",
-        quiet=vctx.quiet,
-    )
+    for perm_key in perm_keys:
+        permissions.revoke(perm_key)
+
+    output_success(f"Revoked {len(perm_keys)} permission(s) for {scope}", quiet=vctx.quiet)
@@ -7,23 +7,34 @@ from typing import Annotated, Any
 import typer
 
 from verge_cli.columns import ColumnDef, format_bool_yn
-from verge_cli.commands import recipe_instance, recipe_log, recipe_question, recipe_section
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
+from verge_cli.lazy import lazy_group
 from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_nas_resource, resolve_resource_id
+from verge_cli.utils import (
+    confirm_action,
+    fetch_nas_resource,
+    forget_resolved,
+    list_paged,
+    resolve_nas_resource,
+    resolve_resource_id,
+)
 
+# Sub-apps are imported only when their sub-command is dispatched.
 app = typer.Typer(
     name="recipe",
     help="Manage VM recipes.",
     no_args_is_help=True,
+    cls=lazy_group(
+        {
+            "instance": "verge_cli.commands.recipe_instance:app",
+            "log": "verge_cli.commands.recipe_log:app",
+            "question": "verge_cli.commands.recipe_question:app",
+            "section": "verge_cli.commands.recipe_section:app",
+        }
+    ),
 )
 
-app.add_typer(recipe_instance.app, name="instance")
-app.add_typer(recipe_log.app, name="log")
-app.add_typer(recipe_question.app, name="question")
-app.add_typer(recipe_section.app, name="section")
-
 RECIPE_COLUMNS: list[ColumnDef] = [
     ColumnDef("$key", header="Key"),
     ColumnDef("name"),
@@ -35,12 +46,13 @@ RECIPE_COLUMNS: list[ColumnDef] = [
 
 def _recipe_to_dict(recipe: Any) -> dict[str, Any]:
     """Convert a VmRecipe SDK object to a dict for output."""
+    get = recipe.get
     return {
         "$key": recipe.key,
         "name": recipe.name,
-        "description": recipe.get("description", ""),
-        "enabled": recipe.get("enabled"),
-        "notes": recipe.get("notes", ""),
+        "description": get("description", ""),
+        "enabled": get("enabled"),
+        "notes": get("notes", ""),
     }
 
 
@@ -51,9 +63,9 @@ def _parse_set_args(set_args: list[str]) -> dict[str, str]:
     """
     result: dict[str, str] = {}
     for item in set_args:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise typer.BadParameter(f"Invalid --set format: '{item}'. Expected KEY=VALUE.")
-        key, value = item.split("=", 1)
         result[key.strip()] = value.strip()
     return result
 
@@ -79,6 +91,28 @@ def list_cmd(
         bool | None,
         typer.Option("--downloaded/--not-downloaded", help="Filter by downloaded state."),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List VM recipes."""
     vctx = get_context(ctx)
@@ -87,10 +121,17 @@ def list_cmd(
         kwargs["catalog"] = catalog
     if downloaded is not None:
         kwargs["downloaded"] = downloaded
-    recipes = vctx.client.vm_recipes.list(**kwargs)
-    data = [_recipe_to_dict(r) for r in recipes]
+    if limit is not None:
+        kwargs["limit"] = limit
+    recipes = list_paged(
+        vctx.client.vm_recipes.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
+    )
     output_result(
-        data,
+        (_recipe_to_dict(r) for r in recipes),
         output_format=vctx.output_format,
         query=vctx.query,
         columns=RECIPE_COLUMNS,
@@ -103,12 +144,13 @@ def list_cmd(
 @handle_errors()
 def get_cmd(
     ctx: typer.Context,
-    recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    recipe: Annotated[
+        str, typer.Argument(help="Recipe name or 40-char key (a key skips the name lookup).")
+    ],
 ) -> None:
     """Get a VM recipe by name or key."""
     vctx = get_context(ctx)
-    key = _resolve_recipe(vctx, recipe)
-    item = vctx.client.vm_recipes.get(key)
+    item = fetch_nas_resource(vctx.client.vm_recipes, recipe, resource_type="recipe")
     output_result(
         _recipe_to_dict(item),
         output_format=vctx.output_format,
@@ -175,7 +217,9 @@ def create_cmd(
 @handle_errors()
 def update_cmd(
     ctx: typer.Context,
-    recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    recipe: Annotated[
+        str, typer.Argument(help="Recipe name or 40-char key (a key skips the name lookup).")
+    ],
     name: Annotated[
         str | None,
         typer.Option("--name", "-n", help="New recipe name."),
@@ -200,6 +244,8 @@ def update_cmd(
     if version is not None:
         kwargs["version"] = version
     result = vctx.client.vm_recipes.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.vm_recipes)
     output_result(
         _recipe_to_dict(result),
         output_format=vctx.output_format,
@@ -215,7 +261,9 @@ def update_cmd(
 @handle_errors()
 def delete_cmd(
     ctx: typer.Context,
-    recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    recipe: Annotated[
+        str, typer.Argument(help="Recipe name or 40-char key (a key skips the name lookup).")
+    ],
     yes: Annotated[
         bool,
         typer.Option("--yes", "-y", help="Skip confirmation."),
@@ -227,6 +275,7 @@ def delete_cmd(
     if not confirm_action(f"Delete recipe '{recipe}'?", yes=yes):
         raise typer.Abort()
     vctx.client.vm_recipes.delete(key)
+    forget_resolved(vctx.client.vm_recipes)
     output_success(f"Recipe '{recipe}' deleted.")
 
 
@@ -234,7 +283,9 @@ def delete_cmd(
 @handle_errors()
 def download_cmd(
     ctx: typer.Context,
-    recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    recipe: Annotated[
+        str, typer.Argument(help="Recipe name or 40-char key (a key skips the name lookup).")
+    ],
 ) -> None:
     """Download a recipe from the catalog repository."""
     vctx = get_context(ctx)
@@ -247,7 +298,9 @@ def download_cmd(
 @handle_errors()
 def deploy_cmd(
     ctx: typer.Context,
-    recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    recipe: Annotated[
+        str, typer.Argument(help="Recipe name or 40-char key (a key skips the name lookup).")
+    ],
     name: Annotated[str, typer.Option("--name", "-n", help="Name for the deployed VM.")],
     set_args: Annotated[
         list[str] | None,
@@ -266,7 +319,7 @@ def deploy_cmd(
         answers = _parse_set_args(set_args)
     instance = vctx.client.vm_recipes.deploy(key, name, answers=answers, auto_update=auto_update)
     inst_data = {
-        "$key": int(instance.key),
+        "$key": instance.key,
         "name": instance.name,
         "recipe_name": instance.get("recipe_name", ""),
         "auto_update": instance.get("auto_update"),
@@ -10,7 +10,13 @@ from verge_cli.columns import ColumnDef, format_bool_yn
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
 from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_nas_resource, resolve_resource_id
+from verge_cli.utils import (
+    confirm_action,
+    forget_resolved,
+    list_paged,
+    resolve_nas_resource,
+    resolve_resource_id,
+)
 
 app = typer.Typer(
     name="instance",
@@ -28,11 +34,12 @@ RECIPE_INSTANCE_COLUMNS: list[ColumnDef] = [
 
 def _instance_to_dict(inst: Any) -> dict[str, Any]:
     """Convert a VmRecipeInstance SDK object to a dict for output."""
+    get = inst.get
     return {
-        "$key": int(inst.key),
+        "$key": inst.key,
         "name": inst.name,
-        "recipe_name": inst.get("recipe_name", ""),
-        "auto_update": inst.get("auto_update"),
+        "recipe_name": get("recipe_name", ""),
+        "auto_update": get("auto_update"),
     }
 
 
@@ -44,10 +51,34 @@ def list_cmd(
         str | None,
         typer.Option("--recipe", help="Filter by recipe name or key."),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List deployed recipe instances."""
     vctx = get_context(ctx)
     kwargs: dict[str, Any] = {}
+    if limit is not None:
+        kwargs["limit"] = limit
     if recipe is not None:
         recipe_key = resolve_nas_resource(
             vctx.client.vm_recipes,
@@ -55,10 +86,15 @@ def list_cmd(
             resource_type="recipe",
         )
         kwargs["recipe"] = recipe_key
-    instances = vctx.client.vm_recipe_instances.list(**kwargs)
-    data = [_instance_to_dict(i) for i in instances]
+    instances = list_paged(
+        vctx.client.vm_recipe_instances.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
+    )
     output_result(
-        data,
+        (_instance_to_dict(i) for i in instances),
         output_format=vctx.output_format,
         query=vctx.query,
         columns=RECIPE_INSTANCE_COLUMNS,
@@ -106,4 +142,5 @@ def delete_cmd(
     ):
         raise typer.Abort()
     vctx.client.vm_recipe_instances.delete(key)
+    forget_resolved(vctx.client.vm_recipe_instances)
     output_success(f"Instance '{instance}' deleted.")
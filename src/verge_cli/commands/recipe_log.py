@@ -10,7 +10,7 @@ from verge_cli.columns import ColumnDef, format_epoch
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
 from verge_cli.output import output_result
-from verge_cli.utils import resolve_nas_resource
+from verge_cli.utils import list_paged, resolve_nas_resource
 
 app = typer.Typer(
     name="log",
@@ -29,16 +29,17 @@ RECIPE_LOG_COLUMNS: list[ColumnDef] = [
 
 def _log_to_dict(log: Any) -> dict[str, Any]:
     """Convert a VmRecipeLog SDK object to a dict for output."""
+    get = log.get
     # Timestamp is in microseconds in the SDK — convert to seconds for format_epoch
-    ts = log.get("timestamp")
+    ts = get("timestamp")
     if isinstance(ts, (int, float)) and ts > 1e12:
         ts = ts / 1e6
     return {
-        "$key": int(log.key),
-        "level": log.get("level", ""),
-        "text": log.get("text", ""),
+        "$key": log.key,
+        "level": get("level", ""),
+        "text": get("text", ""),
         "timestamp": ts,
-        "user": log.get("user", ""),
+        "user": get("user", ""),
     }
 
 
@@ -50,6 +51,24 @@ def list_cmd(
         str | None,
         typer.Option("--recipe", help="Filter by recipe name or key."),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List recipe operation logs."""
     vctx = get_context(ctx)
@@ -61,10 +80,15 @@ def list_cmd(
             resource_type="recipe",
         )
         kwargs["vm_recipe"] = recipe_key
-    logs = vctx.client.vm_recipe_logs.list(**kwargs)
-    data = [_log_to_dict(entry) for entry in logs]
+    logs = list_paged(
+        vctx.client.vm_recipe_logs.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
+    )
     output_result(
-        data,
+        (_log_to_dict(entry) for entry in logs),
         output_format=vctx.output_format,
         query=vctx.query,
         columns=RECIPE_LOG_COLUMNS,
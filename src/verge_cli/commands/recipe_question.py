@@ -9,8 +9,13 @@ import typer
 from verge_cli.columns import ColumnDef, format_bool_yn
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_nas_resource, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    list_paged,
+    resolve_nas_resource,
+    resolve_resource_id,
+)
 
 app = typer.Typer(
     name="question",
@@ -31,14 +36,15 @@ RECIPE_QUESTION_COLUMNS: list[ColumnDef] = [
 
 def _question_to_dict(question: Any) -> dict[str, Any]:
     """Convert a RecipeQuestion SDK object to a dict for output."""
+    get = question.get
     return {
         "$key": int(question.key),
         "name": question.name,
-        "display": question.get("display", ""),
-        "type": question.get("type"),
-        "required": question.get("required"),
-        "default": question.get("default", ""),
-        "hint": question.get("hint", ""),
+        "display": get("display", ""),
+        "type": get("type"),
+        "required": get("required"),
+        "default": get("default", ""),
+        "hint": get("hint", ""),
     }
 
 
@@ -47,18 +53,11 @@ def _parse_list_options(options_str: str) -> dict[str, str]:
 
     Example: ``"small=Small,medium=Medium,large=Large"``
     """
-    result: dict[str, str] = {}
-    for item in options_str.split(","):
-        item = item.strip()
-        if not item:
-            continue
-        if "=" not in item:
-            raise typer.BadParameter(
-                f"Invalid --list-options format: '{item}'. Expected key=value."
-            )
-        key, value = item.split("=", 1)
-        result[key.strip()] = value.strip()
-    return result
+    items = [item for item in (raw.strip() for raw in options_str.split(",")) if item]
+    bad = next((item for item in items if "=" not in item), None)
+    if bad is not None:
+        raise typer.BadParameter(f"Invalid --list-options format: '{bad}'. Expected key=value.")
+    return {key.strip(): value.strip() for key, _, value in (item.partition("=") for item in items)}
 
 
 def _resolve_recipe(vctx: Any, identifier: str) -> str:
@@ -70,6 +69,40 @@ def _resolve_recipe(vctx: Any, identifier: str) -> str:
     )
 
 
+def _resolve_question(vctx: Any, recipe: str, question: str) -> int:
+    """Resolve a question name or key within one recipe.
+
+    The question listing is filtered to the recipe server-side, which also
+    checks the recipe and keeps same-named questions in other recipes apart.
+    """
+    recipe_ref = f"vm_recipes/{_resolve_recipe(vctx, recipe)}"
+    return resolve_resource_id(
+        vctx.client.recipe_questions, question, "recipe question", scope={"recipe_ref": recipe_ref}
+    )
+
+
+def _resolve_section_under_recipe(vctx: Any, recipe: str, section: str) -> tuple[str, int]:
+    """Resolve a recipe and one of its sections.
+
+    This makes the same requests as resolving each on its own: a recipe
+    name needs one recipe lookup, a hex recipe key needs none, and the
+    section takes one listing. The section listing is filtered to the
+    recipe and the section name, so only matching rows come back and
+    same-named sections in other recipes are never considered.
+
+    Returns:
+        Tuple of (recipe key, section key).
+    """
+    recipe_key = _resolve_recipe(vctx, recipe)
+    section_key = resolve_resource_id(
+        vctx.client.recipe_sections,
+        section,
+        "recipe section",
+        scope={"recipe_ref": f"vm_recipes/{recipe_key}", "name": section},
+    )
+    return recipe_key, section_key
+
+
 @app.command("list")
 @handle_errors()
 def list_cmd(
@@ -79,25 +112,41 @@ def list_cmd(
         str | None,
         typer.Option("--section", help="Filter by section name or key."),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List questions for a recipe."""
     vctx = get_context(ctx)
-    recipe_key = _resolve_recipe(vctx, recipe)
-    recipe_ref = f"vm_recipes/{recipe_key}"
-    kwargs: dict[str, Any] = {"recipe_ref": recipe_ref}
-    if section is not None:
-        section_key = resolve_resource_id(vctx.client.recipe_sections, section, "recipe section")
-        kwargs["section"] = section_key
-    questions = vctx.client.recipe_questions.list(**kwargs)
-    data = [_question_to_dict(q) for q in questions]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_QUESTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    kwargs: dict[str, Any] = {}
+    if section is None:
+        recipe_key = _resolve_recipe(vctx, recipe)
+    else:
+        recipe_key, kwargs["section"] = _resolve_section_under_recipe(vctx, recipe, section)
+    kwargs["recipe_ref"] = f"vm_recipes/{recipe_key}"
+    questions = list_paged(
+        vctx.client.recipe_questions.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
     )
+    vctx.emit((_question_to_dict(q) for q in questions), columns=RECIPE_QUESTION_COLUMNS)
 
 
 @app.command("get")
@@ -109,17 +158,9 @@ def get_cmd(
 ) -> None:
     """Get a recipe question by name or key."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    question_key = resolve_resource_id(vctx.client.recipe_questions, question, "recipe question")
+    question_key = _resolve_question(vctx, recipe, question)
     item = vctx.client.recipe_questions.get(key=question_key)
-    output_result(
-        _question_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_QUESTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_question_to_dict(item), columns=RECIPE_QUESTION_COLUMNS)
 
 
 @app.command("create")
@@ -157,45 +198,33 @@ def create_cmd(
 ) -> None:
     """Create a new recipe question."""
     vctx = get_context(ctx)
-    recipe_key = _resolve_recipe(vctx, recipe)
-    recipe_ref = f"vm_recipes/{recipe_key}"
-    section_key = resolve_resource_id(vctx.client.recipe_sections, section, "recipe section")
-    kwargs: dict[str, Any] = {}
-    if display is not None:
-        kwargs["display"] = display
-    if hint is not None:
-        kwargs["hint"] = hint
-    if help_text is not None:
-        kwargs["help_text"] = help_text
-    if note is not None:
-        kwargs["note"] = note
-    if default is not None:
-        kwargs["default"] = default
+    recipe_key, section_key = _resolve_section_under_recipe(vctx, recipe, section)
+    kwargs: dict[str, Any] = {
+        k: v
+        for k, v in (
+            ("display", display),
+            ("hint", hint),
+            ("help_text", help_text),
+            ("note", note),
+            ("default", default),
+            ("min_value", min_value),
+            ("max_value", max_value),
+            ("regex", regex),
+        )
+        if v is not None
+    }
     kwargs["required"] = required
     kwargs["readonly"] = readonly
-    if min_value is not None:
-        kwargs["min_value"] = min_value
-    if max_value is not None:
-        kwargs["max_value"] = max_value
-    if regex is not None:
-        kwargs["regex"] = regex
     if list_options is not None:
         kwargs["list_options"] = _parse_list_options(list_options)
     result = vctx.client.recipe_questions.create(
         name=name,
-        recipe_ref=recipe_ref,
+        recipe_ref=f"vm_recipes/{recipe_key}",
         section=section_key,
         question_type=type,
         **kwargs,
     )
-    output_result(
-        _question_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_QUESTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_question_to_dict(result), columns=RECIPE_QUESTION_COLUMNS)
     output_success(f"Question '{name}' created.")
 
 
@@ -224,38 +253,25 @@ def update_cmd(
 ) -> None:
     """Update a recipe question."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    question_key = resolve_resource_id(vctx.client.recipe_questions, question, "recipe question")
-    kwargs: dict[str, Any] = {}
-    if display is not None:
-        kwargs["display"] = display
-    if hint is not None:
-        kwargs["hint"] = hint
-    if help_text is not None:
-        kwargs["help_text"] = help_text
-    if note is not None:
-        kwargs["note"] = note
-    if default is not None:
-        kwargs["default"] = default
-    if required is not None:
-        kwargs["required"] = required
-    if readonly is not None:
-        kwargs["readonly"] = readonly
-    if min_value is not None:
-        kwargs["min_value"] = min_value
-    if max_value is not None:
-        kwargs["max_value"] = max_value
-    if order is not None:
-        kwargs["orderid"] = order
+    question_key = _resolve_question(vctx, recipe, question)
+    kwargs: dict[str, Any] = {
+        k: v
+        for k, v in (
+            ("display", display),
+            ("hint", hint),
+            ("help_text", help_text),
+            ("note", note),
+            ("default", default),
+            ("required", required),
+            ("readonly", readonly),
+            ("min_value", min_value),
+            ("max_value", max_value),
+            ("orderid", order),
+        )
+        if v is not None
+    }
     result = vctx.client.recipe_questions.update(question_key, **kwargs)
-    output_result(
-        _question_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_QUESTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_question_to_dict(result), columns=RECIPE_QUESTION_COLUMNS)
     output_success(f"Question '{question}' updated.")
 
 
@@ -272,8 +288,7 @@ def delete_cmd(
 ) -> None:
     """Delete a recipe question."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    question_key = resolve_resource_id(vctx.client.recipe_questions, question, "recipe question")
+    question_key = _resolve_question(vctx, recipe, question)
     if not confirm_action(f"Delete question '{question}'?", yes=yes):
         raise typer.Abort()
     vctx.client.recipe_questions.delete(question_key)
@@ -9,8 +9,13 @@ import typer
 from verge_cli.columns import ColumnDef
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_nas_resource, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    list_paged,
+    resolve_nas_resource,
+    resolve_resource_id,
+)
 
 app = typer.Typer(
     name="section",
@@ -28,11 +33,12 @@ RECIPE_SECTION_COLUMNS: list[ColumnDef] = [
 
 def _section_to_dict(section: Any) -> dict[str, Any]:
     """Convert a RecipeSection SDK object to a dict for output."""
+    get = section.get
     return {
         "$key": int(section.key),
         "name": section.name,
-        "description": section.get("description", ""),
-        "orderid": section.get("orderid"),
+        "description": get("description", ""),
+        "orderid": get("orderid"),
     }
 
 
@@ -45,26 +51,54 @@ def _resolve_recipe(vctx: Any, identifier: str) -> str:
     )
 
 
+def _resolve_section(vctx: Any, recipe: str, section: str) -> int:
+    """Resolve a section name or key within one recipe.
+
+    The section listing is filtered to the recipe server-side, which also
+    checks the recipe and keeps same-named sections in other recipes apart.
+    """
+    recipe_ref = f"vm_recipes/{_resolve_recipe(vctx, recipe)}"
+    return resolve_resource_id(
+        vctx.client.recipe_sections, section, "recipe section", scope={"recipe_ref": recipe_ref}
+    )
+
+
 @app.command("list")
 @handle_errors()
 def list_cmd(
     ctx: typer.Context,
     recipe: Annotated[str, typer.Argument(help="Recipe name or key.")],
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List sections for a recipe."""
     vctx = get_context(ctx)
     recipe_key = _resolve_recipe(vctx, recipe)
     recipe_ref = f"vm_recipes/{recipe_key}"
-    sections = vctx.client.recipe_sections.list(recipe_ref=recipe_ref)
-    data = [_section_to_dict(s) for s in sections]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_SECTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    sections = list_paged(
+        vctx.client.recipe_sections.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        recipe_ref=recipe_ref,
     )
+    vctx.emit((_section_to_dict(s) for s in sections), columns=RECIPE_SECTION_COLUMNS)
 
 
 @app.command("get")
@@ -76,17 +110,9 @@ def get_cmd(
 ) -> None:
     """Get a recipe section by name or key."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    section_key = resolve_resource_id(vctx.client.recipe_sections, section, "recipe section")
+    section_key = _resolve_section(vctx, recipe, section)
     item = vctx.client.recipe_sections.get(key=section_key)
-    output_result(
-        _section_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_SECTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_section_to_dict(item), columns=RECIPE_SECTION_COLUMNS)
 
 
 @app.command("create")
@@ -112,14 +138,7 @@ def create_cmd(
         recipe_ref=recipe_ref,
         **kwargs,
     )
-    output_result(
-        _section_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_SECTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_section_to_dict(result), columns=RECIPE_SECTION_COLUMNS)
     output_success(f"Section '{name}' created.")
 
 
@@ -144,24 +163,14 @@ def update_cmd(
 ) -> None:
     """Update a recipe section."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    section_key = resolve_resource_id(vctx.client.recipe_sections, section, "recipe section")
-    kwargs: dict[str, Any] = {}
-    if name is not None:
-        kwargs["name"] = name
-    if description is not None:
-        kwargs["description"] = description
-    if order is not None:
-        kwargs["orderid"] = order
+    section_key = _resolve_section(vctx, recipe, section)
+    kwargs: dict[str, Any] = {
+        k: v
+        for k, v in (("name", name), ("description", description), ("orderid", order))
+        if v is not None
+    }
     result = vctx.client.recipe_sections.update(section_key, **kwargs)
-    output_result(
-        _section_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RECIPE_SECTION_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_section_to_dict(result), columns=RECIPE_SECTION_COLUMNS)
     output_success(f"Section '{section}' updated.")
 
 
@@ -178,8 +187,7 @@ def delete_cmd(
 ) -> None:
     """Delete a recipe section (cascades to questions)."""
     vctx = get_context(ctx)
-    _resolve_recipe(vctx, recipe)  # Validate recipe exists
-    section_key = resolve_resource_id(vctx.client.recipe_sections, section, "recipe section")
+    section_key = _resolve_section(vctx, recipe, section)
     if not confirm_action(
         f"Delete section '{section}'? This will also delete all questions in this section.", yes=yes
     ):
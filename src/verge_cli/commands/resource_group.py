@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Annotated, Any
 
 import typer
@@ -10,7 +12,7 @@ import typer
 from verge_cli.columns import BOOL_STYLES, ColumnDef, format_bool_yn, format_epoch
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_error, output_result, output_success
+from verge_cli.output import output_error, output_success
 from verge_cli.utils import confirm_action
 
 app = typer.Typer(
@@ -19,14 +21,18 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-# CLI device type -> SDK API value
-DEVICE_TYPE_MAP: dict[str, str] = {
-    "pci": "node_pci_devices",
-    "usb": "node_usb_devices",
-    "host-gpu": "node_host_gpu_devices",
-    "nvidia-vgpu": "node_nvidia_vgpu_devices",
-    "sriov-nic": "node_sriov_nic_devices",
-}
+# CLI device type -> SDK API value (read-only)
+DEVICE_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "pci": "node_pci_devices",
+        "usb": "node_usb_devices",
+        "host-gpu": "node_host_gpu_devices",
+        "nvidia-vgpu": "node_nvidia_vgpu_devices",
+        "sriov-nic": "node_sriov_nic_devices",
+    }
+)
+_VALID_DEVICE_TYPES = frozenset(DEVICE_TYPE_MAP)
+_DEVICE_TYPE_ERROR = "Invalid device type '{}'. Valid: " + ", ".join(sorted(DEVICE_TYPE_MAP))
 
 RESOURCE_GROUP_COLUMNS: list[ColumnDef] = [
     ColumnDef("$key", header="UUID"),
@@ -43,30 +49,34 @@ _UUID_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
     re.IGNORECASE,
 )
+_UUID_MATCH = _UUID_PATTERN.match
 
 
 def _group_to_dict(group: Any) -> dict[str, Any]:
     """Convert a ResourceGroup SDK object to a dict for output."""
+    # The SDK properties already return str/bool/int (never None), so only
+    # the key needs normalising.
     created_at = group.created_at
     return {
         "$key": str(group.key),
-        "name": str(group.name),
-        "device_type": str(group.device_type_display),
-        "device_class": str(group.device_class_display),
-        "enabled": bool(group.is_enabled),
-        "resource_count": int(group.resource_count),
-        "description": str(group.description),
+        "name": group.name,
+        "device_type": group.device_type_display,
+        "device_class": group.device_class_display,
+        "enabled": group.is_enabled,
+        "resource_count": group.resource_count,
+        "description": group.description,
         "created_at": created_at.timestamp() if created_at else None,
     }
 
 
-def _resolve_resource_group(client: Any, identifier: str) -> str:
+def _resolve_resource_group(groups: Any, identifier: str) -> str:
     """Resolve resource group identifier (UUID or name) to UUID key."""
-    if _UUID_PATTERN.match(identifier):
+    # Names almost never have the 36-char UUID shape; skip the regex for them.
+    if len(identifier) == 36 and identifier[8] == "-" and _UUID_MATCH(identifier):
         # Verify it exists by fetching it
-        group = client.resource_groups.get(identifier)
+        group = groups.get(identifier)
         return str(group.key)
-    group = client.resource_groups.get(name=identifier)
+    group = groups.get(name=identifier)
     return str(group.key)
 
 
@@ -99,37 +109,28 @@ def list_cmd(
 ) -> None:
     """List resource groups."""
     vctx = get_context(ctx)
+    rg = vctx.client.resource_groups
 
     if device_type is not None:
         # Validate device type
-        api_type = DEVICE_TYPE_MAP.get(device_type)
-        if api_type is None:
-            valid = ", ".join(sorted(DEVICE_TYPE_MAP.keys()))
-            output_error(f"Invalid device type '{device_type}'. Valid: {valid}")
+        if device_type not in _VALID_DEVICE_TYPES:
+            output_error(_DEVICE_TYPE_ERROR.format(device_type))
             raise typer.Exit(2)
-        groups = vctx.client.resource_groups.list_by_type(device_type=api_type, enabled=enabled)
+        api_type = DEVICE_TYPE_MAP[device_type]
+        groups = rg.list_by_type(device_type=api_type, enabled=enabled)
     elif device_class is not None:
-        groups = vctx.client.resource_groups.list_by_class(
-            device_class=device_class, enabled=enabled
-        )
+        groups = rg.list_by_class(device_class=device_class, enabled=enabled)
     elif enabled is True:
-        groups = vctx.client.resource_groups.list_enabled()
+        groups = rg.list_enabled()
     elif enabled is False:
-        groups = vctx.client.resource_groups.list_disabled()
+        groups = rg.list_disabled()
     else:
         kwargs: dict[str, Any] = {}
         if filter_expr is not None:
             kwargs["filter"] = filter_expr
-        groups = vctx.client.resource_groups.list(**kwargs)
-
-    output_result(
-        [_group_to_dict(g) for g in groups],
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RESOURCE_GROUP_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+        groups = rg.list(**kwargs)
+
+    vctx.emit((_group_to_dict(g) for g in groups), columns=RESOURCE_GROUP_COLUMNS)
 
 
 @app.command("get")
@@ -140,16 +141,118 @@ def get_cmd(
 ) -> None:
     """Get a resource group by UUID or name."""
     vctx = get_context(ctx)
-    uuid_key = _resolve_resource_group(vctx.client, group)
-    item = vctx.client.resource_groups.get(uuid_key)
-    output_result(
-        _group_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RESOURCE_GROUP_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    rg = vctx.client.resource_groups
+    uuid_key = _resolve_resource_group(rg, group)
+    item = rg.get(uuid_key)
+    vctx.emit(_group_to_dict(item), columns=RESOURCE_GROUP_COLUMNS)
+
+
+def _create_pci(
+    groups: Any,
+    *,
+    name: str,
+    description: str,
+    enabled: bool,
+    device_class: str | None,
+    **_: Any,
+) -> Any:
+    """Create a PCI passthrough resource group."""
+    kwargs: dict[str, Any] = {"name": name, "description": description, "enabled": enabled}
+    if device_class is not None:
+        kwargs["device_class"] = device_class
+    return groups.create_pci(**kwargs)
+
+
+def _create_usb(
+    groups: Any,
+    *,
+    name: str,
+    description: str,
+    enabled: bool,
+    device_class: str | None,
+    allow_guest_reset: bool | None,
+    **_: Any,
+) -> Any:
+    """Create a USB passthrough resource group."""
+    kwargs: dict[str, Any] = {"name": name, "description": description, "enabled": enabled}
+    if device_class is not None:
+        kwargs["device_class"] = device_class
+    if allow_guest_reset is not None:
+        kwargs["allow_guest_reset"] = allow_guest_reset
+    return groups.create_usb(**kwargs)
+
+
+def _create_host_gpu(
+    groups: Any,
+    *,
+    name: str,
+    description: str,
+    enabled: bool,
+    **_: Any,
+) -> Any:
+    """Create a host GPU passthrough resource group."""
+    return groups.create_host_gpu(name=name, description=description, enabled=enabled)
+
+
+def _create_nvidia_vgpu(
+    groups: Any,
+    *,
+    name: str,
+    description: str,
+    enabled: bool,
+    driver_file: int | None,
+    vgpu_profile: int | None,
+    make_guest_driver_iso: bool,
+    driver_iso: int | None,
+    **_: Any,
+) -> Any:
+    """Create an NVIDIA vGPU resource group; --driver-file is required."""
+    if driver_file is None:
+        output_error("--driver-file is required for nvidia-vgpu type.")
+        raise typer.Exit(2)
+    kwargs: dict[str, Any] = {
+        "name": name,
+        "driver_file": driver_file,
+        "description": description,
+        "enabled": enabled,
+    }
+    if vgpu_profile is not None:
+        kwargs["nvidia_vgpu_profile"] = vgpu_profile
+    if make_guest_driver_iso:
+        kwargs["make_guest_driver_iso"] = True
+    if driver_iso is not None:
+        kwargs["driver_iso"] = driver_iso
+    return groups.create_nvidia_vgpu(**kwargs)
+
+
+def _create_sriov_nic(
+    groups: Any,
+    *,
+    name: str,
+    description: str,
+    enabled: bool,
+    vf_count: int | None,
+    native_vlan: int | None,
+    **_: Any,
+) -> Any:
+    """Create an SR-IOV NIC resource group."""
+    kwargs: dict[str, Any] = {"name": name, "description": description, "enabled": enabled}
+    if vf_count is not None:
+        kwargs["vf_count"] = vf_count
+    if native_vlan is not None:
+        kwargs["native_vlan"] = native_vlan
+    return groups.create_sriov_nic(**kwargs)
+
+
+# CLI device type -> create handler; each takes every create option and
+# forwards only the ones its SDK method accepts.
+_CREATE_DISPATCH: dict[str, Callable[..., Any]] = {
+    "pci": _create_pci,
+    "usb": _create_usb,
+    "host-gpu": _create_host_gpu,
+    "nvidia-vgpu": _create_nvidia_vgpu,
+    "sriov-nic": _create_sriov_nic,
+}
 
 
 @app.command("create")
@@ -218,84 +321,26 @@ def create_cmd(
     vctx = get_context(ctx)
 
     # Validate device type
-    if device_type not in DEVICE_TYPE_MAP:
-        valid = ", ".join(sorted(DEVICE_TYPE_MAP.keys()))
-        output_error(f"Invalid device type '{device_type}'. Valid: {valid}")
+    if device_type not in _VALID_DEVICE_TYPES:
+        output_error(_DEVICE_TYPE_ERROR.format(device_type))
         raise typer.Exit(2)
 
-    enabled = not no_enabled
-
-    if device_type == "pci":
-        kwargs: dict[str, Any] = {
-            "name": name,
-            "description": description,
-            "enabled": enabled,
-        }
-        if device_class is not None:
-            kwargs["device_class"] = device_class
-        result = vctx.client.resource_groups.create_pci(**kwargs)
-
-    elif device_type == "usb":
-        usb_kwargs: dict[str, Any] = {
-            "name": name,
-            "description": description,
-            "enabled": enabled,
-        }
-        if device_class is not None:
-            usb_kwargs["device_class"] = device_class
-        if allow_guest_reset is not None:
-            usb_kwargs["allow_guest_reset"] = allow_guest_reset
-        result = vctx.client.resource_groups.create_usb(**usb_kwargs)
-
-    elif device_type == "host-gpu":
-        result = vctx.client.resource_groups.create_host_gpu(
-            name=name,
-            description=description,
-            enabled=enabled,
-        )
-
-    elif device_type == "nvidia-vgpu":
-        if driver_file is None:
-            output_error("--driver-file is required for nvidia-vgpu type.")
-            raise typer.Exit(2)
-        vgpu_kwargs: dict[str, Any] = {
-            "name": name,
-            "driver_file": driver_file,
-            "description": description,
-            "enabled": enabled,
-        }
-        if vgpu_profile is not None:
-            vgpu_kwargs["nvidia_vgpu_profile"] = vgpu_profile
-        if make_guest_driver_iso:
-            vgpu_kwargs["make_guest_driver_iso"] = True
-        if driver_iso is not None:
-            vgpu_kwargs["driver_iso"] = driver_iso
-        result = vctx.client.resource_groups.create_nvidia_vgpu(**vgpu_kwargs)
-
-    elif device_type == "sriov-nic":
-        sriov_kwargs: dict[str, Any] = {
-            "name": name,
-            "description": description,
-            "enabled": enabled,
-        }
-        if vf_count is not None:
-            sriov_kwargs["vf_count"] = vf_count
-        if native_vlan is not None:
-            sriov_kwargs["native_vlan"] = native_vlan
-        result = vctx.client.resource_groups.create_sriov_nic(**sriov_kwargs)
-
-    else:
-        # Should never reach here due to validation above
-        raise typer.Exit(2)
-
-    output_result(
-        _group_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RESOURCE_GROUP_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    result = _CREATE_DISPATCH[device_type](
+        vctx.client.resource_groups,
+        name=name,
+        description=description,
+        enabled=not no_enabled,
+        device_class=device_class,
+        allow_guest_reset=allow_guest_reset,
+        driver_file=driver_file,
+        vgpu_profile=vgpu_profile,
+        make_guest_driver_iso=make_guest_driver_iso,
+        driver_iso=driver_iso,
+        vf_count=vf_count,
+        native_vlan=native_vlan,
     )
+
+    vctx.emit(_group_to_dict(result), columns=RESOURCE_GROUP_COLUMNS)
     output_success(f"Resource group '{name}' created.", quiet=vctx.quiet)
 
 
@@ -319,29 +364,21 @@ def update_cmd(
 ) -> None:
     """Update a resource group."""
     vctx = get_context(ctx)
-    uuid_key = _resolve_resource_group(vctx.client, group)
+    rg = vctx.client.resource_groups
+    uuid_key = _resolve_resource_group(rg, group)
 
-    updates: dict[str, Any] = {}
-    if name is not None:
-        updates["name"] = name
-    if description is not None:
-        updates["description"] = description
-    if enabled is not None:
-        updates["enabled"] = enabled
+    updates: dict[str, Any] = {
+        k: v
+        for k, v in (("name", name), ("description", description), ("enabled", enabled))
+        if v is not None
+    }
 
     if not updates:
         output_error("No updates specified.")
         raise typer.Exit(2)
 
-    result = vctx.client.resource_groups.update(uuid_key, **updates)
-    output_result(
-        _group_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=RESOURCE_GROUP_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    result = rg.update(uuid_key, **updates)
+    vctx.emit(_group_to_dict(result), columns=RESOURCE_GROUP_COLUMNS)
     output_success(f"Resource group '{group}' updated.", quiet=vctx.quiet)
 
 
@@ -357,10 +394,11 @@ def delete_cmd(
 ) -> None:
     """Delete a resource group."""
     vctx = get_context(ctx)
-    uuid_key = _resolve_resource_group(vctx.client, group)
+    rg = vctx.client.resource_groups
+    uuid_key = _resolve_resource_group(rg, group)
 
     if not confirm_action(f"Delete resource group '{group}'?", yes=yes):
         raise typer.Abort()
 
-    vctx.client.resource_groups.delete(uuid_key)
+    rg.delete(uuid_key)
     output_success(f"Resource group '{group}' deleted.", quiet=vctx.quiet)
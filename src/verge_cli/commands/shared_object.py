@@ -9,8 +9,14 @@ import typer
 from verge_cli.columns import SHARED_OBJECT_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    fetch_resource,
+    forget_resolved,
+    list_paged,
+    resolve_named_resource_ids,
+)
 
 app = typer.Typer(
     name="shared-object",
@@ -21,15 +27,17 @@ app = typer.Typer(
 
 def _shared_object_to_dict(obj: Any) -> dict[str, Any]:
     """Convert a SharedObject SDK object to a dict for output."""
+    # SharedObject exposes every field as a property (several map renamed
+    # API fields such as recipient -> tenant_key), so read those directly.
     return {
         "$key": obj.key,
-        "name": getattr(obj, "name", obj.get("name", "")),
-        "description": getattr(obj, "description", obj.get("description", "")),
-        "tenant_key": getattr(obj, "tenant_key", obj.get("tenant_key")),
-        "tenant_name": getattr(obj, "tenant_name", obj.get("tenant_name", "")),
-        "object_type": getattr(obj, "object_type", obj.get("object_type", "")),
-        "object_id": getattr(obj, "object_id", obj.get("object_id", "")),
-        "is_inbox": getattr(obj, "is_inbox", obj.get("is_inbox", False)),
+        "name": obj.name,
+        "description": obj.description,
+        "tenant_key": obj.tenant_key,
+        "tenant_name": obj.tenant_name,
+        "object_type": obj.object_type,
+        "object_id": obj.object_id,
+        "is_inbox": obj.is_inbox,
     }
 
 
@@ -45,6 +53,28 @@ def list_cmd(
         bool,
         typer.Option("--inbox", help="Show only inbox (received) objects"),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List shared objects."""
     vctx = get_context(ctx)
@@ -54,35 +84,31 @@ def list_cmd(
     if inbox:
         kwargs["inbox_only"] = True
 
-    objects = vctx.client.shared_objects.list(**kwargs)
-    data = [_shared_object_to_dict(o) for o in objects]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SHARED_OBJECT_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    objects = list_paged(
+        vctx.client.shared_objects.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
     )
+    vctx.emit((_shared_object_to_dict(o) for o in objects), columns=SHARED_OBJECT_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def get_cmd(
     ctx: typer.Context,
-    shared_object: Annotated[str, typer.Argument(help="Shared object name or key")],
+    shared_object: Annotated[
+        str, typer.Argument(help="Shared object name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """Get details of a shared object."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.shared_objects, shared_object, "Shared object")
-    obj = vctx.client.shared_objects.get(key)
-    output_result(
-        _shared_object_to_dict(obj),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    obj = fetch_resource(vctx.client.shared_objects, shared_object, "Shared object")
+    vctx.emit(_shared_object_to_dict(obj))
 
 
 @app.command("create")
@@ -125,42 +151,63 @@ def create_cmd(
 @handle_errors()
 def import_cmd(
     ctx: typer.Context,
-    shared_object: Annotated[str, typer.Argument(help="Shared object name or key")],
+    shared_objects: Annotated[
+        list[str],
+        typer.Argument(help="Shared object names or keys (key:N skips the name lookup)"),
+    ],
 ) -> None:
-    """Import (receive) a shared object."""
+    """Import (receive) one or more shared objects."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.shared_objects, shared_object, "Shared object")
-    vctx.client.shared_objects.import_object(key)
-    output_success(f"Imported shared object '{shared_object}'", quiet=vctx.quiet)
+    objects = vctx.client.shared_objects
+    keys = resolve_named_resource_ids(objects, shared_objects, "Shared object")
+    for shared_object, key in zip(shared_objects, keys, strict=True):
+        objects.import_object(key)
+        output_success(f"Imported shared object '{shared_object}'", quiet=vctx.quiet)
 
 
 @app.command("refresh")
 @handle_errors()
 def refresh_cmd(
     ctx: typer.Context,
-    shared_object: Annotated[str, typer.Argument(help="Shared object name or key")],
+    shared_objects: Annotated[
+        list[str],
+        typer.Argument(help="Shared object names or keys (key:N skips the name lookup)"),
+    ],
 ) -> None:
-    """Refresh a shared object."""
+    """Refresh one or more shared objects."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.shared_objects, shared_object, "Shared object")
-    vctx.client.shared_objects.refresh_object(key)
-    output_success(f"Refreshed shared object '{shared_object}'", quiet=vctx.quiet)
+    objects = vctx.client.shared_objects
+    keys = resolve_named_resource_ids(objects, shared_objects, "Shared object")
+    for shared_object, key in zip(shared_objects, keys, strict=True):
+        objects.refresh_object(key)
+        output_success(f"Refreshed shared object '{shared_object}'", quiet=vctx.quiet)
 
 
 @app.command("delete")
 @handle_errors()
 def delete_cmd(
     ctx: typer.Context,
-    shared_object: Annotated[str, typer.Argument(help="Shared object name or key")],
+    shared_objects: Annotated[
+        list[str],
+        typer.Argument(help="Shared object names or keys (key:N skips the name lookup)"),
+    ],
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
-    """Delete a shared object."""
+    """Delete one or more shared objects."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.shared_objects, shared_object, "Shared object")
+    objects = vctx.client.shared_objects
+    keys = resolve_named_resource_ids(objects, shared_objects, "Shared object")
 
-    if not confirm_action(f"Delete shared object '{shared_object}'?", yes=yes):
+    prompt = (
+        f"Delete shared object '{shared_objects[0]}'?"
+        if len(shared_objects) == 1
+        else f"Delete {len(shared_objects)} shared objects ({', '.join(shared_objects)})?"
+    )
+    if not confirm_action(prompt, yes=yes):
         typer.echo("Cancelled.")
         raise typer.Exit(0)
 
-    vctx.client.shared_objects.delete(key)
-    output_success(f"Deleted shared object '{shared_object}'", quiet=vctx.quiet)
+    for shared_object, key in zip(shared_objects, keys, strict=True):
+        objects.delete(key)
+        output_success(f"Deleted shared object '{shared_object}'", quiet=vctx.quiet)
+    forget_resolved(objects)
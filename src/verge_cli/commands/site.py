@@ -8,35 +8,44 @@ import click
 import typer
 
 from verge_cli.columns import SITE_COLUMNS
-from verge_cli.commands import site_sync
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.lazy import lazy_group
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    fetch_resource,
+    forget_resolved,
+    list_paged,
+    resolve_named_resource_id,
+    resolve_named_resource_ids,
+)
 
+# The sync sub-app (and its outgoing/incoming/schedule groups) is imported
+# only when "site sync" is dispatched.
 app = typer.Typer(
     name="site",
     help="Manage remote sites.",
     no_args_is_help=True,
+    cls=lazy_group({"sync": "verge_cli.commands.site_sync:app"}),
 )
 
-app.add_typer(site_sync.app, name="sync")
-
 
 def _site_to_dict(site: Any) -> dict[str, Any]:
     """Convert a Site SDK object to a dict for output."""
+    get = site.get
     return {
         "$key": site.key,
         "name": site.name,
-        "url": site.get("url"),
-        "status": site.get("status"),
-        "enabled": site.get("enabled"),
-        "authentication_status": site.get("authentication_status"),
-        "config_cloud_snapshots": site.get("config_cloud_snapshots"),
-        "description": site.get("description", ""),
-        "domain": site.get("domain"),
-        "city": site.get("city"),
-        "country": site.get("country"),
+        "url": get("url"),
+        "status": get("status"),
+        "enabled": get("enabled"),
+        "authentication_status": get("authentication_status"),
+        "config_cloud_snapshots": get("config_cloud_snapshots"),
+        "description": get("description", ""),
+        "domain": get("domain"),
+        "city": get("city"),
+        "country": get("country"),
     }
 
 
@@ -55,6 +64,28 @@ def list_cmd(
             help="Filter by enabled state",
         ),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List all registered sites."""
     vctx = get_context(ctx)
@@ -63,35 +94,29 @@ def list_cmd(
         kwargs["status"] = status
     if enabled is not None:
         kwargs["enabled"] = enabled
-    sites = vctx.client.sites.list(**kwargs)
-    data = [_site_to_dict(s) for s in sites]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SITE_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    sites = list_paged(
+        vctx.client.sites.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
     )
+    vctx.emit((_site_to_dict(s) for s in sites), columns=SITE_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def get_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    site: Annotated[str, typer.Argument(help="Site name or key (key:N skips the name lookup)")],
 ) -> None:
     """Get details of a site."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
-    item = vctx.client.sites.get(key)
-    output_result(
-        _site_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    item = fetch_resource(vctx.client.sites, site, "Site")
+    vctx.emit(_site_to_dict(item))
 
 
 @app.command("create")
@@ -149,7 +174,7 @@ def create_cmd(
 @handle_errors()
 def update_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    site: Annotated[str, typer.Argument(help="Site name or key (key:N skips the name lookup)")],
     name: Annotated[str | None, typer.Option("--name", "-n", help="New site name")] = None,
     description: Annotated[
         str | None, typer.Option("--description", "-d", help="Site description")
@@ -165,7 +190,7 @@ def update_cmd(
 ) -> None:
     """Update a site's settings."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
+    key = resolve_named_resource_id(vctx.client.sites, site, "Site")
 
     kwargs: dict[str, Any] = {}
     if name is not None:
@@ -176,6 +201,8 @@ def update_cmd(
         kwargs["config_cloud_snapshots"] = cloud_snapshots
 
     vctx.client.sites.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.sites)
     output_success(f"Updated site '{site}'", quiet=vctx.quiet)
 
 
@@ -183,58 +210,76 @@ def update_cmd(
 @handle_errors()
 def delete_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    sites: Annotated[
+        list[str],
+        typer.Argument(help="Site names or keys (key:N skips the name lookup)"),
+    ],
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
-    """Delete a site."""
+    """Delete one or more sites."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
+    keys = resolve_named_resource_ids(vctx.client.sites, sites, "Site")
 
-    if not confirm_action(f"Delete site '{site}'?", yes=yes):
+    prompt = (
+        f"Delete site '{sites[0]}'?"
+        if len(sites) == 1
+        else f"Delete {len(sites)} sites ({', '.join(sites)})?"
+    )
+    if not confirm_action(prompt, yes=yes):
         typer.echo("Cancelled.")
         raise typer.Exit(0)
 
-    vctx.client.sites.delete(key)
-    output_success(f"Deleted site '{site}'", quiet=vctx.quiet)
+    for site, key in zip(sites, keys, strict=True):
+        vctx.client.sites.delete(key)
+        output_success(f"Deleted site '{site}'", quiet=vctx.quiet)
+    forget_resolved(vctx.client.sites)
 
 
 @app.command("enable")
 @handle_errors()
 def enable_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    sites: Annotated[
+        list[str],
+        typer.Argument(help="Site names or keys (key:N skips the name lookup)"),
+    ],
 ) -> None:
-    """Enable a disabled site."""
+    """Enable one or more disabled sites."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
-    vctx.client.sites.enable(key)
-    output_success(f"Enabled site '{site}'", quiet=vctx.quiet)
+    keys = resolve_named_resource_ids(vctx.client.sites, sites, "Site")
+    for site, key in zip(sites, keys, strict=True):
+        vctx.client.sites.enable(key)
+        output_success(f"Enabled site '{site}'", quiet=vctx.quiet)
 
 
 @app.command("disable")
 @handle_errors()
 def disable_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    sites: Annotated[
+        list[str],
+        typer.Argument(help="Site names or keys (key:N skips the name lookup)"),
+    ],
 ) -> None:
-    """Disable a site without deleting it."""
+    """Disable one or more sites without deleting them."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
-    vctx.client.sites.disable(key)
-    output_success(f"Disabled site '{site}'", quiet=vctx.quiet)
+    keys = resolve_named_resource_ids(vctx.client.sites, sites, "Site")
+    for site, key in zip(sites, keys, strict=True):
+        vctx.client.sites.disable(key)
+        output_success(f"Disabled site '{site}'", quiet=vctx.quiet)
 
 
 @app.command("reauth")
 @handle_errors()
 def reauth_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    site: Annotated[str, typer.Argument(help="Site name or key (key:N skips the name lookup)")],
     username: Annotated[str, typer.Option("--username", help="New username")],
     password: Annotated[str, typer.Option("--password", help="New password")],
 ) -> None:
     """Re-authenticate with updated credentials."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
+    key = resolve_named_resource_id(vctx.client.sites, site, "Site")
     vctx.client.sites.reauthenticate(key, username, password)
     output_success(f"Re-authenticated site '{site}'", quiet=vctx.quiet)
 
@@ -243,10 +288,10 @@ def reauth_cmd(
 @handle_errors()
 def refresh_cmd(
     ctx: typer.Context,
-    site: Annotated[str, typer.Argument(help="Site name or key")],
+    site: Annotated[str, typer.Argument(help="Site name or key (key:N skips the name lookup)")],
 ) -> None:
     """Refresh site connection and metadata."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.sites, site, "Site")
+    key = resolve_named_resource_id(vctx.client.sites, site, "Site")
     vctx.client.sites.refresh_site(key)
     output_success(f"Refreshed site '{site}'", quiet=vctx.quiet)
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import typer
 
-from verge_cli.commands import site_sync_incoming, site_sync_outgoing, site_sync_schedule
+from verge_cli.lazy import lazy_group
 
+# Sub-apps are imported only when their sub-command is dispatched.
 app = typer.Typer(
     name="sync",
     help="Manage site synchronization.",
     no_args_is_help=True,
+    cls=lazy_group(
+        {
+            "outgoing": "verge_cli.commands.site_sync_outgoing:app",
+            "incoming": "verge_cli.commands.site_sync_incoming:app",
+            "schedule": "verge_cli.commands.site_sync_schedule:app",
+        }
+    ),
 )
-
-app.add_typer(site_sync_outgoing.app, name="outgoing")
-app.add_typer(site_sync_incoming.app, name="incoming")
-app.add_typer(site_sync_schedule.app, name="schedule")
@@ -9,8 +9,8 @@ import typer
 from verge_cli.columns import SITE_SYNC_SCHEDULE_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action
+from verge_cli.output import output_success
+from verge_cli.utils import confirm_action, key_or_name_filter, list_paged
 
 app = typer.Typer(
     name="schedule",
@@ -21,16 +21,17 @@ app = typer.Typer(
 
 def _schedule_to_dict(schedule: Any) -> dict[str, Any]:
     """Convert a SiteSyncSchedule SDK object to a dict for output."""
+    get = schedule.get
     return {
         "$key": schedule.key,
-        "sync_key": schedule.get("sync_key"),
-        "sync_name": schedule.get("sync_name", ""),
-        "profile_period_key": schedule.get("profile_period_key"),
-        "profile_period_name": schedule.get("profile_period_name", ""),
-        "retention": schedule.get("retention"),
-        "priority": schedule.get("priority"),
-        "do_not_expire": schedule.get("do_not_expire", False),
-        "destination_prefix": schedule.get("destination_prefix", "remote"),
+        "sync_key": get("sync_key"),
+        "sync_name": get("sync_name", ""),
+        "profile_period_key": get("profile_period_key"),
+        "profile_period_name": get("profile_period_name", ""),
+        "retention": get("retention"),
+        "priority": get("priority"),
+        "do_not_expire": get("do_not_expire", False),
+        "destination_prefix": get("destination_prefix", "remote"),
     }
 
 
@@ -42,27 +43,47 @@ def list_cmd(
         str | None,
         typer.Option("--sync", "-s", help="Filter by sync key"),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List site sync schedules."""
     vctx = get_context(ctx)
     kwargs: dict[str, Any] = {}
 
     if sync is not None:
-        if sync.isdigit():
-            kwargs["sync_key"] = int(sync)
-        else:
-            kwargs["sync_name"] = sync
-
-    schedules = vctx.client.site_sync_schedules.list(**kwargs)
-    data = [_schedule_to_dict(s) for s in schedules]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SITE_SYNC_SCHEDULE_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+        kwargs.update(key_or_name_filter(sync, "sync_key", "sync_name"))
+
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    schedules = list_paged(
+        vctx.client.site_sync_schedules.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
     )
+    vctx.emit((_schedule_to_dict(s) for s in schedules), columns=SITE_SYNC_SCHEDULE_COLUMNS)
 
 
 @app.command("get")
@@ -74,13 +95,7 @@ def get_cmd(
     """Get details of a site sync schedule."""
     vctx = get_context(ctx)
     schedule = vctx.client.site_sync_schedules.get(schedule_id)
-    output_result(
-        _schedule_to_dict(schedule),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_schedule_to_dict(schedule))
 
 
 @app.command("create")
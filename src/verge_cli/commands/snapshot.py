@@ -11,50 +11,48 @@ from verge_cli.columns import (
     CLOUD_SNAPSHOT_TENANT_COLUMNS,
     CLOUD_SNAPSHOT_VM_COLUMNS,
 )
-from verge_cli.commands import snapshot_profile
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.lazy import lazy_group
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    fetch_resource,
+    list_paged,
+    resolve_named_resource_id,
+)
 
+# The profile sub-app (and its period group) is imported only when
+# "snapshot profile" is dispatched.
 app = typer.Typer(
     name="snapshot",
     help="Manage cloud snapshots.",
     no_args_is_help=True,
+    cls=lazy_group({"profile": "verge_cli.commands.snapshot_profile:app"}),
 )
 
-app.add_typer(snapshot_profile.app, name="profile")
-
 
 def _snapshot_to_dict(snap: Any) -> dict[str, Any]:
     """Convert a CloudSnapshot object to a dict for output."""
+    get = snap.get
     return {
         "$key": snap.key,
         "name": snap.name,
-        "status": snap.get("status"),
-        "created": snap.get("created"),
-        "expires": snap.get("expires"),
-        "immutable": snap.get("immutable"),
-        "private": snap.get("private"),
-        "description": snap.get("description", ""),
+        "status": get("status"),
+        "created": get("created"),
+        "expires": get("expires"),
+        "immutable": get("immutable"),
+        "private": get("private"),
+        "description": get("description", ""),
     }
 
 
-def _vm_to_dict(vm: Any) -> dict[str, Any]:
-    """Convert a CloudSnapshotVM object to a dict for output."""
+def _member_to_dict(member: Any) -> dict[str, Any]:
+    """Convert a CloudSnapshotVM or CloudSnapshotTenant object to a dict for output."""
     return {
-        "$key": vm.key,
-        "name": vm.name,
-        "status": vm.get("status"),
-    }
-
-
-def _tenant_to_dict(tenant: Any) -> dict[str, Any]:
-    """Convert a CloudSnapshotTenant object to a dict for output."""
-    return {
-        "$key": tenant.key,
-        "name": tenant.name,
-        "status": tenant.get("status"),
+        "$key": member.key,
+        "name": member.name,
+        "status": member.get("status"),
     }
 
 
@@ -66,38 +64,57 @@ def list_cmd(
         bool,
         typer.Option("--include-expired", help="Include expired snapshots"),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", min=1, help="Maximum number of results."),
+    ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option("--page-size", min=1, help="Fetch results in pages of this size."),
+    ] = None,
+    continuation: Annotated[
+        str | None,
+        typer.Option(
+            "--continuation",
+            help=(
+                "Resume from a token printed by a paged list. Tokens hold a row offset, so rows "
+                "added or removed meanwhile can be skipped or repeated."
+            ),
+        ),
+    ] = None,
+    all_pages: Annotated[
+        bool,
+        typer.Option("--all", help="Fetch every page instead of stopping after one."),
+    ] = False,
 ) -> None:
     """List all cloud snapshots."""
     vctx = get_context(ctx)
-    snapshots = vctx.client.cloud_snapshots.list(include_expired=include_expired)
-    data = [_snapshot_to_dict(s) for s in snapshots]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=CLOUD_SNAPSHOT_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    kwargs: dict[str, Any] = {"include_expired": include_expired}
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    snapshots = list_paged(
+        vctx.client.cloud_snapshots.list,
+        page_size=page_size,
+        continuation=continuation,
+        all_pages=all_pages,
+        **kwargs,
     )
+    vctx.emit((_snapshot_to_dict(s) for s in snapshots), columns=CLOUD_SNAPSHOT_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def get_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """Get details of a cloud snapshot."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
-    snap = vctx.client.cloud_snapshots.get(key)
-    output_result(
-        _snapshot_to_dict(snap),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    snap = fetch_resource(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    vctx.emit(_snapshot_to_dict(snap))
 
 
 @app.command("create")
@@ -162,12 +179,14 @@ def create_cmd(
 @handle_errors()
 def delete_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
     """Delete a cloud snapshot."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    key = resolve_named_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
 
     if not confirm_action(f"Delete cloud snapshot '{snapshot}'?", yes=yes):
         typer.echo("Cancelled.")
@@ -181,49 +200,39 @@ def delete_cmd(
 @handle_errors()
 def vms_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """List VMs captured in a cloud snapshot."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    key = resolve_named_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
     vms = vctx.client.cloud_snapshots.vms(key).list()
-    data = [_vm_to_dict(v) for v in vms]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=CLOUD_SNAPSHOT_VM_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_member_to_dict(v) for v in vms), columns=CLOUD_SNAPSHOT_VM_COLUMNS)
 
 
 @app.command("tenants")
 @handle_errors()
 def tenants_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """List tenants captured in a cloud snapshot."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    key = resolve_named_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
     tenants = vctx.client.cloud_snapshots.tenants(key).list()
-    data = [_tenant_to_dict(t) for t in tenants]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=CLOUD_SNAPSHOT_TENANT_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_member_to_dict(t) for t in tenants), columns=CLOUD_SNAPSHOT_TENANT_COLUMNS)
 
 
 @app.command("restore-vm")
 @handle_errors()
 def restore_vm_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
     vm: Annotated[str, typer.Option("--vm", help="VM name or key to restore")],
     new_name: Annotated[
         str | None,
@@ -232,7 +241,7 @@ def restore_vm_cmd(
 ) -> None:
     """Restore a VM from a cloud snapshot."""
     vctx = get_context(ctx)
-    snap_key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    snap_key = resolve_named_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
 
     # Resolve VM within the snapshot
     kwargs: dict[str, Any] = {"snapshot_key": snap_key}
@@ -245,20 +254,16 @@ def restore_vm_cmd(
 
     result = vctx.client.cloud_snapshots.restore_vm(**kwargs)
     output_success(f"Restored VM '{vm}' from snapshot '{snapshot}'", quiet=vctx.quiet)
-    output_result(
-        result,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(result)
 
 
 @app.command("restore-tenant")
 @handle_errors()
 def restore_tenant_cmd(
     ctx: typer.Context,
-    snapshot: Annotated[str, typer.Argument(help="Snapshot name or key")],
+    snapshot: Annotated[
+        str, typer.Argument(help="Snapshot name or key (key:N skips the name lookup)")
+    ],
     tenant: Annotated[str, typer.Option("--tenant", help="Tenant name or key to restore")],
     new_name: Annotated[
         str | None,
@@ -267,7 +272,7 @@ def restore_tenant_cmd(
 ) -> None:
     """Restore a tenant from a cloud snapshot."""
     vctx = get_context(ctx)
-    snap_key = resolve_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
+    snap_key = resolve_named_resource_id(vctx.client.cloud_snapshots, snapshot, "Cloud snapshot")
 
     kwargs: dict[str, Any] = {"snapshot_key": snap_key}
     if tenant.isdigit():
@@ -279,10 +284,4 @@ def restore_tenant_cmd(
 
     result = vctx.client.cloud_snapshots.restore_tenant(**kwargs)
     output_success(f"Restored tenant '{tenant}' from snapshot '{snapshot}'", quiet=vctx.quiet)
-    output_result(
-        result,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(result)
@@ -7,20 +7,24 @@ from typing import Annotated, Any
 import typer
 
 from verge_cli.columns import SNAPSHOT_PROFILE_COLUMNS
-from verge_cli.commands import snapshot_profile_period
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.lazy import lazy_group
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    fetch_resource,
+    forget_resolved,
+    resolve_named_resource_id,
+)
 
 app = typer.Typer(
     name="profile",
     help="Manage snapshot profiles.",
     no_args_is_help=True,
+    cls=lazy_group({"period": "verge_cli.commands.snapshot_profile_period:app"}),
 )
 
-app.add_typer(snapshot_profile_period.app, name="period")
-
 
 def _profile_to_dict(profile: Any) -> dict[str, Any]:
     """Convert a SnapshotProfile object to a dict for output."""
@@ -37,34 +41,21 @@ def profile_list(ctx: typer.Context) -> None:
     """List all snapshot profiles."""
     vctx = get_context(ctx)
     profiles = vctx.client.snapshot_profiles.list()
-    data = [_profile_to_dict(p) for p in profiles]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SNAPSHOT_PROFILE_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_profile_to_dict(p) for p in profiles), columns=SNAPSHOT_PROFILE_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def profile_get(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """Get details of a snapshot profile."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.snapshot_profiles, profile, "Snapshot profile")
-    profile_obj = vctx.client.snapshot_profiles.get(key)
-    output_result(
-        _profile_to_dict(profile_obj),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    profile_obj = fetch_resource(vctx.client.snapshot_profiles, profile, "Snapshot profile")
+    vctx.emit(_profile_to_dict(profile_obj))
 
 
 @app.command("create")
@@ -98,7 +89,9 @@ def profile_create(
 @handle_errors()
 def profile_update(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     name: Annotated[str | None, typer.Option("--name", "-n", help="New profile name")] = None,
     description: Annotated[
         str | None,
@@ -107,7 +100,7 @@ def profile_update(
 ) -> None:
     """Update a snapshot profile."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.snapshot_profiles, profile, "Snapshot profile")
+    key = resolve_named_resource_id(vctx.client.snapshot_profiles, profile, "Snapshot profile")
 
     kwargs: dict[str, Any] = {}
     if name is not None:
@@ -120,6 +113,8 @@ def profile_update(
         raise typer.Exit(2)
 
     vctx.client.snapshot_profiles.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.snapshot_profiles)
     output_success(f"Updated snapshot profile '{profile}'", quiet=vctx.quiet)
 
 
@@ -127,16 +122,19 @@ def profile_update(
 @handle_errors()
 def profile_delete(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
     """Delete a snapshot profile."""
     vctx = get_context(ctx)
-    key = resolve_resource_id(vctx.client.snapshot_profiles, profile, "Snapshot profile")
+    key = resolve_named_resource_id(vctx.client.snapshot_profiles, profile, "Snapshot profile")
 
     if not confirm_action(f"Delete snapshot profile '{profile}'?", yes=yes):
         typer.echo("Cancelled.")
         raise typer.Exit(0)
 
     vctx.client.snapshot_profiles.delete(key)
+    forget_resolved(vctx.client.snapshot_profiles)
     output_success(f"Deleted snapshot profile '{profile}'", quiet=vctx.quiet)
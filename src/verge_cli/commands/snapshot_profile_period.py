@@ -9,8 +9,8 @@ import typer
 from verge_cli.columns import SNAPSHOT_PROFILE_PERIOD_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import confirm_action, resolve_named_resource_id
 
 app = typer.Typer(
     name="period",
@@ -22,45 +22,51 @@ app = typer.Typer(
 def _get_profile(ctx: typer.Context, profile_identifier: str) -> tuple[Any, int]:
     """Resolve profile and return (vctx, profile_key)."""
     vctx = get_context(ctx)
-    profile_key = resolve_resource_id(
+    profile_key = resolve_named_resource_id(
         vctx.client.snapshot_profiles, profile_identifier, "Snapshot profile"
     )
     return vctx, profile_key
 
 
-def _resolve_period(period_mgr: Any, identifier: str) -> int:
-    """Resolve a period name or key to an integer key."""
-    if identifier.isdigit():
-        return int(identifier)
-    periods = period_mgr.list()
-    matches = [p for p in periods if p.name == identifier]
+def _find_period(period_mgr: Any, name: str) -> Any:
+    """Return the period with this name, listing only periods so named."""
+    # The name filter may treat '*' as a wildcard, so re-check exact names.
+    matches = [p for p in period_mgr.list(name=name) if p.name == name]
     if len(matches) == 1:
-        return int(matches[0].key)
+        return matches[0]
     if len(matches) > 1:
         typer.echo(
-            f"Error: Multiple periods match '{identifier}'. Use a numeric key.",
+            f"Error: Multiple periods match '{name}'. Use a numeric key.",
             err=True,
         )
         raise typer.Exit(7)
-    typer.echo(f"Error: Period '{identifier}' not found.", err=True)
+    typer.echo(f"Error: Period '{name}' not found.", err=True)
     raise typer.Exit(6)
 
 
+def _resolve_period(period_mgr: Any, identifier: str) -> int:
+    """Resolve a period name or key to an integer key."""
+    if identifier.isdigit():
+        return int(identifier)
+    return int(_find_period(period_mgr, identifier).key)
+
+
 def _period_to_dict(period: Any) -> dict[str, Any]:
     """Convert a SnapshotProfilePeriod object to a dict for output."""
+    get = period.get
     return {
         "$key": period.key,
         "name": period.name,
-        "frequency": period.get("frequency"),
-        "retention": period.get("retention"),
-        "min_snapshots": period.get("min_snapshots"),
-        "max_tier": period.get("max_tier"),
-        "minute": period.get("minute"),
-        "hour": period.get("hour"),
-        "day_of_week": period.get("day_of_week", "any"),
-        "quiesce": period.get("quiesce", False),
-        "immutable": period.get("immutable", False),
-        "skip_missed": period.get("skip_missed", False),
+        "frequency": get("frequency"),
+        "retention": get("retention"),
+        "min_snapshots": get("min_snapshots"),
+        "max_tier": get("max_tier"),
+        "minute": get("minute"),
+        "hour": get("hour"),
+        "day_of_week": get("day_of_week", "any"),
+        "quiesce": get("quiesce", False),
+        "immutable": get("immutable", False),
+        "skip_missed": get("skip_missed", False),
     }
 
 
@@ -68,48 +74,41 @@ def _period_to_dict(period: Any) -> dict[str, Any]:
 @handle_errors()
 def period_list(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
 ) -> None:
     """List periods for a snapshot profile."""
     vctx, profile_key = _get_profile(ctx, profile)
     periods = vctx.client.snapshot_profiles.periods(profile_key).list()
-    data = [_period_to_dict(p) for p in periods]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SNAPSHOT_PROFILE_PERIOD_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_period_to_dict(p) for p in periods), columns=SNAPSHOT_PROFILE_PERIOD_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def period_get(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     period: Annotated[str, typer.Argument(help="Period name or key")],
 ) -> None:
     """Get details of a snapshot profile period."""
     vctx, profile_key = _get_profile(ctx, profile)
     period_mgr = vctx.client.snapshot_profiles.periods(profile_key)
-    period_key = _resolve_period(period_mgr, period)
-    period_obj = period_mgr.get(period_key)
-    output_result(
-        _period_to_dict(period_obj),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    period_obj = (
+        period_mgr.get(int(period)) if period.isdigit() else _find_period(period_mgr, period)
     )
+    vctx.emit(_period_to_dict(period_obj))
 
 
 @app.command("create")
 @handle_errors()
 def period_create(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     name: Annotated[str, typer.Option("--name", "-n", help="Period name")],
     frequency: Annotated[
         str,
@@ -184,7 +183,9 @@ def period_create(
 @handle_errors()
 def period_update(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     period: Annotated[str, typer.Argument(help="Period name or key")],
     name: Annotated[str | None, typer.Option("--name", "-n", help="New period name")] = None,
     frequency: Annotated[
@@ -271,7 +272,9 @@ def period_update(
 @handle_errors()
 def period_delete(
     ctx: typer.Context,
-    profile: Annotated[str, typer.Argument(help="Profile name or key")],
+    profile: Annotated[
+        str, typer.Argument(help="Profile name or key (key:N skips the name lookup)")
+    ],
     period: Annotated[str, typer.Argument(help="Period name or key")],
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
 ) -> None:
@@ -9,7 +9,6 @@ import typer
 from verge_cli.columns import STORAGE_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result
 from verge_cli.utils import resolve_resource_id
 
 app = typer.Typer(
@@ -49,16 +48,8 @@ def storage_list(
     vctx = get_context(ctx)
 
     tiers = vctx.client.storage_tiers.list()
-    data = [_tier_to_dict(t) for t in tiers]
 
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=STORAGE_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_tier_to_dict(t) for t in tiers), columns=STORAGE_COLUMNS)
 
 
 @app.command("get")
@@ -78,13 +69,7 @@ def storage_get(
         key = resolve_resource_id(vctx.client.storage_tiers, tier, "Storage tier")
         tier_obj = vctx.client.storage_tiers.get(key)
 
-    output_result(
-        _tier_to_dict(tier_obj),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_tier_to_dict(tier_obj))
 
 
 @app.command("summary")
@@ -95,18 +80,5 @@ def storage_summary(
     """Show aggregate storage summary across all tiers."""
     vctx = get_context(ctx)
 
-    summary = vctx.client.storage_tiers.get_summary()
-
-    # Summary returns a dict or dict-like object
-    if isinstance(summary, dict):
-        data = summary
-    else:
-        data = dict(summary) if hasattr(summary, "__iter__") else {"result": str(summary)}
-
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    # The SDK aggregates the tiers client-side and returns a plain dict.
+    vctx.emit(vctx.client.storage_tiers.get_summary())
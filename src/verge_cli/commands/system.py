@@ -13,7 +13,7 @@ from verge_cli.columns import (
 )
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
+from verge_cli.output import output_success
 
 app = typer.Typer(
     name="system",
@@ -46,30 +46,35 @@ app.add_typer(license_app, name="license")
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Output formats that get structured data instead of the plain-text summary.
+_MACHINE_FORMATS = frozenset({"json", "ndjson"})
+
 
 def _setting_to_dict(setting: Any) -> dict[str, Any]:
     """Convert a SystemSetting SDK object to a dict for output."""
+    get = setting.get
     return {
-        "key": setting.get("key", getattr(setting, "key", "")),
-        "value": setting.get("value", ""),
-        "default_value": setting.get("default_value", ""),
-        "description": setting.get("description", ""),
-        "modified": setting.get("modified", False),
+        "key": get("key", ""),
+        "value": get("value", ""),
+        "default_value": get("default_value", ""),
+        "description": get("description", ""),
+        "modified": get("modified", False),
     }
 
 
 def _license_to_dict(lic: Any) -> dict[str, Any]:
     """Convert a License SDK object to a dict for output."""
+    get = lic.get
     return {
         "$key": lic.key,
-        "name": getattr(lic, "name", lic.get("name", "")),
-        "is_valid": lic.get("is_valid"),
-        "valid_from": lic.get("valid_from", ""),
-        "valid_until": lic.get("valid_until", ""),
-        "features": lic.get("features", ""),
-        "auto_renewal": lic.get("auto_renewal"),
-        "allow_branding": lic.get("allow_branding"),
-        "note": lic.get("note", ""),
+        "name": lic.name,
+        "is_valid": get("is_valid"),
+        "valid_from": get("valid_from", ""),
+        "valid_until": get("valid_until", ""),
+        "features": get("features", ""),
+        "auto_renewal": get("auto_renewal"),
+        "allow_branding": get("allow_branding"),
+        "note": get("note", ""),
     }
 
 
@@ -110,13 +115,7 @@ def system_info(ctx: typer.Context) -> None:
         # Statistics might not be available, continue with basic info
         pass
 
-    output_result(
-        info,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(info)
 
 
 @app.command("version")
@@ -132,21 +131,8 @@ def system_version(ctx: typer.Context) -> None:
         "os_version": client.os_version,
     }
 
-    if vctx.query:
-        output_result(
-            version_info,
-            output_format=vctx.output_format,
-            query=vctx.query,
-            quiet=vctx.quiet,
-            no_color=vctx.no_color,
-        )
-    elif vctx.output_format == "json":
-        output_result(
-            version_info,
-            output_format="json",
-            quiet=vctx.quiet,
-            no_color=vctx.no_color,
-        )
+    if vctx.query or vctx.output_format in _MACHINE_FORMATS:
+        vctx.emit(version_info)
     else:
         # Simple output for table mode
         typer.echo(f"VergeOS Version: {client.version}")
@@ -215,13 +201,7 @@ def inventory_cmd(
 
     result = vctx.client.system.inventory(**kwargs)
 
-    output_result(
-        result,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(result)
 
 
 # ---------------------------------------------------------------------------
@@ -240,19 +220,9 @@ def settings_list_cmd(
 ) -> None:
     """List system settings."""
     vctx = get_context(ctx)
-    if modified:
-        settings = vctx.client.system.settings.list_modified()
-    else:
-        settings = vctx.client.system.settings.list()
-    data = [_setting_to_dict(s) for s in settings]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SYSTEM_SETTING_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    settings_mgr = vctx.client.system.settings
+    settings = settings_mgr.list_modified() if modified else settings_mgr.list()
+    vctx.emit((_setting_to_dict(s) for s in settings), columns=SYSTEM_SETTING_COLUMNS)
 
 
 @settings_app.command("get")
@@ -264,13 +234,7 @@ def settings_get_cmd(
     """Get a specific system setting."""
     vctx = get_context(ctx)
     setting = vctx.client.system.settings.get(key)
-    output_result(
-        _setting_to_dict(setting),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_setting_to_dict(setting))
 
 
 @settings_app.command("set")
@@ -309,15 +273,7 @@ def license_list_cmd(ctx: typer.Context) -> None:
     """List system licenses."""
     vctx = get_context(ctx)
     licenses = vctx.client.system.licenses.list()
-    data = [_license_to_dict(lic) for lic in licenses]
-    output_result(
-        data,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=SYSTEM_LICENSE_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_license_to_dict(lic) for lic in licenses), columns=SYSTEM_LICENSE_COLUMNS)
 
 
 @license_app.command("get")
@@ -328,17 +284,12 @@ def license_get_cmd(
 ) -> None:
     """Get details of a license."""
     vctx = get_context(ctx)
+    licenses = vctx.client.system.licenses
     if license_id.isdigit():
-        lic = vctx.client.system.licenses.get(int(license_id))
+        lic = licenses.get(int(license_id))
     else:
-        lic = vctx.client.system.licenses.get(name=license_id)
-    output_result(
-        _license_to_dict(lic),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+        lic = licenses.get(name=license_id)
+    vctx.emit(_license_to_dict(lic))
 
 
 @license_app.command("add")
@@ -365,12 +316,7 @@ def license_generate_payload_cmd(ctx: typer.Context) -> None:
     """
     vctx = get_context(ctx)
     payload = vctx.client.system.licenses.generate_payload()
-    if vctx.output_format == "json":
-        output_result(
-            {"payload": payload},
-            output_format="json",
-            quiet=vctx.quiet,
-            no_color=vctx.no_color,
-        )
+    if vctx.output_format in _MACHINE_FORMATS:
+        vctx.emit({"payload": payload})
     else:
         typer.echo(payload)
@@ -10,8 +10,13 @@ from verge_cli.columns import ColumnDef, format_epoch
 from verge_cli.commands import tag_category
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import (
+    confirm_action,
+    forget_resolved,
+    resolve_resource_id,
+    resolve_resource_ids,
+)
 
 app = typer.Typer(
     name="tag",
@@ -37,21 +42,23 @@ TAG_MEMBER_COLUMNS: list[ColumnDef] = [
     ColumnDef("resource_name", header="Resource Name"),
 ]
 
-# Map user-friendly resource type names to SDK values
-RESOURCE_TYPE_MAP: dict[str, str] = {
-    "vm": "vms",
-    "network": "vnets",
-    "node": "nodes",
-    "tenant": "tenants",
-    "user": "users",
-    "cluster": "clusters",
-    "site": "sites",
-    "group": "groups",
-    "volume": "volumes",
+# Map user-friendly resource type names to (SDK member type, client manager attribute)
+RESOURCE_TYPE_MAP: dict[str, tuple[str, str]] = {
+    "vm": ("vms", "vms"),
+    "network": ("vnets", "networks"),
+    "node": ("nodes", "nodes"),
+    "tenant": ("tenants", "tenants"),
+    "user": ("users", "users"),
+    "cluster": ("clusters", "clusters"),
+    "site": ("sites", "sites"),
+    "group": ("groups", "groups"),
+    "volume": ("volumes", "volumes"),
 }
 
+_VALID_RESOURCE_TYPES = ", ".join(sorted(RESOURCE_TYPE_MAP))
+
 # Reverse map for display
-_SDK_TO_DISPLAY: dict[str, str] = {v: k for k, v in RESOURCE_TYPE_MAP.items()}
+_SDK_TO_DISPLAY: dict[str, str] = {sdk: cli for cli, (sdk, _) in RESOURCE_TYPE_MAP.items()}
 
 
 def _tag_to_dict(tag: Any) -> dict[str, Any]:
@@ -86,45 +93,38 @@ def _resolve_tag(vctx: Any, identifier: str) -> int:
     return resolve_resource_id(vctx.client.tags, identifier, "Tag")
 
 
-def _resolve_target_resource(
-    vctx: Any, resource_type_cli: str, resource_id: str
-) -> tuple[str, int]:
-    """Resolve a target resource type and ID for assign/unassign.
+def _lookup_resource_type(resource_type_cli: str) -> tuple[str, str]:
+    """Return (sdk_resource_type, manager_attr) for a CLI resource type name."""
+    entry = RESOURCE_TYPE_MAP.get(resource_type_cli.lower())
+    if entry is None:
+        raise typer.BadParameter(
+            f"Invalid resource type '{resource_type_cli}'. Valid types: {_VALID_RESOURCE_TYPES}"
+        )
+    return entry
+
+
+def _resolve_target_resources(
+    vctx: Any, resource_type_cli: str, resource_ids: list[str]
+) -> tuple[str, list[int]]:
+    """Resolve a target resource type and IDs for assign/unassign.
+
+    All IDs are resolved from one listing of the resource type.
 
     Returns:
-        Tuple of (sdk_resource_type, resource_key).
+        Tuple of (sdk_resource_type, resource_keys).
     """
-    sdk_type = RESOURCE_TYPE_MAP.get(resource_type_cli.lower())
-    if sdk_type is None:
-        valid_types = ", ".join(sorted(RESOURCE_TYPE_MAP.keys()))
-        raise typer.BadParameter(
-            f"Invalid resource type '{resource_type_cli}'. Valid types: {valid_types}"
-        )
+    sdk_type, manager_attr = _lookup_resource_type(resource_type_cli)
 
-    # Resolve the resource ID to a key
-    # Get the appropriate manager for the resource type
-    manager_map: dict[str, str] = {
-        "vms": "vms",
-        "vnets": "networks",
-        "nodes": "nodes",
-        "tenants": "tenants",
-        "users": "users",
-        "clusters": "clusters",
-        "sites": "sites",
-        "groups": "groups",
-        "volumes": "volumes",
-    }
-    manager_attr = manager_map.get(sdk_type, sdk_type)
+    # Resolve the resource IDs to keys with the manager for the resource type
     manager = getattr(vctx.client, manager_attr, None)
     if manager is None:
         # If we can't resolve, try treating as numeric
-        if resource_id.isdigit():
-            return sdk_type, int(resource_id)
+        if all(resource_id.isdigit() for resource_id in resource_ids):
+            return sdk_type, [int(resource_id) for resource_id in resource_ids]
         raise typer.BadParameter(
             f"Cannot resolve '{resource_type_cli}' resources. Please use a numeric key."
         )
-    resource_key = resolve_resource_id(manager, resource_id, resource_type_cli)
-    return sdk_type, resource_key
+    return sdk_type, resolve_resource_ids(manager, resource_ids, resource_type_cli)
 
 
 @app.command("list")
@@ -152,14 +152,7 @@ def list_cmd(
         else:
             kwargs["category_name"] = category
     tags = vctx.client.tags.list(**kwargs)
-    output_result(
-        [_tag_to_dict(t) for t in tags],
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_tag_to_dict(t) for t in tags), columns=TAG_COLUMNS)
 
 
 @app.command("get")
@@ -174,8 +167,9 @@ def get_cmd(
 ) -> None:
     """Get a tag by name or key."""
     vctx = get_context(ctx)
+    tags = vctx.client.tags
     if tag.isdigit():
-        item = vctx.client.tags.get(int(tag))
+        item = tags.get(int(tag))
     else:
         # Name lookup — optionally scoped to category
         get_kwargs: dict[str, Any] = {"name": tag}
@@ -184,15 +178,8 @@ def get_cmd(
                 get_kwargs["category_key"] = int(category)
             else:
                 get_kwargs["category_name"] = category
-        item = vctx.client.tags.get(**get_kwargs)
-    output_result(
-        _tag_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+        item = tags.get(**get_kwargs)
+    vctx.emit(_tag_to_dict(item), columns=TAG_COLUMNS)
 
 
 @app.command("create")
@@ -216,14 +203,7 @@ def create_cmd(
     if description is not None:
         kwargs["description"] = description
     result = vctx.client.tags.create(**kwargs)
-    output_result(
-        _tag_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_tag_to_dict(result), columns=TAG_COLUMNS)
     output_success(f"Tag '{name}' created.", quiet=vctx.quiet)
 
 
@@ -250,14 +230,9 @@ def update_cmd(
     if description is not None:
         kwargs["description"] = description
     result = vctx.client.tags.update(key, **kwargs)
-    output_result(
-        _tag_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    if name is not None:
+        forget_resolved(vctx.client.tags)
+    vctx.emit(_tag_to_dict(result), columns=TAG_COLUMNS)
     output_success(f"Tag '{tag}' updated.", quiet=vctx.quiet)
 
 
@@ -277,6 +252,7 @@ def delete_cmd(
     if not confirm_action(f"Delete tag '{tag}'?", yes=yes):
         raise typer.Abort()
     vctx.client.tags.delete(key)
+    forget_resolved(vctx.client.tags)
     output_success(f"Tag '{tag}' deleted.", quiet=vctx.quiet)
 
 
@@ -291,15 +267,16 @@ def assign_cmd(
             help="Resource type (vm, network, node, tenant, user, cluster, site, group, volume)."
         ),
     ],
-    resource_id: Annotated[str, typer.Argument(help="Resource name or key.")],
+    resource_ids: Annotated[list[str], typer.Argument(help="One or more resource names or keys.")],
 ) -> None:
-    """Assign a tag to a resource."""
+    """Assign a tag to one or more resources of the same type."""
     vctx = get_context(ctx)
     tag_key = _resolve_tag(vctx, tag)
-    sdk_type, res_key = _resolve_target_resource(vctx, resource_type, resource_id)
-    members_mgr = vctx.client.tags.members(tag_key)
-    members_mgr.add(sdk_type, res_key)
-    output_success(f"Tag '{tag}' assigned to {resource_type} '{resource_id}'.")
+    sdk_type, res_keys = _resolve_target_resources(vctx, resource_type, resource_ids)
+    add = vctx.client.tags.members(tag_key).add
+    for resource_id, res_key in zip(resource_ids, res_keys, strict=True):
+        add(sdk_type, res_key)
+        output_success(f"Tag '{tag}' assigned to {resource_type} '{resource_id}'.")
 
 
 @app.command("unassign")
@@ -313,15 +290,16 @@ def unassign_cmd(
             help="Resource type (vm, network, node, tenant, user, cluster, site, group, volume)."
         ),
     ],
-    resource_id: Annotated[str, typer.Argument(help="Resource name or key.")],
+    resource_ids: Annotated[list[str], typer.Argument(help="One or more resource names or keys.")],
 ) -> None:
-    """Unassign a tag from a resource."""
+    """Unassign a tag from one or more resources of the same type."""
     vctx = get_context(ctx)
     tag_key = _resolve_tag(vctx, tag)
-    sdk_type, res_key = _resolve_target_resource(vctx, resource_type, resource_id)
-    members_mgr = vctx.client.tags.members(tag_key)
-    members_mgr.remove_resource(sdk_type, res_key)
-    output_success(f"Tag '{tag}' unassigned from {resource_type} '{resource_id}'.")
+    sdk_type, res_keys = _resolve_target_resources(vctx, resource_type, resource_ids)
+    remove = vctx.client.tags.members(tag_key).remove_resource
+    for resource_id, res_key in zip(resource_ids, res_keys, strict=True):
+        remove(sdk_type, res_key)
+        output_success(f"Tag '{tag}' unassigned from {resource_type} '{resource_id}'.")
 
 
 @app.command("members")
@@ -341,19 +319,6 @@ def members_cmd(
     kwargs: dict[str, Any] = {}
     if resource_type is not None:
         # Convert CLI type name to SDK type name
-        sdk_type = RESOURCE_TYPE_MAP.get(resource_type.lower())
-        if sdk_type is None:
-            valid_types = ", ".join(sorted(RESOURCE_TYPE_MAP.keys()))
-            raise typer.BadParameter(
-                f"Invalid resource type '{resource_type}'. Valid types: {valid_types}"
-            )
-        kwargs["resource_type"] = sdk_type
+        kwargs["resource_type"] = _lookup_resource_type(resource_type)[0]
     members = members_mgr.list(**kwargs)
-    output_result(
-        [_member_to_dict(m) for m in members],
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_MEMBER_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_member_to_dict(m) for m in members), columns=TAG_MEMBER_COLUMNS)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Annotated, Any
 
 import typer
@@ -9,8 +10,8 @@ import typer
 from verge_cli.columns import ColumnDef, format_bool_yn, format_epoch
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import confirm_action, forget_resolved, resolve_resource_id
 
 app = typer.Typer(
     name="category",
@@ -33,7 +34,9 @@ TAG_CATEGORY_COLUMNS: list[ColumnDef] = [
 
 # Attribute names on the SDK TagCategory object for taggable checks.
 # The property names on the SDK object differ from the raw API fields.
-_TAGGABLE_ATTRS: list[tuple[str, str]] = [
+# They double as the create/update keywords and follow the order of the
+# --taggable-* options.
+_TAGGABLE_ATTRS: tuple[tuple[str, str], ...] = (
     ("taggable_vms", "vms"),
     ("taggable_networks", "networks"),
     ("taggable_volumes", "volumes"),
@@ -43,21 +46,21 @@ _TAGGABLE_ATTRS: list[tuple[str, str]] = [
     ("taggable_clusters", "clusters"),
     ("taggable_sites", "sites"),
     ("taggable_groups", "groups"),
-]
+)
+_TAGGABLE_GETTER = attrgetter(*(attr for attr, _ in _TAGGABLE_ATTRS))
+_TAGGABLE_NAMES: tuple[str, ...] = tuple(display for _, display in _TAGGABLE_ATTRS)
 
 
 def _category_to_dict(cat: Any) -> dict[str, Any]:
     """Convert a TagCategory SDK object to a dict for output."""
-    taggable: list[str] = []
-    for attr, display in _TAGGABLE_ATTRS:
-        if getattr(cat, attr, False):
-            taggable.append(display)
+    flags = _TAGGABLE_GETTER(cat)
+    taggable = [name for name, on in zip(_TAGGABLE_NAMES, flags, strict=True) if on]
     return {
         "$key": int(cat.key),
         "name": cat.name,
         "description": cat.description or "",
         "single_selection": cat.is_single_tag_selection,
-        "taggable_types": ", ".join(taggable) if taggable else "none",
+        "taggable_types": ", ".join(taggable) or "none",
         "created": cat.created,
     }
 
@@ -77,34 +80,22 @@ def list_cmd(
     if filter_expr is not None:
         kwargs["filter"] = filter_expr
     categories = vctx.client.tag_categories.list(**kwargs)
-    output_result(
-        [_category_to_dict(c) for c in categories],
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_CATEGORY_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_category_to_dict(c) for c in categories), columns=TAG_CATEGORY_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def get_cmd(
     ctx: typer.Context,
-    category: Annotated[str, typer.Argument(help="Category name or key.")],
+    category: Annotated[
+        str, typer.Argument(help="Category name or key (key:N skips the name lookup).")
+    ],
 ) -> None:
     """Get a tag category by name or key."""
     vctx = get_context(ctx)
     key = resolve_resource_id(vctx.client.tag_categories, category, "Tag category")
     item = vctx.client.tag_categories.get(key)
-    output_result(
-        _category_to_dict(item),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_CATEGORY_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_category_to_dict(item), columns=TAG_CATEGORY_COLUMNS)
 
 
 @app.command("create")
@@ -191,33 +182,24 @@ def create_cmd(
         kwargs["description"] = description
     if single_selection:
         kwargs["single_tag_selection"] = True
-    if taggable_vms:
-        kwargs["taggable_vms"] = True
-    if taggable_networks:
-        kwargs["taggable_networks"] = True
-    if taggable_volumes:
-        kwargs["taggable_volumes"] = True
-    if taggable_nodes:
-        kwargs["taggable_nodes"] = True
-    if taggable_tenants:
-        kwargs["taggable_tenants"] = True
-    if taggable_users:
-        kwargs["taggable_users"] = True
-    if taggable_clusters:
-        kwargs["taggable_clusters"] = True
-    if taggable_sites:
-        kwargs["taggable_sites"] = True
-    if taggable_groups:
-        kwargs["taggable_groups"] = True
-    result = vctx.client.tag_categories.create(**kwargs)
-    output_result(
-        _category_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_CATEGORY_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    taggable = (
+        taggable_vms,
+        taggable_networks,
+        taggable_volumes,
+        taggable_nodes,
+        taggable_tenants,
+        taggable_users,
+        taggable_clusters,
+        taggable_sites,
+        taggable_groups,
+    )
+    kwargs.update(
+        (attr, True)
+        for (attr, _), allowed in zip(_TAGGABLE_ATTRS, taggable, strict=True)
+        if allowed
     )
+    result = vctx.client.tag_categories.create(**kwargs)
+    vctx.emit(_category_to_dict(result), columns=TAG_CATEGORY_COLUMNS)
     output_success(f"Tag category '{name}' created.", quiet=vctx.quiet)
 
 
@@ -225,7 +207,9 @@ def create_cmd(
 @handle_errors()
 def update_cmd(
     ctx: typer.Context,
-    category: Annotated[str, typer.Argument(help="Category name or key.")],
+    category: Annotated[
+        str, typer.Argument(help="Category name or key (key:N skips the name lookup).")
+    ],
     name: Annotated[
         str | None,
         typer.Option("--name", "-n", help="New category name."),
@@ -312,33 +296,26 @@ def update_cmd(
         kwargs["description"] = description
     if single_selection is not None:
         kwargs["single_tag_selection"] = single_selection
-    if taggable_vms is not None:
-        kwargs["taggable_vms"] = taggable_vms
-    if taggable_networks is not None:
-        kwargs["taggable_networks"] = taggable_networks
-    if taggable_volumes is not None:
-        kwargs["taggable_volumes"] = taggable_volumes
-    if taggable_nodes is not None:
-        kwargs["taggable_nodes"] = taggable_nodes
-    if taggable_tenants is not None:
-        kwargs["taggable_tenants"] = taggable_tenants
-    if taggable_users is not None:
-        kwargs["taggable_users"] = taggable_users
-    if taggable_clusters is not None:
-        kwargs["taggable_clusters"] = taggable_clusters
-    if taggable_sites is not None:
-        kwargs["taggable_sites"] = taggable_sites
-    if taggable_groups is not None:
-        kwargs["taggable_groups"] = taggable_groups
-    result = vctx.client.tag_categories.update(key, **kwargs)
-    output_result(
-        _category_to_dict(result),
-        output_format=vctx.output_format,
-        query=vctx.query,
-        columns=TAG_CATEGORY_COLUMNS,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
+    taggable = (
+        taggable_vms,
+        taggable_networks,
+        taggable_volumes,
+        taggable_nodes,
+        taggable_tenants,
+        taggable_users,
+        taggable_clusters,
+        taggable_sites,
+        taggable_groups,
+    )
+    kwargs.update(
+        (attr, allowed)
+        for (attr, _), allowed in zip(_TAGGABLE_ATTRS, taggable, strict=True)
+        if allowed is not None
     )
+    result = vctx.client.tag_categories.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.tag_categories)
+    vctx.emit(_category_to_dict(result), columns=TAG_CATEGORY_COLUMNS)
     output_success(f"Tag category '{category}' updated.", quiet=vctx.quiet)
 
 
@@ -346,7 +323,9 @@ def update_cmd(
 @handle_errors()
 def delete_cmd(
     ctx: typer.Context,
-    category: Annotated[str, typer.Argument(help="Category name or key.")],
+    category: Annotated[
+        str, typer.Argument(help="Category name or key (key:N skips the name lookup).")
+    ],
     yes: Annotated[
         bool,
         typer.Option("--yes", "-y", help="Skip confirmation."),
@@ -358,4 +337,5 @@ def delete_cmd(
     if not confirm_action(f"Delete tag category '{category}'?", yes=yes):
         raise typer.Abort()
     vctx.client.tag_categories.delete(key)
+    forget_resolved(vctx.client.tag_categories)
     output_success(f"Tag category '{category}' deleted.", quiet=vctx.quiet)
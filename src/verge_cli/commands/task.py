@@ -9,44 +9,48 @@ import click
 import typer
 
 from verge_cli.columns import TASK_COLUMNS
-from verge_cli.commands import task_event, task_schedule, task_script, task_trigger
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_error, output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.lazy import lazy_group
+from verge_cli.output import output_error, output_success
+from verge_cli.utils import confirm_action, forget_resolved, resolve_resource_id
 
+# Sub-command groups are imported only when dispatched (or listed in help).
 app = typer.Typer(
     name="task",
     help="Manage tasks.",
     no_args_is_help=True,
+    cls=lazy_group(
+        {
+            "event": "verge_cli.commands.task_event:app",
+            "schedule": "verge_cli.commands.task_schedule:app",
+            "script": "verge_cli.commands.task_script:app",
+            "trigger": "verge_cli.commands.task_trigger:app",
+        }
+    ),
 )
 
-# Register sub-command groups
-app.add_typer(task_event.app, name="event")
-app.add_typer(task_schedule.app, name="schedule")
-app.add_typer(task_script.app, name="script")
-app.add_typer(task_trigger.app, name="trigger")
-
 
 def _task_to_dict(task: Any) -> dict[str, Any]:
     """Convert a Task SDK object to a dictionary for output."""
+    get = task.get
     return {
         "$key": int(task.key),
         "name": task.name,
-        "description": task.get("description", ""),
+        "description": get("description", ""),
         "status": task.status,
         "enabled": task.is_enabled,
-        "action": task.get("action", ""),
-        "action_display": task.get("action_display", ""),
-        "table": task.get("table", ""),
-        "owner": task.get("owner"),
+        "action": get("action", ""),
+        "action_display": get("action_display", ""),
+        "table": get("table", ""),
+        "owner": get("owner"),
         "owner_display": task.owner_display,
         "creator_display": task.creator_display,
-        "last_run": task.get("last_run"),
+        "last_run": get("last_run"),
         "delete_after_run": task.is_delete_after_run,
         "system_created": task.is_system_created,
         "progress": task.progress,
-        "error": task.get("error", ""),
+        "error": get("error", ""),
         "triggers_count": task.trigger_count,
         "events_count": task.event_count,
     }
@@ -89,34 +93,22 @@ def task_list(
     if status:
         kwargs["status"] = status
     tasks = vctx.client.tasks.list(**kwargs)
-    output_result(
-        [_task_to_dict(t) for t in tasks],
-        columns=TASK_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_task_to_dict(t) for t in tasks), columns=TASK_COLUMNS)
 
 
 @app.command("get")
 @handle_errors()
 def task_get(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
 ) -> None:
     """Get a task by ID or name."""
     vctx = get_context(ctx)
     key = resolve_resource_id(vctx.client.tasks, identifier, "Task")
     task = vctx.client.tasks.get(key)
-    output_result(
-        _task_to_dict(task),
-        columns=TASK_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_task_to_dict(task), columns=TASK_COLUMNS)
 
 
 @app.command("create")
@@ -175,7 +167,9 @@ def task_create(
 @handle_errors()
 def task_update(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
     name: Annotated[
         str | None,
         typer.Option("--name", help="New task name."),
@@ -216,6 +210,8 @@ def task_update(
             output_error(f"Invalid JSON for --settings-json: {exc}")
             raise typer.Exit(2) from None
     vctx.client.tasks.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.tasks)
     output_success(f"Task '{identifier}' updated.", quiet=vctx.quiet)
 
 
@@ -223,7 +219,9 @@ def task_update(
 @handle_errors()
 def task_delete(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
     yes: Annotated[
         bool,
         typer.Option("--yes", "-y", help="Skip confirmation prompt."),
@@ -235,6 +233,7 @@ def task_delete(
     if not confirm_action(f"Delete task '{identifier}'?", yes=yes):
         raise typer.Exit(0)
     vctx.client.tasks.delete(key)
+    forget_resolved(vctx.client.tasks)
     output_success(f"Task '{identifier}' deleted.", quiet=vctx.quiet)
 
 
@@ -242,7 +241,9 @@ def task_delete(
 @handle_errors()
 def task_enable(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
 ) -> None:
     """Enable a task."""
     vctx = get_context(ctx)
@@ -255,7 +256,9 @@ def task_enable(
 @handle_errors()
 def task_disable(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
 ) -> None:
     """Disable a task."""
     vctx = get_context(ctx)
@@ -268,7 +271,9 @@ def task_disable(
 @handle_errors()
 def task_run(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
     wait: Annotated[
         bool,
         typer.Option("--wait", "-w", help="Wait for task completion."),
@@ -304,7 +309,9 @@ def task_run(
 @handle_errors()
 def task_cancel(
     ctx: typer.Context,
-    identifier: Annotated[str, typer.Argument(help="Task ID or name.")],
+    identifier: Annotated[
+        str, typer.Argument(help="Task ID or name (key:N skips the name lookup).")
+    ],
 ) -> None:
     """Cancel a running task."""
     vctx = get_context(ctx)
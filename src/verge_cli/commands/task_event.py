@@ -10,7 +10,7 @@ import typer
 from verge_cli.columns import TASK_EVENT_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
+from verge_cli.output import output_success
 from verge_cli.utils import confirm_action, resolve_resource_id
 
 app = typer.Typer(
@@ -42,7 +42,7 @@ def event_list(
     ctx: typer.Context,
     task: Annotated[
         str | None,
-        typer.Option("--task", help="Filter by task (name or key)."),
+        typer.Option("--task", help="Filter by task (name or key; key:N skips the name lookup)."),
     ] = None,
     table: Annotated[
         str | None,
@@ -70,14 +70,7 @@ def event_list(
     if filter is not None:
         kwargs["filter"] = filter
     events = vctx.client.task_events.list(**kwargs)
-    output_result(
-        [_event_to_dict(e) for e in events],
-        columns=TASK_EVENT_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_event_to_dict(e) for e in events), columns=TASK_EVENT_COLUMNS)
 
 
 @app.command("get")
@@ -89,21 +82,16 @@ def event_get(
     """Get a task event by key."""
     vctx = get_context(ctx)
     event = vctx.client.task_events.get(event_id)
-    output_result(
-        _event_to_dict(event),
-        columns=TASK_EVENT_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_event_to_dict(event), columns=TASK_EVENT_COLUMNS)
 
 
 @app.command("create")
 @handle_errors()
 def event_create(
     ctx: typer.Context,
-    task: Annotated[str, typer.Option("--task", help="Task to fire (name or key).")],
+    task: Annotated[
+        str, typer.Option("--task", help="Task to fire (name or key; key:N skips the name lookup).")
+    ],
     event: Annotated[str, typer.Option("--event", help="Event identifier (e.g. lowered, login).")],
     table: Annotated[
         str,
@@ -10,8 +10,8 @@ import typer
 from verge_cli.columns import SCHEDULE_UPCOMING_COLUMNS, TASK_SCHEDULE_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import confirm_action, forget_resolved, resolve_resource_id
 
 app = typer.Typer(
     name="schedule",
@@ -29,21 +29,24 @@ def _seconds_to_time(seconds: int) -> str:
 
 def _schedule_to_dict(schedule: Any) -> dict[str, Any]:
     """Convert a TaskSchedule SDK object to a dictionary for output."""
+    get = schedule.get
+    start_time = get("start_time_of_day", 0)
+    end_time = get("end_time_of_day", 86400)
     return {
         "$key": int(schedule.key),
         "name": schedule.name,
-        "description": schedule.get("description", ""),
+        "description": get("description", ""),
         "enabled": schedule.is_enabled,
-        "repeat_every": schedule.get("repeat_every", ""),
+        "repeat_every": get("repeat_every", ""),
         "repeat_display": schedule.repeat_every_display,
         "repeat_iteration": schedule.repeat_count,
-        "start_date": schedule.get("start_date", ""),
-        "end_date": schedule.get("end_date", ""),
-        "start_time_of_day": schedule.get("start_time_of_day", 0),
-        "start_time_display": _seconds_to_time(int(schedule.get("start_time_of_day", 0))),
-        "end_time_of_day": schedule.get("end_time_of_day", 86400),
-        "end_time_display": _seconds_to_time(int(schedule.get("end_time_of_day", 86400))),
-        "day_of_month": schedule.get("day_of_month", ""),
+        "start_date": get("start_date", ""),
+        "end_date": get("end_date", ""),
+        "start_time_of_day": start_time,
+        "start_time_display": _seconds_to_time(int(start_time)),
+        "end_time_of_day": end_time,
+        "end_time_display": _seconds_to_time(int(end_time)),
+        "day_of_month": get("day_of_month", ""),
         "active_days": ", ".join(schedule.active_days),
     }
 
@@ -86,14 +89,7 @@ def schedule_list(
     if repeat_every is not None:
         kwargs["repeat_every"] = repeat_every
     schedules = vctx.client.task_schedules.list(**kwargs)
-    output_result(
-        [_schedule_to_dict(s) for s in schedules],
-        columns=TASK_SCHEDULE_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_schedule_to_dict(s) for s in schedules), columns=TASK_SCHEDULE_COLUMNS)
 
 
 @app.command("get")
@@ -106,14 +102,7 @@ def schedule_get(
     vctx = get_context(ctx)
     key = resolve_resource_id(vctx.client.task_schedules, identifier, "TaskSchedule")
     schedule = vctx.client.task_schedules.get(key)
-    output_result(
-        _schedule_to_dict(schedule),
-        columns=TASK_SCHEDULE_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_schedule_to_dict(schedule), columns=TASK_SCHEDULE_COLUMNS)
 
 
 @app.command("create")
@@ -301,6 +290,8 @@ def schedule_update(
     if sunday is not None:
         kwargs["sunday"] = sunday
     vctx.client.task_schedules.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.task_schedules)
     output_success(f"Schedule '{identifier}' updated.")
 
 
@@ -320,6 +311,7 @@ def schedule_delete(
     if not confirm_action(f"Delete schedule '{identifier}'?", yes=yes):
         raise typer.Exit(0)
     vctx.client.task_schedules.delete(key)
+    forget_resolved(vctx.client.task_schedules)
     output_success(f"Schedule '{identifier}' deleted.")
 
 
@@ -376,11 +368,4 @@ def schedule_show(
     if end_time is not None:
         kwargs["end_time"] = int(end_time)
     upcoming = vctx.client.task_schedules.get_schedule(key, **kwargs)
-    output_result(
-        [_upcoming_to_dict(entry) for entry in upcoming],
-        columns=SCHEDULE_UPCOMING_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_upcoming_to_dict(entry) for entry in upcoming), columns=SCHEDULE_UPCOMING_COLUMNS)
@@ -11,8 +11,8 @@ import typer
 from verge_cli.columns import TASK_SCRIPT_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
-from verge_cli.utils import confirm_action, resolve_resource_id
+from verge_cli.output import output_success
+from verge_cli.utils import confirm_action, forget_resolved, resolve_resource_id
 
 app = typer.Typer(
     name="script",
@@ -58,14 +58,7 @@ def script_list(
     if filter is not None:
         kwargs["filter"] = filter
     scripts = vctx.client.task_scripts.list(**kwargs)
-    output_result(
-        [_script_to_dict(s) for s in scripts],
-        columns=TASK_SCRIPT_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_script_to_dict(s) for s in scripts), columns=TASK_SCRIPT_COLUMNS)
 
 
 @app.command("get")
@@ -78,14 +71,7 @@ def script_get(
     vctx = get_context(ctx)
     key = resolve_resource_id(vctx.client.task_scripts, identifier, "TaskScript")
     script = vctx.client.task_scripts.get(key)
-    output_result(
-        _script_to_dict(script),
-        columns=TASK_SCRIPT_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit(_script_to_dict(script), columns=TASK_SCRIPT_COLUMNS)
 
 
 @app.command("create")
@@ -156,6 +142,8 @@ def script_update(
     if settings_json is not None:
         kwargs["task_settings"] = json.loads(settings_json)
     vctx.client.task_scripts.update(key, **kwargs)
+    if name is not None:
+        forget_resolved(vctx.client.task_scripts)
     output_success(f"Task script '{identifier}' updated.")
 
 
@@ -175,6 +163,7 @@ def script_delete(
     if not confirm_action(f"Delete task script '{identifier}'?", yes=yes):
         raise typer.Exit(0)
     vctx.client.task_scripts.delete(key)
+    forget_resolved(vctx.client.task_scripts)
     output_success(f"Task script '{identifier}' deleted.")
 
 
@@ -9,7 +9,7 @@ import typer
 from verge_cli.columns import TASK_TRIGGER_COLUMNS
 from verge_cli.context import get_context
 from verge_cli.errors import handle_errors
-from verge_cli.output import output_result, output_success
+from verge_cli.output import output_success
 from verge_cli.utils import confirm_action, resolve_resource_id
 
 app = typer.Typer(
@@ -42,14 +42,7 @@ def trigger_list(
     vctx = get_context(ctx)
     task_key = resolve_resource_id(vctx.client.tasks, task, "Task")
     triggers = vctx.client.task_schedule_triggers.list(task=task_key)
-    output_result(
-        [_trigger_to_dict(t) for t in triggers],
-        columns=TASK_TRIGGER_COLUMNS,
-        output_format=vctx.output_format,
-        query=vctx.query,
-        quiet=vctx.quiet,
-        no_color=vctx.no_color,
-    )
+    vctx.emit((_trigger_to_dict(t) for t in triggers), columns=TASK_TRIGGER_COLUMNS)
 
 
 @app.command("create")
@@ -3,22 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import typer
 
+from verge_cli.output import output_result
+
 if TYPE_CHECKING:
     from pyvergeos import VergeClient
 
+    from verge_cli.columns import ColumnDef
     from verge_cli.config import ProfileConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VergeContext:
     """Shared context passed to all CLI commands via ctx.obj.
 
     This dataclass holds the authenticated client, configuration,
-    and output settings for use across all sub-commands.
+    and output settings for use across all sub-commands. Instances are
+    read-only snapshots of the global options.
     """
 
     config: ProfileConfig
@@ -29,6 +33,22 @@ class VergeContext:
     query: str | None = None
     no_color: bool = False
 
+    def emit(self, data: Any, columns: list[ColumnDef] | None = None) -> None:
+        """Output command results using the global output options.
+
+        Args:
+            data: Data to output (dict, list or iterable of rows).
+            columns: Column definitions for table output.
+        """
+        output_result(
+            data,
+            output_format=self.output_format,
+            query=self.query,
+            columns=columns,
+            quiet=self.quiet,
+            no_color=self.no_color,
+        )
+
 
 def get_context(ctx: typer.Context) -> VergeContext:
     """Get or create the VergeContext with an authenticated client.
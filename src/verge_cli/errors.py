@@ -153,14 +153,14 @@ def map_sdk_exception(exc: Exception) -> CliError:
     return CliError(str(exc))
 
 
-def handle_errors(verbosity: int = 0) -> Callable[[Callable[P, T]], Callable[P, T]]:
-    """Decorator to handle errors and exit with appropriate codes.
+def handle_errors_with(verbosity: int = 0) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Build a decorator that handles errors and exits with appropriate codes.
 
     Args:
         verbosity: Verbosity level for error output.
 
     Returns:
-        Decorated function.
+        Decorator for command functions.
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
@@ -189,6 +189,25 @@ def handle_errors(verbosity: int = 0) -> Callable[[Callable[P, T]], Callable[P,
     return decorator
 
 
+_handle_errors_default = handle_errors_with()
+
+
+def handle_errors(verbosity: int = 0) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorator to handle errors and exit with appropriate codes.
+
+    With default options every command shares one decorator built at import.
+
+    Args:
+        verbosity: Verbosity level for error output.
+
+    Returns:
+        Decorator for command functions.
+    """
+    if verbosity == 0:
+        return _handle_errors_default
+    return handle_errors_with(verbosity)
+
+
 def _print_error(
     message: str,
     verbosity: int,
@@ -0,0 +1,61 @@
+"""Lazily loaded Typer sub-command groups for Verge CLI.
+
+Typer converts every registered sub-app into Click commands each time the
+CLI starts, even though only one leaf command runs. Groups built with
+``lazy_group`` register sub-apps by import path instead; a sub-app is only
+imported and converted when its name is dispatched (or help lists it).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that imports some sub-apps on first use.
+
+    Subclasses set ``lazy_subcommands`` to a mapping of command name to
+    ``"module.path:attribute"`` naming a ``typer.Typer`` instance.
+    """
+
+    lazy_subcommands: dict[str, str] = {}
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List eager commands followed by the lazy sub-apps not yet loaded."""
+        # Loaded sub-apps are stored in self.commands, so super() lists them.
+        loaded = self.commands
+        return [
+            *super().list_commands(ctx),
+            *(name for name in self.lazy_subcommands if name not in loaded),
+        ]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Return a command, importing and converting a lazy sub-app once."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in self.lazy_subcommands:
+            cmd = self._load(cmd_name)
+            self.commands[cmd_name] = cmd
+        return cmd
+
+    def _load(self, cmd_name: str) -> Any:
+        module_path, _, attr = self.lazy_subcommands[cmd_name].partition(":")
+        sub_app = getattr(importlib.import_module(module_path), attr or "app")
+        group = typer.main.get_group(sub_app)
+        group.name = cmd_name
+        return group
+
+
+def lazy_group(subcommands: dict[str, str]) -> type[LazyTyperGroup]:
+    """Build a LazyTyperGroup class for ``typer.Typer(cls=...)``.
+
+    Args:
+        subcommands: Command name to ``"module.path:attribute"`` mapping.
+
+    Returns:
+        A LazyTyperGroup subclass bound to the given sub-apps.
+    """
+    return type("LazyTyperGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)})
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import csv
+import itertools
 import json
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -13,7 +15,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from verge_cli.columns import ColumnDef, default_format, json_serializer
+from verge_cli.columns import ColumnDef, FormatFn, default_format, json_serializer
 
 
 def is_tty() -> bool:
@@ -54,8 +56,80 @@ def format_json(data: Any, query: str | None = None) -> str:
     return json.dumps(data, indent=2, default=json_serializer)
 
 
+def _peek(rows: Iterator[Any]) -> tuple[Any, Iterator[Any]] | None:
+    """Look at the first item of a row stream without losing it.
+
+    Returns:
+        Tuple of (first item, iterator yielding all items), or None if empty.
+    """
+    for first in rows:
+        return first, itertools.chain((first,), rows)
+    return None
+
+
+def write_json_stream(rows: Iterable[Any]) -> None:
+    """Write rows to stdout as a JSON array, one element at a time.
+
+    Produces the same text as ``format_json(list(rows))`` without holding
+    the full list or the full encoded document in memory.
+
+    Args:
+        rows: Iterable of JSON-serializable items.
+    """
+    write = sys.stdout.write
+    sep = "[\n  "
+    for row in rows:
+        write(sep)
+        write(json.dumps(row, indent=2, default=json_serializer).replace("\n", "\n  "))
+        sep = ",\n  "
+    write("[]\n" if sep.startswith("[") else "\n]\n")
+
+
+# Flush NDJSON output to stdout in chunks of roughly this many characters.
+_NDJSON_CHUNK = 65536
+
+
+def write_ndjson(rows: Iterable[Any]) -> None:
+    """Write rows to stdout as newline-delimited JSON (one compact object per line).
+
+    Lines are joined into ~64 KiB chunks before writing, so large results
+    cost one write per chunk rather than per row, and memory stays bounded
+    by the chunk size.
+
+    Args:
+        rows: Iterable of JSON-serializable items.
+    """
+    encode = json.JSONEncoder(separators=(",", ":"), default=json_serializer).encode
+    write = sys.stdout.write
+    chunk: list[str] = []
+    size = 0
+    for row in rows:
+        line = encode(row)
+        chunk.append(line)
+        size += len(line) + 1
+        if size >= _NDJSON_CHUNK:
+            chunk.append("")
+            write("\n".join(chunk))
+            chunk.clear()
+            size = 0
+    if chunk:
+        chunk.append("")
+        write("\n".join(chunk))
+
+
+def _column_formatters(
+    columns: list[ColumnDef] | list[str] | None,
+) -> dict[str, FormatFn]:
+    """Map column keys to their format_fn for single-record output."""
+    if not columns:
+        return {}
+    return {
+        c.key: c.format_fn for c in columns if isinstance(c, ColumnDef) and c.format_fn is not None
+    }
+
+
 def format_table(
-    data: list[dict[str, Any]] | dict[str, Any],
+    data: Iterable[dict[str, Any]] | dict[str, Any],
     columns: list[ColumnDef] | list[str] | None = None,
     title: str | None = None,
     no_color: bool = False,
@@ -78,16 +152,23 @@ def format_table(
         table.add_column("Field", style="cyan")
         table.add_column("Value")
 
+        formatters = _column_formatters(columns)
         for key, value in data.items():
-            table.add_row(str(key), format_value(value))
+            fmt = formatters.get(key)
+            if fmt is None:
+                table.add_row(str(key), format_value(value))
+            else:
+                table.add_row(str(key), Text(fmt(value, for_csv=False)))
 
         console.print(table)
         return
 
-    # Handle empty list
-    if not data:
+    # Handle empty list (rows may be a lazily-produced stream)
+    peeked = _peek(iter(data))
+    if peeked is None:
         console.print("[dim]No results found.[/dim]")
         return
+    first, rows = peeked
 
     # Resolve columns
     coldefs: list[ColumnDef] | None = None
@@ -100,7 +181,7 @@ def format_table(
             str_columns = columns  # type: ignore[assignment]
     else:
         # Auto-detect from first row
-        str_columns = list(data[0].keys())
+        str_columns = list(first.keys())
 
     # ColumnDef path
     if coldefs is not None:
@@ -111,9 +192,9 @@ def format_table(
         for col in visible:
             table.add_column(col.resolved_header)
 
-        for row in data:
-            cells = [render_cell(row.get(col.key), row, col) for col in visible]
-            table.add_row(*cells)
+        render_row = compile_row_renderer(coldefs, wide=wide)
+        for row in rows:
+            table.add_row(*render_row(row))
 
         console.print(table)
         return
@@ -124,7 +205,7 @@ def format_table(
     for col_name in str_columns:
         table.add_column(col_name.replace("_", " ").title())
 
-    for row in data:
+    for row in rows:
         table.add_row(*[format_value(row.get(col_name)) for col_name in str_columns])
 
     console.print(table)
@@ -197,35 +278,112 @@ def render_cell(
     return Text(display)
 
 
+RowRenderer = Callable[[dict[str, Any]], list[Any]]
+
+# Row renderers built by compile_row_renderer for the long-lived column lists
+# commands pass in, keyed by (id(columns), for_csv, wide). Each entry holds a
+# reference to its column list, so that list stays alive and its id() cannot
+# be reused by another list. Column lists auto-detected from data are built
+# per call and never cached, so the cache only grows with the column
+# constants that exist.
+_row_renderers: dict[tuple[int, bool, bool], tuple[list[ColumnDef], RowRenderer]] = {}
+
+
+def _cell_renderer(coldef: ColumnDef, for_csv: bool) -> Callable[[dict[str, Any]], Any]:
+    """Build a callable rendering one column of a row, specialised for the ColumnDef."""
+    key = coldef.key
+    fmt = coldef.format_fn if coldef.format_fn is not None else default_format
+
+    if for_csv:
+        return lambda row: fmt(row.get(key), for_csv=True)
+
+    # Styled columns go through the full render pipeline
+    if coldef.style_map is not None or coldef.style_fn is not None:
+        return lambda row: render_cell(row.get(key), row, coldef)
+
+    style = coldef.default_style
+    if style:
+        return lambda row: Text(fmt(row.get(key), for_csv=False), style=style)
+    return lambda row: Text(fmt(row.get(key), for_csv=False))
+
+
+def compile_row_renderer(
+    columns: list[ColumnDef],
+    *,
+    for_csv: bool = False,
+    wide: bool = True,
+) -> RowRenderer:
+    """Return a function rendering a row dict into a list of cells.
+
+    Per-column decisions (which formatter, whether any styling applies) are
+    made once here rather than for every cell. Output matches calling
+    render_cell for each column. Renderers are cached per column list, so
+    pass long-lived lists (module constants), not lists built per call.
+
+    Args:
+        columns: Column definitions, in display order.
+        for_csv: If True, cells are plain strings for CSV output.
+        wide: If False, wide_only columns are skipped.
+
+    Returns:
+        Callable taking a row dict and returning its rendered cells.
+    """
+    cache_key = (id(columns), for_csv, wide)
+    cached = _row_renderers.get(cache_key)
+    if cached is not None and cached[0] is columns:
+        return cached[1]
+
+    render_row = _build_row_renderer(columns, for_csv=for_csv, wide=wide)
+    _row_renderers[cache_key] = (columns, render_row)
+    return render_row
+
+
+def _build_row_renderer(columns: list[ColumnDef], *, for_csv: bool, wide: bool) -> RowRenderer:
+    """Build an uncached row renderer (see compile_row_renderer)."""
+    renderers = [_cell_renderer(col, for_csv) for col in columns if wide or not col.wide_only]
+
+    def render_row(row: dict[str, Any]) -> list[Any]:
+        return [render(row) for render in renderers]
+
+    return render_row
+
+
 def format_csv(
-    data: list[dict[str, Any]],
+    data: Iterable[dict[str, Any]],
     columns: list[ColumnDef] | None = None,
 ) -> None:
     """Format and print data as CSV.
 
     All columns (including wide_only) are included in CSV output.
     Uses render_cell with for_csv=True for machine-friendly values.
+    Rows are written as they are read, so ``data`` may be a stream.
 
     Args:
-        data: List of dicts to output.
+        data: Iterable of dicts to output.
         columns: ColumnDef list. Auto-detects from data if None.
     """
     if columns is not None:
         coldefs = columns
-    elif data:
-        coldefs = [ColumnDef(k) for k in data[0].keys()]
     else:
-        coldefs = []
+        peeked = _peek(iter(data))
+        if peeked is None:
+            coldefs = []
+        else:
+            first, data = peeked
+            coldefs = [ColumnDef(k) for k in first.keys()]
 
     writer = csv.writer(sys.stdout, lineterminator="\n")
 
     # Header row
     writer.writerow([col.resolved_header for col in coldefs])
 
-    # Data rows
+    # Data rows; auto-detected columns are new on every call, so skip the cache
+    if columns is not None:
+        render_row = compile_row_renderer(coldefs, for_csv=True)
+    else:
+        render_row = _build_row_renderer(coldefs, for_csv=True, wide=True)
     for row in data:
-        cells = [render_cell(row.get(col.key), row, col, for_csv=True) for col in coldefs]
-        writer.writerow(cells)
+        writer.writerow(render_row(row))
 
 
 def extract_field(data: Any, query: str) -> Any:
@@ -302,13 +460,24 @@ def output_result(
 
     Args:
         data: Data to output.
-        output_format: Format type ("table", "wide", "json", "csv").
+        output_format: Format type ("table", "wide", "json", "ndjson", "csv").
         query: Optional dot-notation query for field extraction.
         columns: ColumnDef or string list for table/csv output.
         title: Optional title for table output.
         quiet: If True, output minimal data (just the value for queries).
         no_color: Disable colored output.
+
+    ``data`` may also be an iterator of row dicts (e.g. a generator over an
+    SDK list). JSON, NDJSON and CSV output then stream row by row; queries
+    need the whole result and materialize it first.
     """
+    if isinstance(data, Iterator):
+        if query:
+            data = list(data)
+        elif output_format == "json":
+            write_json_stream(data)
+            return
+
     # Apply query extraction
     if query:
         data = extract_field(data, query)
@@ -319,6 +488,11 @@ def output_result(
                 print(data if data is not None else "")
             return
 
+    # NDJSON format — one compact JSON document per line
+    if output_format == "ndjson":
+        write_ndjson(data if isinstance(data, (list, Iterator)) else [data])
+        return
+
     # JSON format — raw data, no styling
     if output_format == "json":
         print(format_json(data))
@@ -331,7 +505,10 @@ def output_result(
 
     # Table or wide format
     wide = output_format == "wide"
-    if isinstance(data, list):
+    if isinstance(data, Iterator):
+        # Streams only carry row dicts; scalar lists come from --query
+        format_table(data, columns=columns, title=title, no_color=no_color, wide=wide)
+    elif isinstance(data, list):
         if data and not isinstance(data[0], dict):
             # List of simple values (e.g., from --query name)
             console = get_console(no_color)
@@ -340,7 +517,7 @@ def output_result(
         else:
             format_table(data, columns=columns, title=title, no_color=no_color, wide=wide)
     elif isinstance(data, dict):
-        format_table(data, title=title, no_color=no_color)
+        format_table(data, columns=columns, title=title, no_color=no_color)
     else:
         console = get_console(no_color)
         console.print(data if data is not None else "[dim]No result[/dim]")
@@ -365,6 +542,11 @@ def _output_csv(
         else:
             coldefs = [ColumnDef(str(k)) for k in columns]
 
+    # Row stream of dicts — write rows as they arrive
+    if isinstance(data, Iterator):
+        format_csv(data, columns=coldefs)
+        return
+
     # list[dict] — normal CSV with columns
     if isinstance(data, list) and data and isinstance(data[0], dict):
         format_csv(data, columns=coldefs)
@@ -384,8 +566,11 @@ def _output_csv(
 
     # dict — one row, keys as headers (insertion order)
     if isinstance(data, dict):
+        formatters = _column_formatters(coldefs)
         writer.writerow(list(data.keys()))
-        writer.writerow([default_format(v, for_csv=True) for v in data.values()])
+        writer.writerow(
+            [formatters.get(k, default_format)(v, for_csv=True) for k, v in data.items()]
+        )
         return
 
     # scalar — one row, one column
@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import re
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Protocol
 
 from rich.console import Console
 from rich.status import Status
 
-from verge_cli.errors import MultipleMatchesError, ResourceNotFoundError, TimeoutCliError
+from verge_cli.errors import (
+    MultipleMatchesError,
+    ResourceNotFoundError,
+    TimeoutCliError,
+    ValidationCliError,
+)
 
 if TYPE_CHECKING:
     from pyvergeos import VergeClient
 
 _HEX_KEY_PATTERN = re.compile(r"^[0-9a-f]{40}$")
 
+# Identifiers of the form "key:<digits>" name a key outright, skipping the
+# name lookup (and so also reaching resources whose names are numeric).
+_KEY_PREFIX = "key:"
+
+# Process-local memo of name→key resolutions, keyed weakly by SDK manager so
+# entries die with the client. Entries expire after _RESOLVE_TTL seconds.
+_RESOLVE_TTL = 300.0
+_resolve_cache: weakref.WeakKeyDictionary[Any, dict[str, tuple[float, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Page size used when --all or --continuation is given without --page-size.
+DEFAULT_PAGE_SIZE = 500
+
 
 class ResourceManager(Protocol):
     """Protocol for pyvergeos resource managers.
@@ -33,31 +55,66 @@ class ResourceManager(Protocol):
     def get(self, key: int | None = ...) -> Any: ...
 
 
-def resolve_resource_id(
-    manager: ResourceManager,
-    identifier: str,
-    resource_type: str = "resource",
-) -> int:
-    """Resolve a name or ID to a resource key.
+def _cached_key(manager: Any, identifier: str) -> Any | None:
+    """Return a previously resolved key for identifier, if still fresh."""
+    try:
+        entries = _resolve_cache.get(manager)
+    except TypeError:
+        return None
+    if entries is None:
+        return None
+    hit = entries.get(identifier)
+    if hit is None or hit[0] < time.monotonic():
+        return None
+    return hit[1]
+
+
+def _remember_key(manager: Any, identifier: str, key: Any) -> Any:
+    """Record a resolved key for identifier and return it."""
+    try:
+        entries = _resolve_cache.setdefault(manager, {})
+    except TypeError:
+        return key
+    entries[identifier] = (time.monotonic() + _RESOLVE_TTL, key)
+    return key
 
-    Args:
-        manager: pyvergeos resource manager (e.g., client.vms).
-        identifier: Either a numeric key or a resource name.
-        resource_type: Type name for error messages (e.g., "VM", "network").
 
-    Returns:
-        Resource key (int).
+def forget_resolved(manager: Any) -> None:
+    """Drop memoized name→key lookups for a manager.
 
-    Raises:
-        ResourceNotFoundError: No resource matches.
-        MultipleMatchesError: Multiple resources match name.
+    Call after deleting or renaming a resource so a later lookup in the
+    same process does not return a stale key.
+
+    Args:
+        manager: pyvergeos resource manager whose lookups to discard.
     """
-    # Search by name first (handles both named and numeric names)
     try:
-        resources = manager.list()
+        _resolve_cache.pop(manager, None)
+    except TypeError:
+        pass
+
+
+def _explicit_key(identifier: str) -> int | None:
+    """Return the key from a ``key:<digits>`` identifier, else None."""
+    if identifier.startswith(_KEY_PREFIX):
+        digits = identifier[len(_KEY_PREFIX) :]
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def _list_for_resolve(
+    manager: Any, resource_type: str, scope: dict[str, Any] | None = None
+) -> list[Any]:
+    """List all resources of a manager (optionally filtered) for name resolution."""
+    try:
+        return manager.list(**scope) if scope else manager.list()
     except Exception as e:
         raise ResourceNotFoundError(f"Failed to list {resource_type}s: {e}") from e
 
+
+def _match_resource_id(resources: list[Any], identifier: str, resource_type: str) -> int:
+    """Match an identifier against an already-fetched resource listing."""
     # Filter by name
     matches = []
     for resource in resources:
@@ -86,6 +143,171 @@ def resolve_resource_id(
     raise ResourceNotFoundError(f"{resource_type} '{identifier}' not found")
 
 
+def resolve_resource_id(
+    manager: ResourceManager,
+    identifier: str,
+    resource_type: str = "resource",
+    *,
+    scope: dict[str, Any] | None = None,
+) -> int:
+    """Resolve a name or ID to a resource key.
+
+    Args:
+        manager: pyvergeos resource manager (e.g., client.vms).
+        identifier: A resource name, a numeric key, or ``key:<n>`` to use
+            key n without listing.
+        resource_type: Type name for error messages (e.g., "VM", "network").
+        scope: Filters passed to ``manager.list()`` so only resources under a
+            parent (e.g. one recipe) are considered.
+
+    Returns:
+        Resource key (int).
+
+    Raises:
+        ResourceNotFoundError: No resource matches.
+        MultipleMatchesError: Multiple resources match name.
+    """
+    explicit = _explicit_key(identifier)
+    if explicit is not None:
+        return explicit
+
+    memo_key = f"{identifier}\0{sorted(scope.items())!r}" if scope else identifier
+    cached = _cached_key(manager, memo_key)
+    if cached is not None:
+        return cached
+
+    # Search by name first (handles both named and numeric names)
+    resources = _list_for_resolve(manager, resource_type, scope)
+    return _remember_key(
+        manager, memo_key, _match_resource_id(resources, identifier, resource_type)
+    )
+
+
+def resolve_named_resource_id(
+    manager: Any,
+    identifier: str,
+    resource_type: str = "resource",
+) -> int:
+    """Resolve a name or ID using a listing filtered to that name.
+
+    Matching follows the same rules as :func:`resolve_resource_id` (names
+    first, then numeric keys), but only rows named ``identifier`` are
+    fetched instead of the whole collection. Use it for managers whose
+    ``list()`` accepts a ``name`` filter.
+
+    Args:
+        manager: pyvergeos resource manager (e.g., client.sites).
+        identifier: A resource name, a numeric key, or ``key:<n>``.
+        resource_type: Type name for error messages (e.g., "Site").
+
+    Returns:
+        Resource key (int).
+
+    Raises:
+        ResourceNotFoundError: No resource matches.
+        MultipleMatchesError: Multiple resources match name.
+    """
+    explicit = _explicit_key(identifier)
+    if explicit is not None:
+        return explicit
+
+    cached = _cached_key(manager, identifier)
+    if cached is not None:
+        return cached
+    resources = _list_for_resolve(manager, resource_type, {"name": identifier})
+    return _remember_key(
+        manager, identifier, _match_resource_id(resources, identifier, resource_type)
+    )
+
+
+def key_or_name_filter(value: str, key_field: str, name_field: str) -> dict[str, Any]:
+    """Build a list() filter from a value that may be a key or a name.
+
+    All-digit and ``key:<n>`` values filter on ``key_field``; anything else
+    filters on ``name_field``. The SDK resolves the name server-side, so no lookup is
+    made here.
+
+    Args:
+        value: Key or name given on the command line.
+        key_field: SDK keyword for the key filter (e.g. "site_key").
+        name_field: SDK keyword for the name filter (e.g. "site_name").
+
+    Returns:
+        Single-entry dict to merge into the list() keyword arguments.
+    """
+    explicit = _explicit_key(value)
+    if explicit is not None:
+        return {key_field: explicit}
+    if value.isdigit():
+        return {key_field: int(value)}
+    return {name_field: value}
+
+
+def resolve_resource_ids(
+    manager: ResourceManager,
+    identifiers: list[str],
+    resource_type: str = "resource",
+) -> list[int]:
+    """Resolve several names or IDs to resource keys with a single listing.
+
+    Matching follows the same rules as :func:`resolve_resource_id`, but the
+    manager is listed once for the whole batch instead of once per name.
+
+    Args:
+        manager: pyvergeos resource manager (e.g., client.users).
+        identifiers: Numeric keys, ``key:<n>`` keys and/or resource names.
+        resource_type: Type name for error messages (e.g., "User").
+
+    Returns:
+        Resource keys in the same order as ``identifiers``.
+
+    Raises:
+        ResourceNotFoundError: An identifier matches no resource.
+        MultipleMatchesError: An identifier matches several resources.
+    """
+    known: list[Any] = []
+    for ident in identifiers:
+        key = _explicit_key(ident)
+        known.append(key if key is not None else _cached_key(manager, ident))
+    if all(key is not None for key in known):
+        return known
+    resources = _list_for_resolve(manager, resource_type)
+    return [
+        key
+        if key is not None
+        else _remember_key(manager, ident, _match_resource_id(resources, ident, resource_type))
+        for ident, key in zip(identifiers, known, strict=True)
+    ]
+
+
+def resolve_named_resource_ids(
+    manager: Any,
+    identifiers: list[str],
+    resource_type: str = "resource",
+) -> list[int]:
+    """Resolve the identifiers given to a multi-target command.
+
+    A single identifier is resolved with :func:`resolve_named_resource_id`
+    (a name-filtered listing); several share one full listing via
+    :func:`resolve_resource_ids`.
+
+    Args:
+        manager: pyvergeos resource manager whose ``list()`` accepts ``name``.
+        identifiers: Names, numeric keys and/or ``key:<n>`` keys.
+        resource_type: Type name for error messages (e.g., "Site").
+
+    Returns:
+        Resource keys in the same order as ``identifiers``.
+
+    Raises:
+        ResourceNotFoundError: An identifier matches no resource.
+        MultipleMatchesError: An identifier matches several resources.
+    """
+    if len(identifiers) == 1:
+        return [resolve_named_resource_id(manager, identifiers[0], resource_type)]
+    return resolve_resource_ids(manager, identifiers, resource_type)
+
+
 def resolve_nas_resource(
     manager: Any,
     identifier: str,
@@ -112,11 +334,12 @@ def resolve_nas_resource(
     if _HEX_KEY_PATTERN.match(identifier):
         return identifier
 
+    cached = _cached_key(manager, identifier)
+    if cached is not None:
+        return str(cached)
+
     # Search by name
-    try:
-        resources = manager.list()
-    except Exception as e:
-        raise ResourceNotFoundError(f"Failed to list {resource_type}s: {e}") from e
+    resources = _list_for_resolve(manager, resource_type)
 
     matches = []
     for resource in resources:
@@ -131,7 +354,7 @@ def resolve_nas_resource(
             matches.append({"name": name, "$key": key})
 
     if len(matches) == 1:
-        return str(matches[0]["$key"])
+        return str(_remember_key(manager, identifier, matches[0]["$key"]))
 
     if len(matches) > 1:
         raise MultipleMatchesError(resource_type, identifier, matches)
@@ -139,6 +362,190 @@ def resolve_nas_resource(
     raise ResourceNotFoundError(f"{resource_type} '{identifier}' not found")
 
 
+def fetch_nas_resource(
+    manager: Any,
+    identifier: str,
+    resource_type: str = "resource",
+) -> Any:
+    """Fetch a NAS-style resource object by hex key or name in one request.
+
+    Unlike ``resolve_nas_resource`` followed by ``get``, a name is looked up
+    with a server-side ``name`` filter and the matching object is returned
+    directly, so callers that need the full object make a single API call.
+
+    Args:
+        manager: pyvergeos resource manager with 40-char hex keys.
+        identifier: Either a 40-char hex key or a resource name.
+        resource_type: Type name for error messages.
+
+    Returns:
+        The SDK resource object.
+
+    Raises:
+        ResourceNotFoundError: No resource matches.
+        MultipleMatchesError: Multiple resources match name.
+    """
+    if _HEX_KEY_PATTERN.match(identifier):
+        return manager.get(identifier)
+
+    try:
+        candidates = manager.list(name=identifier)
+    except Exception as e:
+        raise ResourceNotFoundError(f"Failed to list {resource_type}s: {e}") from e
+
+    # The name filter may treat '*' as a wildcard, so re-check exact names.
+    matches = [r for r in candidates if r.name == identifier]
+    if len(matches) == 1:
+        _remember_key(manager, identifier, matches[0].key)
+        return matches[0]
+
+    if len(matches) > 1:
+        raise MultipleMatchesError(
+            resource_type,
+            identifier,
+            [{"name": r.name, "$key": r.key} for r in matches],
+        )
+
+    raise ResourceNotFoundError(f"{resource_type} '{identifier}' not found")
+
+
+def fetch_resource(
+    manager: Any,
+    identifier: str,
+    resource_type: str = "resource",
+) -> Any:
+    """Fetch a resource object by name or numeric key.
+
+    Matching follows :func:`resolve_resource_id` (names first, then numeric
+    keys), but the name lookup uses a server-side ``name`` filter and the
+    matching object is returned directly, so a name costs one API call
+    instead of a resolve followed by ``get``.
+
+    Args:
+        manager: pyvergeos resource manager whose ``list()`` accepts ``name``.
+        identifier: A resource name, a numeric key, or ``key:<n>`` to get
+            key n directly.
+        resource_type: Type name for error messages (e.g., "Site").
+
+    Returns:
+        The SDK resource object.
+
+    Raises:
+        ResourceNotFoundError: No resource matches.
+        MultipleMatchesError: Multiple resources match name.
+    """
+    explicit = _explicit_key(identifier)
+    if explicit is not None:
+        return manager.get(explicit)
+
+    candidates = _list_for_resolve(manager, resource_type, {"name": identifier})
+
+    # The name filter may treat '*' as a wildcard, so re-check exact names.
+    matches = [r for r in candidates if r.name == identifier]
+    if len(matches) == 1:
+        _remember_key(manager, identifier, matches[0].key)
+        return matches[0]
+
+    if len(matches) > 1:
+        raise MultipleMatchesError(
+            resource_type,
+            identifier,
+            [{"name": r.name, "$key": r.key} for r in matches],
+        )
+
+    if identifier.isdigit():
+        return manager.get(int(identifier))
+
+    raise ResourceNotFoundError(f"{resource_type} '{identifier}' not found")
+
+
+def encode_continuation(offset: int) -> str:
+    """Encode a list position as an opaque --continuation token.
+
+    The token holds a row offset, not the last key seen, so rows created
+    or deleted between requests shift later pages.
+    """
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_continuation(token: str) -> int:
+    """Decode a --continuation token back to a list position.
+
+    Raises:
+        ValidationCliError: Token was not produced by encode_continuation.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        prefix, _, offset = raw.partition(":")
+        if prefix != "o" or not offset.isdigit():
+            raise ValueError(raw)
+        return int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationCliError(f"Invalid continuation token '{token}'") from None
+
+
+def iter_pages(
+    list_fn: Callable[..., list[Any]],
+    page_size: int,
+    offset: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Yield items from an SDK list method one page at a time.
+
+    Only one page is held in memory; iteration stops at the first short page.
+    """
+    while True:
+        page = list_fn(limit=page_size, offset=offset, **kwargs)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+def list_paged(
+    list_fn: Callable[..., list[Any]],
+    *,
+    page_size: int | None = None,
+    continuation: str | None = None,
+    all_pages: bool = False,
+    **kwargs: Any,
+) -> Iterable[Any]:
+    """Call an SDK list method honouring --page-size/--continuation/--all.
+
+    Without any paging option this is a plain ``list_fn(**kwargs)``. With
+    --all, pages are fetched lazily as the result is iterated. Otherwise a
+    single page is fetched and, if it was full, the token for the next page
+    is printed to stderr so scripts can resume.
+
+    Args:
+        list_fn: SDK manager ``list`` method (must accept limit/offset).
+        page_size: Rows per request.
+        continuation: Token from a previous call.
+        all_pages: Fetch every page from the continuation point onwards.
+        **kwargs: Filters forwarded to list_fn.
+
+    Returns:
+        Iterable of SDK objects.
+    """
+    if page_size is None and continuation is None and not all_pages:
+        return list_fn(**kwargs)
+    if kwargs.get("limit") is not None:
+        raise ValidationCliError("--limit cannot be combined with --page-size/--continuation/--all")
+    kwargs.pop("limit", None)
+
+    size = page_size or DEFAULT_PAGE_SIZE
+    offset = decode_continuation(continuation) if continuation else 0
+    if all_pages:
+        return iter_pages(list_fn, size, offset, **kwargs)
+
+    page = list_fn(limit=size, offset=offset, **kwargs)
+    if len(page) == size:
+        import typer
+
+        typer.echo(f"Next page: --continuation {encode_continuation(offset + size)}", err=True)
+    return page
+
+
 def wait_for_state(
     get_resource: Callable[..., Any],
     resource_key: int,
@@ -104,8 +104,8 @@ class TestOutputFlag:
     """Tests for --output flag validation."""
 
     def test_output_flag_accepts_valid_formats(self, cli_runner, mock_client):
-        """Test that --output accepts table, wide, json, csv."""
-        for fmt in ["table", "wide", "json", "csv"]:
+        """Test that --output accepts table, wide, json, ndjson, csv."""
+        for fmt in ["table", "wide", "json", "ndjson", "csv"]:
             result = cli_runner.invoke(app, ["--output", fmt, "system", "info"])
             assert result.exit_code != 2, f"--output {fmt} rejected: {result.output}"
 
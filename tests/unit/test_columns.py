@@ -21,6 +21,7 @@ from verge_cli.columns import (
     ZONE_COLUMNS,
     ColumnDef,
     format_bool_yn,
+    format_comma_list,
     normalize_lower,
 )
 
@@ -61,6 +62,26 @@ class TestFormatBoolYn:
         assert format_bool_yn("yes") == "yes"
 
 
+class TestFormatCommaList:
+    def test_list_table(self) -> None:
+        assert format_comma_list(["openid", "email"]) == "openid, email"
+
+    def test_list_csv(self) -> None:
+        assert format_comma_list(["openid", "email"], for_csv=True) == "openid, email"
+
+    def test_empty_table(self) -> None:
+        assert format_comma_list([]) == "-"
+
+    def test_empty_csv(self) -> None:
+        assert format_comma_list([], for_csv=True) == ""
+
+    def test_none_table(self) -> None:
+        assert format_comma_list(None) == "-"
+
+    def test_string_passthrough(self) -> None:
+        assert format_comma_list("openid") == "openid"
+
+
 class TestStyleMaps:
     def test_status_running_is_green(self) -> None:
         assert STATUS_STYLES["running"] == "green"
@@ -0,0 +1,49 @@
+"""Tests for the CLI context."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from verge_cli.context import VergeContext
+
+
+def _context(**overrides: object) -> VergeContext:
+    options: dict[str, object] = {
+        "config": MagicMock(),
+        "client": MagicMock(),
+        "output_format": "json",
+        "verbosity": 0,
+        "quiet": False,
+    }
+    options.update(overrides)
+    return VergeContext(**options)  # type: ignore[arg-type]
+
+
+def test_emit_uses_context_output_options(capsys) -> None:
+    """emit() forwards the global format and query to output_result."""
+    vctx = _context(query="name")
+
+    vctx.emit({"name": "web", "$key": 1})
+
+    assert json.loads(capsys.readouterr().out) == "web"
+
+
+def test_emit_forwards_rows(capsys) -> None:
+    """emit() outputs iterables of rows in the context's format."""
+    vctx = _context()
+
+    vctx.emit({"$key": k} for k in (1, 2))
+
+    assert json.loads(capsys.readouterr().out) == [{"$key": 1}, {"$key": 2}]
+
+
+def test_context_is_read_only() -> None:
+    """Handlers cannot change the global options through the context."""
+    vctx = _context()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        vctx.quiet = True  # type: ignore[misc]
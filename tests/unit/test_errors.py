@@ -0,0 +1,41 @@
+"""Tests for CLI error handling."""
+
+from __future__ import annotations
+
+import pytest
+import typer
+
+from verge_cli.errors import ExitCode, ResourceNotFoundError, handle_errors
+
+
+def _raise_not_found() -> None:
+    raise ResourceNotFoundError("VM 'web' not found")
+
+
+def test_decorator_maps_cli_error() -> None:
+    """@handle_errors() converts CliError to an exit code."""
+    wrapped = handle_errors()(_raise_not_found)
+
+    with pytest.raises(typer.Exit) as exc_info:
+        wrapped()
+
+    assert exc_info.value.exit_code == ExitCode.NOT_FOUND_ERROR
+    assert wrapped.__name__ == "_raise_not_found"
+
+
+def test_default_decorator_is_shared() -> None:
+    """@handle_errors() with default options reuses one decorator."""
+    assert handle_errors() is handle_errors()
+
+
+def test_unexpected_error_is_general_error() -> None:
+    """Unexpected exceptions exit with the general error code."""
+
+    @handle_errors(verbosity=1)
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(typer.Exit) as exc_info:
+        boom()
+
+    assert exc_info.value.exit_code == ExitCode.GENERAL_ERROR
@@ -0,0 +1,72 @@
+"""Tests for lazily loaded Typer sub-command groups."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+import typer
+from typer.testing import CliRunner
+
+from verge_cli.cli import app
+from verge_cli.lazy import lazy_group
+
+
+def test_lazy_subcommand_not_imported_for_sibling_command(cli_runner, mock_client):
+    """Running a recipe command does not import unrelated recipe sub-apps."""
+    sys.modules.pop("verge_cli.commands.recipe_question", None)
+    mock_client.vm_recipes.list.return_value = []
+
+    result = cli_runner.invoke(app, ["recipe", "list"])
+
+    assert result.exit_code == 0
+    assert "verge_cli.commands.recipe_question" not in sys.modules
+
+
+def test_lazy_subcommand_dispatches(cli_runner, mock_client, mock_recipe_log):
+    """A lazy sub-app is imported and runs when dispatched."""
+    mock_client.vm_recipe_logs.list.return_value = [mock_recipe_log]
+
+    result = cli_runner.invoke(app, ["recipe", "log", "list"])
+
+    assert result.exit_code == 0
+    mock_client.vm_recipe_logs.list.assert_called_once()
+
+
+def test_lazy_subcommands_listed_in_help():
+    """Group help lists lazy sub-apps alongside eager commands."""
+    parent = typer.Typer(cls=lazy_group({"child": "verge_cli.commands.recipe_log:app"}))
+
+    @parent.command("eager")
+    def eager() -> None:
+        """Eager command."""
+
+    @parent.command("other")
+    def other() -> None:
+        """Other command."""
+
+    result = CliRunner().invoke(parent, ["--help"])
+
+    assert result.exit_code == 0
+    assert "eager" in result.output
+    assert "child" in result.output
+    assert "View recipe operation logs." in result.output
+
+
+def test_lazy_subcommand_listed_once_after_load():
+    """A loaded lazy sub-app is not listed a second time."""
+    parent = typer.Typer(cls=lazy_group({"child": "verge_cli.commands.recipe_log:app"}))
+
+    @parent.command("eager")
+    def eager() -> None:
+        """Eager command."""
+
+    @parent.command("other")
+    def other() -> None:
+        """Other command."""
+
+    group = typer.main.get_group(parent)
+    ctx = click.Context(group)
+
+    assert group.get_command(ctx, "child") is not None
+    assert sorted(group.list_commands(ctx)) == ["child", "eager", "other"]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 from unittest.mock import MagicMock
 
 from pyvergeos.exceptions import NotFoundError
@@ -21,6 +24,33 @@ def test_oidc_list(cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app:
     mock_client.oidc_applications.list.assert_called_once()
 
 
+def test_oidc_list_json_keeps_lists(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
+) -> None:
+    """JSON output carries scopes and redirect URIs as raw lists."""
+    mock_client.oidc_applications.list.return_value = [mock_oidc_app]
+
+    result = cli_runner.invoke(app, ["--output", "json", "oidc", "list"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data[0]["scopes"] == ["openid", "profile", "email", "groups"]
+    assert data[0]["redirect_uris"] == ["https://grafana.example.com/callback"]
+    assert "redirect_uris_display" not in data[0]
+
+
+def test_oidc_list_csv_joins_lists(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
+) -> None:
+    """CSV output renders list columns as comma-separated text."""
+    mock_client.oidc_applications.list.return_value = [mock_oidc_app]
+
+    result = cli_runner.invoke(app, ["--output", "csv", "oidc", "list"])
+
+    assert result.exit_code == 0
+    assert '"openid, profile, email, groups"' in result.output
+
+
 def test_oidc_list_enabled(
     cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
 ) -> None:
@@ -30,7 +60,7 @@ def test_oidc_list_enabled(
     result = cli_runner.invoke(app, ["oidc", "list", "--enabled"])
 
     assert result.exit_code == 0
-    mock_client.oidc_applications.list.assert_called_once_with(enabled=True)
+    mock_client.oidc_applications.list.assert_called_once_with(filter="enabled eq 1")
 
 
 def test_oidc_list_disabled(
@@ -42,7 +72,23 @@ def test_oidc_list_disabled(
     result = cli_runner.invoke(app, ["oidc", "list", "--disabled"])
 
     assert result.exit_code == 0
-    mock_client.oidc_applications.list.assert_called_once_with(enabled=False)
+    mock_client.oidc_applications.list.assert_called_once_with(filter="enabled eq 0")
+
+
+def test_oidc_list_filter_merged_with_enabled(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
+) -> None:
+    """--filter and --enabled are merged into one OData filter."""
+    mock_client.oidc_applications.list.return_value = [mock_oidc_app]
+
+    result = cli_runner.invoke(
+        app, ["oidc", "list", "--filter", "name eq 'a' or name eq 'b'", "--enabled"]
+    )
+
+    assert result.exit_code == 0
+    mock_client.oidc_applications.list.assert_called_once_with(
+        filter="(name eq 'a' or name eq 'b') and enabled eq 1"
+    )
 
 
 def test_oidc_list_enabled_disabled_exclusive(
@@ -68,6 +114,35 @@ def test_oidc_get(cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app:
     )
 
 
+def test_oidc_get_table_joins_lists(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
+) -> None:
+    """Table output of a single application joins list fields."""
+    mock_client.oidc_applications.get.return_value = mock_oidc_app
+
+    result = cli_runner.invoke(app, ["oidc", "get", "grafana"])
+
+    assert result.exit_code == 0
+    output = " ".join(result.output.split())
+    assert "openid, profile, email, groups" in output
+    assert '["openid"' not in output
+
+
+def test_oidc_get_csv_joins_lists(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
+) -> None:
+    """CSV output of a single application joins list fields."""
+    mock_client.oidc_applications.get.return_value = mock_oidc_app
+
+    result = cli_runner.invoke(app, ["--output", "csv", "oidc", "get", "grafana"])
+
+    assert result.exit_code == 0
+    header, row = list(csv.reader(io.StringIO(result.output)))
+    record = dict(zip(header, row, strict=True))
+    assert record["scopes"] == "openid, profile, email, groups"
+    assert record["redirect_uris"] == "https://grafana.example.com/callback"
+
+
 def test_oidc_get_by_key(
     cli_runner: CliRunner, mock_client: MagicMock, mock_oidc_app: MagicMock
 ) -> None:
@@ -284,6 +359,7 @@ def test_oidc_enable(
     assert result.exit_code == 0
     assert "Enabled" in result.output
     mock_oidc_app.enable.assert_called_once()
+    mock_client.oidc_applications.get.assert_called_once_with(key=80)
 
 
 def test_oidc_disable(
@@ -297,6 +373,7 @@ def test_oidc_disable(
     assert result.exit_code == 0
     assert "Disabled" in result.output
     mock_oidc_app.disable.assert_called_once()
+    mock_client.oidc_applications.get.assert_called_once_with(key=80)
 
 
 def test_oidc_not_found(cli_runner: CliRunner, mock_client: MagicMock) -> None:
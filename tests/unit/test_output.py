@@ -6,8 +6,10 @@ import json
 from datetime import datetime
 from typing import Any
 
+import pytest
 from rich.text import Text
 
+from verge_cli import output as output_module
 from verge_cli.columns import (
     FLAG_STYLES,
     STATUS_STYLES,
@@ -17,6 +19,7 @@ from verge_cli.columns import (
     normalize_lower,
 )
 from verge_cli.output import (
+    compile_row_renderer,
     extract_field,
     format_csv,
     format_json,
@@ -24,6 +27,7 @@ from verge_cli.output import (
     format_value,
     output_result,
     render_cell,
+    write_ndjson,
 )
 
 
@@ -365,6 +369,14 @@ class TestFormatTableWithColumnDefs:
         assert "name" in out
         assert "vm1" in out
 
+    def test_single_dict_applies_column_format_fn(self, capsys) -> None:
+        """Single dict uses a column's format_fn for its value."""
+        cols = [ColumnDef("running", format_fn=format_bool_yn)]
+        format_table({"name": "vm1", "running": True}, columns=cols, no_color=True)
+        out = capsys.readouterr().out
+        assert "Y" in out
+        assert "yes" not in out
+
     def test_backward_compat_string_columns(self, capsys) -> None:
         """list[str] columns still work for backward compatibility."""
         data = [{"name": "vm1", "status": "running"}]
@@ -480,6 +492,13 @@ class TestOutputResultFormats:
         assert "status" in lines[0]
         assert "vm1" in lines[1]
 
+    def test_csv_dict_applies_column_format_fn(self, capsys) -> None:
+        data = {"name": "vm1", "running": True}
+        cols = [ColumnDef("running", format_fn=format_bool_yn)]
+        output_result(data, output_format="csv", columns=cols)
+        lines = capsys.readouterr().out.strip().split("\n")
+        assert lines == ["name,running", "vm1,true"]
+
     def test_csv_query_scalar(self, capsys) -> None:
         data = [{"name": "vm1"}]
         output_result(data, output_format="csv", query="0.name")
@@ -487,3 +506,101 @@ class TestOutputResultFormats:
         lines = out.strip().split("\n")
         assert lines[0] == "value"
         assert lines[1] == "vm1"
+
+
+class TestOutputResultStreaming:
+    def test_json_stream_matches_list_output(self, capsys) -> None:
+        data = [{"name": "vm1", "tags": ["a"]}, {"name": "vm2", "tags": []}]
+        output_result(iter(data), output_format="json")
+        streamed = capsys.readouterr().out
+        output_result(data, output_format="json")
+        buffered = capsys.readouterr().out
+        assert streamed == buffered
+
+    def test_json_stream_empty(self, capsys) -> None:
+        output_result(iter([]), output_format="json")
+        assert capsys.readouterr().out == "[]\n"
+
+    def test_csv_stream(self, capsys) -> None:
+        rows = ({"name": f"vm{i}"} for i in range(2))
+        output_result(rows, output_format="csv", columns=[ColumnDef("name")])
+        out = capsys.readouterr().out
+        assert out.splitlines() == ["Name", "vm0", "vm1"]
+
+    def test_table_stream(self, capsys) -> None:
+        rows = ({"name": f"vm{i}"} for i in range(2))
+        output_result(rows, columns=[ColumnDef("name")], no_color=True)
+        out = capsys.readouterr().out
+        assert "vm0" in out
+        assert "vm1" in out
+
+    def test_table_stream_empty(self, capsys) -> None:
+        output_result(iter([]), columns=[ColumnDef("name")], no_color=True)
+        assert "No results found" in capsys.readouterr().out
+
+    def test_query_materializes_stream(self, capsys) -> None:
+        rows = ({"name": f"vm{i}"} for i in range(2))
+        output_result(rows, output_format="json", query="name")
+        assert json.loads(capsys.readouterr().out) == ["vm0", "vm1"]
+
+
+class TestNdjsonOutput:
+    def test_one_compact_object_per_line(self, capsys) -> None:
+        rows = ({"name": f"vm{i}", "tags": ["a", "b"]} for i in range(3))
+        output_result(rows, output_format="ndjson")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == '{"name":"vm0","tags":["a","b"]}'
+        assert [json.loads(line)["name"] for line in lines] == ["vm0", "vm1", "vm2"]
+
+    def test_single_dict_is_one_line(self, capsys) -> None:
+        output_result({"name": "vm1"}, output_format="ndjson")
+        assert capsys.readouterr().out == '{"name":"vm1"}\n'
+
+    def test_empty_stream_writes_nothing(self, capsys) -> None:
+        output_result(iter([]), output_format="ndjson")
+        assert capsys.readouterr().out == ""
+
+    def test_chunked_writes_keep_every_line(self, capsys, monkeypatch) -> None:
+        monkeypatch.setattr("verge_cli.output._NDJSON_CHUNK", 32)
+        write_ndjson({"n": i} for i in range(50))
+        lines = capsys.readouterr().out.split("\n")
+        assert lines[-1] == ""
+        assert [json.loads(line)["n"] for line in lines[:-1]] == list(range(50))
+
+    def test_datetime_uses_json_serializer(self, capsys) -> None:
+        output_result([{"at": datetime(2026, 1, 2, 3, 4, 5)}], output_format="ndjson")
+        assert "2026-01-02T03:04:05" in capsys.readouterr().out
+
+
+class TestCompileRowRenderer:
+    COLUMNS = [
+        ColumnDef("name"),
+        ColumnDef("status", style_map=STATUS_STYLES, normalize_fn=normalize_lower),
+        ColumnDef("flag", format_fn=format_bool_yn, default_style="dim"),
+        ColumnDef("desc", wide_only=True),
+    ]
+
+    def test_matches_render_cell(self) -> None:
+        row = {"name": "vm1", "status": "Running", "flag": True, "desc": None}
+        cells = compile_row_renderer(self.COLUMNS)(row)
+        expected = [render_cell(row.get(c.key), row, c) for c in self.COLUMNS]
+        assert [(c.plain, c.style) for c in cells] == [(e.plain, e.style) for e in expected]
+
+    def test_csv_cells_are_plain(self) -> None:
+        row = {"name": "vm1", "status": "running", "flag": False, "desc": None}
+        cells = compile_row_renderer(self.COLUMNS, for_csv=True)(row)
+        assert cells == ["vm1", "running", "false", ""]
+
+    def test_narrow_skips_wide_only(self) -> None:
+        row = {"name": "vm1", "status": "running", "flag": False, "desc": "x"}
+        assert len(compile_row_renderer(self.COLUMNS, wide=False)(row)) == 3
+
+    def test_cached_per_column_list(self) -> None:
+        assert compile_row_renderer(self.COLUMNS) is compile_row_renderer(self.COLUMNS)
+
+    def test_auto_detected_csv_columns_not_cached(self, capsys: pytest.CaptureFixture[str]) -> None:
+        before = len(output_module._row_renderers)
+        format_csv([{"a": 1, "b": 2}])
+        format_csv([{"a": 3, "b": 4}])
+        assert len(output_module._row_renderers) == before
+        assert capsys.readouterr().out == "A,B\n1,2\nA,B\n3,4\n"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+from unittest.mock import MagicMock
+
 from verge_cli.cli import app
 
 
@@ -49,6 +52,44 @@ def test_permission_list_by_table(cli_runner, mock_client, mock_permission):
     mock_client.permissions.list.assert_called_once_with(table="vms")
 
 
+def test_permission_list_filter_parenthesised_with_table(cli_runner, mock_client, mock_permission):
+    """--filter is grouped so it cannot widen the --table filter."""
+    mock_client.permissions.list.return_value = [mock_permission]
+
+    result = cli_runner.invoke(
+        app,
+        ["permission", "list", "--table", "vms", "--filter", "can_read eq 1 or can_list eq 1"],
+    )
+
+    assert result.exit_code == 0
+    mock_client.permissions.list.assert_called_once_with(
+        filter="(can_read eq 1 or can_list eq 1)", table="vms"
+    )
+
+
+def test_permission_list_limit(cli_runner, mock_client, mock_permission):
+    """--limit is passed through to the SDK."""
+    mock_client.permissions.list.return_value = [mock_permission]
+
+    result = cli_runner.invoke(
+        app, ["permission", "list", "--filter", "can_read eq 1", "--limit", "5"]
+    )
+
+    assert result.exit_code == 0
+    mock_client.permissions.list.assert_called_once_with(filter="can_read eq 1", limit=5)
+
+
+def test_permission_list_page_size(cli_runner, mock_client, mock_permission):
+    """--page-size fetches one page and reports the continuation token."""
+    mock_client.permissions.list.return_value = [mock_permission]
+
+    result = cli_runner.invoke(app, ["permission", "list", "--page-size", "1"])
+
+    assert result.exit_code == 0
+    mock_client.permissions.list.assert_called_once_with(limit=1, offset=0)
+    assert "--continuation" in result.stderr
+
+
 def test_permission_get(cli_runner, mock_client, mock_permission):
     """Get permission by numeric key."""
     mock_client.permissions.get.return_value = mock_permission
@@ -215,22 +256,56 @@ def test_permission_revoke_no_confirm(cli_runner, mock_client):
     mock_client.permissions.revoke.assert_not_called()
 
 
+def _perms(*keys: int) -> list[MagicMock]:
+    perms = []
+    for key in keys:
+        perm = MagicMock()
+        perm.key = key
+        perms.append(perm)
+    return perms
+
+
 def test_permission_revoke_all_user(cli_runner, mock_client, mock_user):
     """Revoke all for a user."""
     mock_client.users.list.return_value = [mock_user]
-    mock_client.permissions.revoke_for_user.return_value = 3
+    mock_client.permissions.list.return_value = _perms(1, 2, 3)
 
     result = cli_runner.invoke(app, ["permission", "revoke-all", "--user", "admin", "--yes"])
 
     assert result.exit_code == 0
     assert "Revoked 3 permission(s)" in result.output
-    mock_client.permissions.revoke_for_user.assert_called_once_with(10, table=None)
+    mock_client.permissions.list.assert_called_once_with(table=None, user=10)
+    assert [c.args[0] for c in mock_client.permissions.revoke.call_args_list] == [1, 2, 3]
+
+
+def test_permission_revoke_all_prompt_shows_count(cli_runner, mock_client, mock_user):
+    """The confirmation prompt says how many permissions will be revoked."""
+    mock_client.users.list.return_value = [mock_user]
+    mock_client.permissions.list.return_value = _perms(1, 2)
+
+    result = cli_runner.invoke(app, ["permission", "revoke-all", "--user", "admin"], input="n\n")
+
+    assert result.exit_code == 0
+    assert "Revoke 2 permission(s) for user 'admin'?" in result.output
+    assert "Cancelled" in result.output
+    mock_client.permissions.revoke.assert_not_called()
+
+
+def test_permission_revoke_all_nothing_to_revoke(cli_runner, mock_client, mock_user):
+    """No prompt when the identity has no matching permissions."""
+    mock_client.users.list.return_value = [mock_user]
+    mock_client.permissions.list.return_value = []
+
+    result = cli_runner.invoke(app, ["permission", "revoke-all", "--user", "admin"])
+
+    assert result.exit_code == 0
+    assert "Revoked 0 permission(s)" in result.output
 
 
 def test_permission_revoke_all_group_table(cli_runner, mock_client, mock_group):
     """Revoke all for group on specific table."""
     mock_client.groups.list.return_value = [mock_group]
-    mock_client.permissions.revoke_for_group.return_value = 2
+    mock_client.permissions.list.return_value = _perms(5, 6)
 
     result = cli_runner.invoke(
         app,
@@ -239,4 +314,100 @@ def test_permission_revoke_all_group_table(cli_runner, mock_client, mock_group):
 
     assert result.exit_code == 0
     assert "Revoked 2 permission(s)" in result.output
-    mock_client.permissions.revoke_for_group.assert_called_once_with(20, table="vms")
+    mock_client.permissions.list.assert_called_once_with(table="vms", group=20)
+    assert mock_client.permissions.revoke.call_count == 2
+
+
+def test_permission_grant_multiple_users(cli_runner, mock_client, mock_permission, mock_user):
+    """Comma-separated --user grants to each user from a single user listing."""
+    other = MagicMock()
+    other.key = 11
+    other.name = "ops"
+    mock_client.users.list.return_value = [mock_user, other]
+    mock_client.permissions.grant.return_value = mock_permission
+
+    result = cli_runner.invoke(
+        app,
+        ["permission", "grant", "--table", "vms", "--user", "admin,ops", "--read"],
+    )
+
+    assert result.exit_code == 0
+    assert "Granted 2 permissions" in result.output
+    mock_client.users.list.assert_called_once()
+    granted = [c.kwargs["user"] for c in mock_client.permissions.grant.call_args_list]
+    assert granted == [10, 11]
+
+
+def test_permission_revoke_all_multiple_groups(cli_runner, mock_client, mock_group):
+    """Comma-separated --group revokes for each group and sums the counts."""
+    other = MagicMock()
+    other.key = 21
+    other.name = "ops"
+    mock_client.groups.list.return_value = [mock_group, other]
+    mock_client.permissions.list.return_value = _perms(5, 6)
+
+    result = cli_runner.invoke(app, ["permission", "revoke-all", "--group", "admins,ops", "--yes"])
+
+    assert result.exit_code == 0
+    assert "Revoked 4 permission(s)" in result.output
+    mock_client.groups.list.assert_called_once()
+
+
+def test_permission_grant_user_key_skips_lookup(cli_runner, mock_client, mock_permission):
+    """--user-key is passed through without listing users."""
+    mock_client.permissions.grant.return_value = mock_permission
+
+    result = cli_runner.invoke(app, ["permission", "grant", "--table", "vms", "--user-key", "10"])
+
+    assert result.exit_code == 0
+    mock_client.users.list.assert_not_called()
+    assert mock_client.permissions.grant.call_args.kwargs["user"] == 10
+
+
+def test_permission_list_group_key_skips_lookup(cli_runner, mock_client, mock_permission):
+    """--group-key filters without listing groups."""
+    mock_client.permissions.list.return_value = [mock_permission]
+
+    result = cli_runner.invoke(app, ["permission", "list", "--group-key", "20"])
+
+    assert result.exit_code == 0
+    mock_client.groups.list.assert_not_called()
+    mock_client.permissions.list.assert_called_once_with(group=20)
+
+
+def test_permission_revoke_all_user_key(cli_runner, mock_client):
+    """--user-key revokes without a user lookup."""
+    mock_client.permissions.list.return_value = _perms(1)
+
+    result = cli_runner.invoke(app, ["permission", "revoke-all", "--user-key", "10", "--yes"])
+
+    assert result.exit_code == 0
+    mock_client.users.list.assert_not_called()
+    mock_client.permissions.list.assert_called_once_with(table=None, user=10)
+
+
+def test_permission_grant_user_and_user_key_exclusive(cli_runner, mock_client):
+    """--user and --user-key cannot be combined."""
+    result = cli_runner.invoke(
+        app,
+        ["permission", "grant", "--table", "vms", "--user", "admin", "--user-key", "10"],
+    )
+
+    assert result.exit_code == 2
+    assert "only one of" in result.output
+
+
+def test_permission_get_derives_full_control(cli_runner, mock_client, mock_permission):
+    """has_full_control and is_table_level are derived from the row's flags."""
+    mock_permission.can_create = True
+    mock_permission.can_modify = True
+    mock_permission.can_delete = True
+    mock_client.permissions.get.return_value = mock_permission
+
+    result = cli_runner.invoke(app, ["--output", "json", "permission", "get", "50"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["has_full_control"] is True
+    assert data["is_table_level"] is True
+    assert data["row_display"] == "(all)"
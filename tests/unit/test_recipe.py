@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+import typer
+
 from verge_cli.cli import app
 from verge_cli.commands.recipe import _parse_set_args
 
@@ -28,6 +31,16 @@ def test_recipe_list_downloaded(cli_runner, mock_client, mock_recipe):
     mock_client.vm_recipes.list.assert_called_once_with(downloaded=True)
 
 
+def test_recipe_list_limit(cli_runner, mock_client, mock_recipe):
+    """vrg recipe list --limit should cap results server-side."""
+    mock_client.vm_recipes.list.return_value = [mock_recipe]
+
+    result = cli_runner.invoke(app, ["recipe", "list", "--limit", "10"])
+
+    assert result.exit_code == 0
+    mock_client.vm_recipes.list.assert_called_once_with(limit=10)
+
+
 def test_recipe_get(cli_runner, mock_client, mock_recipe):
     """vrg recipe get should get a recipe by name."""
     mock_client.vm_recipes.list.return_value = [mock_recipe]
@@ -37,6 +50,19 @@ def test_recipe_get(cli_runner, mock_client, mock_recipe):
 
     assert result.exit_code == 0
     assert "Ubuntu Server 22.04" in result.output
+    mock_client.vm_recipes.list.assert_called_once_with(name="Ubuntu Server 22.04")
+    mock_client.vm_recipes.get.assert_not_called()
+
+
+def test_recipe_get_by_key(cli_runner, mock_client, mock_recipe):
+    """vrg recipe get with a hex key should fetch it directly without listing."""
+    mock_client.vm_recipes.get.return_value = mock_recipe
+
+    result = cli_runner.invoke(app, ["recipe", "get", "8f73f8bcc9c9f1aaba32f733bfc295acaf548554"])
+
+    assert result.exit_code == 0
+    mock_client.vm_recipes.get.assert_called_once_with("8f73f8bcc9c9f1aaba32f733bfc295acaf548554")
+    mock_client.vm_recipes.list.assert_not_called()
 
 
 def test_recipe_create(cli_runner, mock_client, mock_recipe, mock_vm):
@@ -201,3 +227,15 @@ def test_parse_set_args():
     """_parse_set_args should parse KEY=VALUE pairs."""
     result = _parse_set_args(["KEY=VALUE", "FOO=bar=baz"])
     assert result == {"KEY": "VALUE", "FOO": "bar=baz"}
+
+
+def test_parse_set_args_strips_and_allows_empty_value():
+    """_parse_set_args should strip whitespace and accept KEY= with no value."""
+    result = _parse_set_args([" KEY = VALUE ", "EMPTY="])
+    assert result == {"KEY": "VALUE", "EMPTY": ""}
+
+
+def test_parse_set_args_requires_equals():
+    """_parse_set_args should reject items without '='."""
+    with pytest.raises(typer.BadParameter):
+        _parse_set_args(["NOEQUALS"])
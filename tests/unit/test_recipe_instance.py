@@ -33,6 +33,16 @@ def test_instance_list_by_recipe(cli_runner, mock_client, mock_recipe, mock_reci
     )
 
 
+def test_instance_list_limit(cli_runner, mock_client, mock_recipe_instance):
+    """vrg recipe instance list --limit should cap results server-side."""
+    mock_client.vm_recipe_instances.list.return_value = [mock_recipe_instance]
+
+    result = cli_runner.invoke(app, ["recipe", "instance", "list", "--limit", "3"])
+
+    assert result.exit_code == 0
+    mock_client.vm_recipe_instances.list.assert_called_once_with(limit=3)
+
+
 def test_instance_get(cli_runner, mock_client, mock_recipe_instance):
     """vrg recipe instance get should get instance details."""
     mock_client.vm_recipe_instances.list.return_value = [mock_recipe_instance]
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+from unittest.mock import call
+
+import pytest
+import typer
+
 from verge_cli.cli import app
+from verge_cli.commands.recipe_question import _parse_list_options
 
 
 def test_question_list(cli_runner, mock_client, mock_recipe, mock_recipe_question):
@@ -19,6 +25,27 @@ def test_question_list(cli_runner, mock_client, mock_recipe, mock_recipe_questio
     )
 
 
+def test_question_list_all_pages(cli_runner, mock_client, mock_recipe, mock_recipe_question):
+    """vrg recipe question list --all should fetch page by page."""
+    mock_client.vm_recipes.list.return_value = [mock_recipe]
+    mock_client.recipe_questions.list.side_effect = [
+        [mock_recipe_question, mock_recipe_question],
+        [mock_recipe_question],
+    ]
+
+    result = cli_runner.invoke(
+        app,
+        ["recipe", "question", "list", "Ubuntu Server 22.04", "--page-size", "2", "--all"],
+    )
+
+    assert result.exit_code == 0
+    recipe_ref = "vm_recipes/8f73f8bcc9c9f1aaba32f733bfc295acaf548554"
+    assert mock_client.recipe_questions.list.call_args_list == [
+        call(limit=2, offset=0, recipe_ref=recipe_ref),
+        call(limit=2, offset=2, recipe_ref=recipe_ref),
+    ]
+
+
 def test_question_list_by_section(
     cli_runner, mock_client, mock_recipe, mock_recipe_section, mock_recipe_question
 ):
@@ -41,6 +68,9 @@ def test_question_list_by_section(
 
     assert result.exit_code == 0
     assert "YB_CPU_CORES" in result.output
+    mock_client.recipe_sections.list.assert_called_once_with(
+        recipe_ref="vm_recipes/8f73f8bcc9c9f1aaba32f733bfc295acaf548554", name="Virtual Machine"
+    )
     mock_client.recipe_questions.list.assert_called_once_with(
         recipe_ref="vm_recipes/8f73f8bcc9c9f1aaba32f733bfc295acaf548554",
         section=100,
@@ -60,6 +90,31 @@ def test_question_get(cli_runner, mock_client, mock_recipe, mock_recipe_question
 
     assert result.exit_code == 0
     assert "YB_CPU_CORES" in result.output
+    mock_client.recipe_questions.list.assert_called_once_with(
+        recipe_ref="vm_recipes/8f73f8bcc9c9f1aaba32f733bfc295acaf548554"
+    )
+
+
+def test_question_get_by_recipe_key_skips_recipe_lookup(
+    cli_runner, mock_client, mock_recipe_question
+):
+    """A hex recipe key resolves the question with a single scoped listing."""
+    mock_client.recipe_questions.list.return_value = [mock_recipe_question]
+    mock_client.recipe_questions.get.return_value = mock_recipe_question
+
+    result = cli_runner.invoke(
+        app,
+        [
+            "recipe",
+            "question",
+            "get",
+            "8f73f8bcc9c9f1aaba32f733bfc295acaf548554",
+            "YB_CPU_CORES",
+        ],
+    )
+
+    assert result.exit_code == 0
+    mock_client.vm_recipes.list.assert_not_called()
 
 
 def test_question_create(
@@ -95,6 +150,40 @@ def test_question_create(
     mock_client.recipe_questions.create.assert_called_once()
 
 
+def test_question_create_hex_recipe_key(
+    cli_runner, mock_client, mock_recipe_section, mock_recipe_question
+):
+    """A hex recipe key resolves the section with one filtered listing."""
+    mock_client.recipe_sections.list.return_value = [mock_recipe_section]
+    mock_client.recipe_questions.create.return_value = mock_recipe_question
+    recipe_key = "8f73f8bcc9c9f1aaba32f733bfc295acaf548554"
+
+    result = cli_runner.invoke(
+        app,
+        [
+            "recipe",
+            "question",
+            "create",
+            recipe_key,
+            "--name",
+            "YB_CPU_CORES",
+            "--section",
+            "Virtual Machine",
+            "--type",
+            "num",
+        ],
+    )
+
+    assert result.exit_code == 0
+    mock_client.vm_recipes.list.assert_not_called()
+    mock_client.recipe_sections.list.assert_called_once_with(
+        recipe_ref=f"vm_recipes/{recipe_key}", name="Virtual Machine"
+    )
+    call_kwargs = mock_client.recipe_questions.create.call_args.kwargs
+    assert call_kwargs["recipe_ref"] == f"vm_recipes/{recipe_key}"
+    assert call_kwargs["section"] == mock_recipe_section.key
+
+
 def test_question_create_with_list_options(
     cli_runner, mock_client, mock_recipe, mock_recipe_section, mock_recipe_question
 ):
@@ -175,3 +264,23 @@ def test_question_delete(cli_runner, mock_client, mock_recipe, mock_recipe_quest
     assert result.exit_code == 0
     assert "deleted" in result.output.lower()
     mock_client.recipe_questions.delete.assert_called_once_with(200)
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        ("small=Small,medium=Medium", {"small": "Small", "medium": "Medium"}),
+        (" a = 1 , , b=x=y ,", {"a": "1", "b": "x=y"}),
+        ("", {}),
+        ("empty=", {"empty": ""}),
+    ],
+)
+def test_parse_list_options(options, expected):
+    """_parse_list_options should strip, skip blanks and split on the first '='."""
+    assert _parse_list_options(options) == expected
+
+
+def test_parse_list_options_requires_equals():
+    """_parse_list_options should reject a segment without '='."""
+    with pytest.raises(typer.BadParameter, match="'medium'"):
+        _parse_list_options("small=Small, medium ,large=Large")
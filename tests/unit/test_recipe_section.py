@@ -32,6 +32,9 @@ def test_section_get(cli_runner, mock_client, mock_recipe, mock_recipe_section):
 
     assert result.exit_code == 0
     assert "Virtual Machine" in result.output
+    mock_client.recipe_sections.list.assert_called_once_with(
+        recipe_ref="vm_recipes/8f73f8bcc9c9f1aaba32f733bfc295acaf548554"
+    )
 
 
 def test_section_create(cli_runner, mock_client, mock_recipe, mock_recipe_section):
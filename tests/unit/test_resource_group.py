@@ -110,6 +110,20 @@ def test_group_get_by_name(
     mock_client.resource_groups.get.assert_any_call(name="gpu-passthrough")
 
 
+def test_group_get_uuid_shaped_name(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_resource_group: MagicMock
+) -> None:
+    """A 36-char name that is not a UUID is still resolved by name."""
+    mock_client.resource_groups.get.return_value = mock_resource_group
+    name = "gpu-pass-through-for-the-render-farm"
+    assert len(name) == 36
+
+    result = cli_runner.invoke(app, ["resource-group", "get", name])
+
+    assert result.exit_code == 0
+    mock_client.resource_groups.get.assert_any_call(name=name)
+
+
 def test_group_create_pci(
     cli_runner: CliRunner, mock_client: MagicMock, mock_resource_group: MagicMock
 ) -> None:
@@ -115,6 +115,16 @@ def test_shared_object_delete(cli_runner, mock_client, mock_shared_object):
     mock_client.shared_objects.delete.assert_called_once_with(15)
 
 
+def test_shared_object_delete_several(cli_runner, mock_client, mock_shared_object):
+    """vrg shared-object delete with several objects should delete each one."""
+    mock_client.shared_objects.list.return_value = [mock_shared_object]
+
+    result = cli_runner.invoke(app, ["shared-object", "delete", "shared-web-server", "16", "--yes"])
+
+    assert result.exit_code == 0
+    assert [c.args for c in mock_client.shared_objects.delete.call_args_list] == [(15,), (16,)]
+
+
 def test_shared_object_delete_cancel(cli_runner, mock_client, mock_shared_object):
     """vrg shared-object delete should cancel without --yes."""
     mock_client.shared_objects.list.return_value = [mock_shared_object]
@@ -48,6 +48,35 @@ def test_site_list(cli_runner, mock_client, mock_site):
     mock_client.sites.list.assert_called_once_with()
 
 
+def test_site_list_limit(cli_runner, mock_client, mock_site):
+    """vrg site list --limit should cap the SDK listing."""
+    mock_client.sites.list.return_value = [mock_site]
+
+    result = cli_runner.invoke(app, ["site", "list", "--limit", "5"])
+
+    assert result.exit_code == 0
+    mock_client.sites.list.assert_called_once_with(limit=5)
+
+
+def test_site_list_limit_must_be_positive(cli_runner, mock_client):
+    """vrg site list --limit 0 should be rejected before calling the SDK."""
+    result = cli_runner.invoke(app, ["site", "list", "--limit", "0"])
+
+    assert result.exit_code == 2
+    mock_client.sites.list.assert_not_called()
+
+
+def test_site_list_page_size(cli_runner, mock_client, mock_site):
+    """vrg site list --page-size should fetch one page and print a continuation."""
+    mock_client.sites.list.return_value = [mock_site]
+
+    result = cli_runner.invoke(app, ["site", "list", "--page-size", "1"])
+
+    assert result.exit_code == 0
+    mock_client.sites.list.assert_called_once_with(limit=1, offset=0)
+    assert "--continuation" in result.stderr
+
+
 def test_site_list_empty(cli_runner, mock_client):
     """vrg site list should handle empty list."""
     mock_client.sites.list.return_value = []
@@ -87,6 +116,8 @@ def test_site_get(cli_runner, mock_client, mock_site):
 
     assert result.exit_code == 0
     assert "site2" in result.output
+    mock_client.sites.list.assert_called_once_with(name="site2")
+    mock_client.sites.get.assert_not_called()
 
 
 def test_site_get_by_key(cli_runner, mock_client, mock_site):
@@ -234,6 +265,28 @@ def test_site_disable(cli_runner, mock_client, mock_site):
     mock_client.sites.disable.assert_called_once_with(800)
 
 
+def test_site_disable_several(cli_runner, mock_client, mock_site):
+    """vrg site disable with several sites should resolve them from one listing."""
+    mock_client.sites.list.return_value = [mock_site]
+
+    result = cli_runner.invoke(app, ["site", "disable", "site2", "key:801"])
+
+    assert result.exit_code == 0
+    mock_client.sites.list.assert_called_once_with()
+    assert [c.args for c in mock_client.sites.disable.call_args_list] == [(800,), (801,)]
+    assert "Disabled site 'key:801'" in result.output
+
+
+def test_site_delete_several_unknown_deletes_nothing(cli_runner, mock_client, mock_site):
+    """vrg site delete should delete nothing if any site is unknown."""
+    mock_client.sites.list.return_value = [mock_site]
+
+    result = cli_runner.invoke(app, ["site", "delete", "site2", "missing", "--yes"])
+
+    assert result.exit_code == 6
+    mock_client.sites.delete.assert_not_called()
+
+
 def test_site_reauth(cli_runner, mock_client, mock_site):
     """vrg site reauth should re-authenticate with new credentials."""
     mock_client.sites.list.return_value = [mock_site]
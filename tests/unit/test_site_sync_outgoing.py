@@ -126,6 +126,18 @@ def test_outgoing_start(cli_runner, mock_client, mock_sync_outgoing):
     mock_client.site_syncs.start.assert_called_once_with(800)
 
 
+def test_outgoing_start_several(cli_runner, mock_client, mock_sync_outgoing):
+    """vrg site sync outgoing start should accept several syncs."""
+    mock_client.site_syncs.list.return_value = [mock_sync_outgoing]
+
+    result = cli_runner.invoke(
+        app, ["site", "sync", "outgoing", "start", "prod-to-backup", "key:801"]
+    )
+
+    assert result.exit_code == 0
+    assert [c.args for c in mock_client.site_syncs.start.call_args_list] == [(800,), (801,)]
+
+
 def test_outgoing_stop(cli_runner, mock_client, mock_sync_outgoing):
     """vrg site sync outgoing stop should stop a running sync."""
     mock_client.site_syncs.list.return_value = [mock_sync_outgoing]
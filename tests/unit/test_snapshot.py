@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -93,6 +94,18 @@ def test_snapshot_list_include_expired(cli_runner, mock_client, mock_cloud_snaps
     mock_client.cloud_snapshots.list.assert_called_once_with(include_expired=True)
 
 
+def test_snapshot_list_all_pages(cli_runner, mock_client, mock_cloud_snapshot):
+    """vrg snapshot list --all should page through every snapshot."""
+    mock_client.cloud_snapshots.list.side_effect = [[mock_cloud_snapshot], []]
+
+    result = cli_runner.invoke(app, ["-o", "json", "snapshot", "list", "--page-size", "1", "--all"])
+
+    assert result.exit_code == 0
+    assert len(json.loads(result.stdout)) == 1
+    mock_client.cloud_snapshots.list.assert_any_call(include_expired=False, limit=1, offset=0)
+    mock_client.cloud_snapshots.list.assert_any_call(include_expired=False, limit=1, offset=1)
+
+
 def test_snapshot_list_empty(cli_runner, mock_client):
     """vrg snapshot list should handle empty list."""
     mock_client.cloud_snapshots.list.return_value = []
@@ -111,6 +124,8 @@ def test_snapshot_get(cli_runner, mock_client, mock_cloud_snapshot):
 
     assert result.exit_code == 0
     assert "daily-2026-02-08" in result.output
+    mock_client.cloud_snapshots.list.assert_called_once_with(name="daily-2026-02-08")
+    mock_client.cloud_snapshots.get.assert_not_called()
 
 
 def test_snapshot_get_by_key(cli_runner, mock_client, mock_cloud_snapshot):
@@ -223,6 +238,17 @@ def test_snapshot_vms(cli_runner, mock_client, mock_cloud_snapshot, mock_snapsho
     mock_client.cloud_snapshots.vms.assert_called_once_with(800)
 
 
+def test_snapshot_vms_key_prefix_skips_lookup(cli_runner, mock_client, mock_snapshot_vm):
+    """key:N selects the snapshot without listing snapshots."""
+    mock_client.cloud_snapshots.vms.return_value.list.return_value = [mock_snapshot_vm]
+
+    result = cli_runner.invoke(app, ["snapshot", "vms", "key:800"])
+
+    assert result.exit_code == 0
+    mock_client.cloud_snapshots.list.assert_not_called()
+    mock_client.cloud_snapshots.vms.assert_called_once_with(800)
+
+
 def test_snapshot_tenants(cli_runner, mock_client, mock_cloud_snapshot, mock_snapshot_tenant):
     """vrg snapshot tenants should list tenants in a snapshot."""
     mock_client.cloud_snapshots.list.return_value = [mock_cloud_snapshot]
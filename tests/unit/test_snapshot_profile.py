@@ -58,6 +58,7 @@ def test_profile_get(cli_runner, mock_client, mock_snapshot_profile):
 
     assert result.exit_code == 0
     assert "daily-backup" in result.output
+    mock_client.snapshot_profiles.get.assert_not_called()
 
 
 def test_profile_get_by_key(cli_runner, mock_client, mock_snapshot_profile):
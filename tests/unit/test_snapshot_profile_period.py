@@ -71,6 +71,21 @@ def test_period_list(cli_runner, mock_client, mock_snapshot_profile, mock_snapsh
     mock_client.snapshot_profiles.periods.assert_called_once_with(800)
 
 
+def test_period_list_key_prefix_skips_profile_lookup(
+    cli_runner, mock_client, mock_snapshot_profile_period
+):
+    """key:N selects the profile without listing profiles."""
+    mock_client.snapshot_profiles.periods.return_value.list.return_value = [
+        mock_snapshot_profile_period
+    ]
+
+    result = cli_runner.invoke(app, ["snapshot", "profile", "period", "list", "key:800"])
+
+    assert result.exit_code == 0
+    mock_client.snapshot_profiles.list.assert_not_called()
+    mock_client.snapshot_profiles.periods.assert_called_once_with(800)
+
+
 def test_period_list_empty(cli_runner, mock_client, mock_snapshot_profile):
     """vrg snapshot profile period list should handle empty list."""
     mock_client.snapshot_profiles.list.return_value = [mock_snapshot_profile]
@@ -94,6 +109,9 @@ def test_period_get(cli_runner, mock_client, mock_snapshot_profile, mock_snapsho
 
     assert result.exit_code == 0
     assert "daily-midnight" in result.output
+    mock_client.snapshot_profiles.list.assert_called_once_with(name="daily-backup")
+    period_mgr.list.assert_called_once_with(name="daily-midnight")
+    period_mgr.get.assert_not_called()
 
 
 def test_period_get_by_key(
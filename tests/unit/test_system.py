@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -73,6 +74,13 @@ def test_system_version(cli_runner, mock_client):
     assert "6.0.0" in result.output
 
 
+def test_system_version_ndjson(cli_runner, mock_client):
+    """vrg system version with --output ndjson emits one JSON document."""
+    result = cli_runner.invoke(app, ["--output", "ndjson", "system", "version"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["version"] == "6.0.0"
+
+
 # ---------------------------------------------------------------------------
 # Settings tests
 # ---------------------------------------------------------------------------
@@ -188,6 +196,16 @@ def test_license_generate_payload(cli_runner, mock_client):
     assert "AIRGAP-PAYLOAD-DATA" in result.output
 
 
+def test_license_generate_payload_ndjson(cli_runner, mock_client):
+    """generate-payload with --output ndjson emits the payload as JSON."""
+    mock_client.system.licenses.generate_payload.return_value = "AIRGAP-PAYLOAD-DATA"
+
+    result = cli_runner.invoke(app, ["--output", "ndjson", "system", "license", "generate-payload"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"payload": "AIRGAP-PAYLOAD-DATA"}
+
+
 # ---------------------------------------------------------------------------
 # Inventory tests
 # ---------------------------------------------------------------------------
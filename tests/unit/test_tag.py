@@ -143,6 +143,27 @@ def test_tag_assign_network(
     mock_member_mgr.add.assert_called_once_with("vnets", 10)
 
 
+def test_tag_assign_several_vms(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_tag: MagicMock
+) -> None:
+    """Test assigning a tag to several VMs resolves them from one listing."""
+    mock_client.tags.list.return_value = [mock_tag]
+    vms = []
+    for key, name in ((42, "web"), (43, "db")):
+        vm = MagicMock()
+        vm.key = key
+        vm.name = name
+        vms.append(vm)
+    mock_client.vms.list.return_value = vms
+    mock_member_mgr = MagicMock()
+    mock_client.tags.members.return_value = mock_member_mgr
+    result = cli_runner.invoke(app, ["tag", "assign", "5", "vm", "web", "db"])
+    assert result.exit_code == 0, result.output
+    assert mock_client.vms.list.call_count == 1
+    mock_client.tags.members.assert_called_once_with(5)
+    assert [c.args for c in mock_member_mgr.add.call_args_list] == [("vms", 42), ("vms", 43)]
+
+
 def test_tag_unassign(cli_runner: CliRunner, mock_client: MagicMock, mock_tag: MagicMock) -> None:
     """Test unassigning a tag from a resource."""
     mock_client.tags.list.return_value = [mock_tag]
@@ -196,3 +217,14 @@ def test_tag_assign_invalid_type(
     mock_client.tags.list.return_value = [mock_tag]
     result = cli_runner.invoke(app, ["tag", "assign", "5", "invalid_type", "42"])
     assert result.exit_code != 0
+
+
+def test_tag_members_invalid_type(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_tag: MagicMock
+) -> None:
+    """Test listing members with an invalid resource type lists the valid ones."""
+    mock_client.tags.list.return_value = [mock_tag]
+    result = cli_runner.invoke(app, ["tag", "members", "5", "--type", "disk"])
+    assert result.exit_code != 0
+    assert "Invalid resource type 'disk'" in result.output
+    assert "volume" in result.output
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock
 
 from typer.testing import CliRunner
@@ -20,6 +21,16 @@ def test_category_list(
     mock_client.tag_categories.list.assert_called_once()
 
 
+def test_category_list_taggable_types(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
+) -> None:
+    """Test taggable_types lists the enabled types in table order."""
+    mock_client.tag_categories.list.return_value = [mock_tag_category]
+    result = cli_runner.invoke(app, ["--output", "json", "tag", "category", "list"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)[0]["taggable_types"] == "vms, networks, nodes, tenants"
+
+
 def test_category_get(
     cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
 ) -> None:
@@ -32,6 +43,17 @@ def test_category_get(
     mock_client.tag_categories.get.assert_called_once_with(1)
 
 
+def test_category_get_key_prefix_skips_lookup(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
+) -> None:
+    """Test that key:N gets the category without listing categories."""
+    mock_client.tag_categories.get.return_value = mock_tag_category
+    result = cli_runner.invoke(app, ["tag", "category", "get", "key:1"])
+    assert result.exit_code == 0
+    mock_client.tag_categories.list.assert_not_called()
+    mock_client.tag_categories.get.assert_called_once_with(1)
+
+
 def test_category_create(
     cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
 ) -> None:
@@ -101,6 +123,22 @@ def test_category_update(
     mock_client.tag_categories.update.assert_called_once_with(1, description="Updated desc")
 
 
+def test_category_update_taggable_flags(
+    cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
+) -> None:
+    """Test updating taggable flags sends only the flags given, on or off."""
+    mock_client.tag_categories.list.return_value = [mock_tag_category]
+    mock_client.tag_categories.update.return_value = mock_tag_category
+    result = cli_runner.invoke(
+        app,
+        ["tag", "category", "update", "1", "--no-taggable-vms", "--taggable-groups"],
+    )
+    assert result.exit_code == 0
+    mock_client.tag_categories.update.assert_called_once_with(
+        1, taggable_vms=False, taggable_groups=True
+    )
+
+
 def test_category_delete_confirm(
     cli_runner: CliRunner, mock_client: MagicMock, mock_tag_category: MagicMock
 ) -> None:
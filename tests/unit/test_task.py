@@ -57,6 +57,15 @@ def test_task_get_by_key(cli_runner, mock_client, mock_task):
     mock_client.tasks.get.assert_called_once_with(100)
 
 
+def test_task_get_key_prefix_skips_lookup(cli_runner, mock_client, mock_task):
+    """Test that key:N gets the task without listing tasks."""
+    mock_client.tasks.get.return_value = mock_task
+    result = cli_runner.invoke(app, ["task", "get", "key:100"])
+    assert result.exit_code == 0
+    mock_client.tasks.list.assert_not_called()
+    mock_client.tasks.get.assert_called_once_with(100)
+
+
 def test_task_create(cli_runner, mock_client, mock_task):
     """Test creating a task with required fields."""
     mock_client.tasks.create.return_value = mock_task
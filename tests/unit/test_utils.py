@@ -6,13 +6,33 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from verge_cli.errors import MultipleMatchesError, ResourceNotFoundError
-from verge_cli.utils import resolve_resource_id
+from verge_cli.errors import MultipleMatchesError, ResourceNotFoundError, ValidationCliError
+from verge_cli.utils import (
+    decode_continuation,
+    encode_continuation,
+    fetch_nas_resource,
+    fetch_resource,
+    forget_resolved,
+    key_or_name_filter,
+    list_paged,
+    resolve_named_resource_id,
+    resolve_named_resource_ids,
+    resolve_nas_resource,
+    resolve_resource_id,
+    resolve_resource_ids,
+)
 
 
 class TestResolveResourceId:
     """Tests for resource ID resolution."""
 
+    def test_key_prefix_skips_listing(self) -> None:
+        """key:<n> identifiers return the key without listing."""
+        manager = MagicMock()
+
+        assert resolve_resource_id(manager, "key:123", "VM") == 123
+        manager.list.assert_not_called()
+
     def test_numeric_id_fallback_returns_int(self) -> None:
         """Test that numeric identifiers fall back to int if no name match."""
         manager = MagicMock()
@@ -125,6 +145,300 @@ class TestResolveResourceId:
             resolve_resource_id(manager, "web-server", "VM")
 
 
+class TestResolveResourceIds:
+    """Tests for batched resource ID resolution."""
+
+    def test_resolves_all_with_one_listing(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [
+            {"name": "web-server", "$key": 42},
+            {"name": "db-server", "$key": 43},
+        ]
+
+        result = resolve_resource_ids(manager, ["db-server", "web-server", "7"], "VM")
+
+        assert result == [43, 42, 7]
+        manager.list.assert_called_once()
+
+    def test_empty_skips_listing(self) -> None:
+        manager = MagicMock()
+
+        assert resolve_resource_ids(manager, [], "VM") == []
+        manager.list.assert_not_called()
+
+    def test_key_prefix_skips_listing(self) -> None:
+        manager = MagicMock()
+
+        assert resolve_resource_ids(manager, ["key:3", "key:0"], "VM") == [3, 0]
+        manager.list.assert_not_called()
+
+    def test_unknown_name_raises_not_found(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "web-server", "$key": 42}]
+
+        with pytest.raises(ResourceNotFoundError, match="missing"):
+            resolve_resource_ids(manager, ["web-server", "missing"], "VM")
+
+
+class TestResolveMemo:
+    """Tests for the process-local name→key memo."""
+
+    def test_repeat_lookup_skips_listing(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "web-server", "$key": 42}]
+
+        assert resolve_resource_id(manager, "web-server", "VM") == 42
+        assert resolve_resource_id(manager, "web-server", "VM") == 42
+        manager.list.assert_called_once()
+
+    def test_batch_reuses_memo(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "web-server", "$key": 42}]
+
+        resolve_resource_id(manager, "web-server", "VM")
+        assert resolve_resource_ids(manager, ["web-server"], "VM") == [42]
+        manager.list.assert_called_once()
+
+    def test_forget_resolved_forces_relist(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "web-server", "$key": 42}]
+
+        resolve_resource_id(manager, "web-server", "VM")
+        forget_resolved(manager)
+        manager.list.return_value = [{"name": "web-server", "$key": 99}]
+
+        assert resolve_resource_id(manager, "web-server", "VM") == 99
+        assert manager.list.call_count == 2
+
+    def test_expired_entry_relists(self, mocker) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "web-server", "$key": 42}]
+        clock = mocker.patch("verge_cli.utils.time.monotonic", return_value=1000.0)
+
+        resolve_resource_id(manager, "web-server", "VM")
+        clock.return_value = 1000.0 + 301
+        resolve_resource_id(manager, "web-server", "VM")
+
+        assert manager.list.call_count == 2
+
+    def test_scoped_lookup_memoized_per_scope(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "cpu", "$key": 7}]
+
+        resolve_resource_id(manager, "cpu", "question", scope={"recipe_ref": "vm_recipes/a"})
+        resolve_resource_id(manager, "cpu", "question", scope={"recipe_ref": "vm_recipes/a"})
+        resolve_resource_id(manager, "cpu", "question", scope={"recipe_ref": "vm_recipes/b"})
+
+        assert manager.list.call_count == 2
+        manager.list.assert_called_with(recipe_ref="vm_recipes/b")
+
+    def test_nas_lookup_memoized(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "vol1", "$key": "a" * 40}]
+
+        assert resolve_nas_resource(manager, "vol1", "volume") == "a" * 40
+        assert resolve_nas_resource(manager, "vol1", "volume") == "a" * 40
+        manager.list.assert_called_once()
+
+
+class TestResolveNamedResourceId:
+    """Tests for name-filtered resolution."""
+
+    def test_lists_only_matching_name(self) -> None:
+        site = MagicMock()
+        site.name = "dr-site"
+        site.key = 7
+        manager = MagicMock()
+        manager.list.return_value = [site]
+
+        assert resolve_named_resource_id(manager, "dr-site", "Site") == 7
+        manager.list.assert_called_once_with(name="dr-site")
+
+    def test_numeric_name_wins_over_key(self) -> None:
+        site = MagicMock()
+        site.name = "42"
+        site.key = 3
+        manager = MagicMock()
+        manager.list.return_value = [site]
+
+        assert resolve_named_resource_id(manager, "42", "Site") == 3
+
+    def test_numeric_key_fallback(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = []
+
+        assert resolve_named_resource_id(manager, "42", "Site") == 42
+
+    def test_key_prefix_skips_listing(self) -> None:
+        manager = MagicMock()
+
+        assert resolve_named_resource_id(manager, "key:42", "Site") == 42
+        manager.list.assert_not_called()
+
+    def test_key_prefix_without_digits_is_a_name(self) -> None:
+        site = MagicMock()
+        site.name = "key:web"
+        site.key = 5
+        manager = MagicMock()
+        manager.list.return_value = [site]
+
+        assert resolve_named_resource_id(manager, "key:web", "Site") == 5
+
+    def test_unknown_name(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = []
+
+        with pytest.raises(ResourceNotFoundError):
+            resolve_named_resource_id(manager, "missing", "Site")
+
+
+class TestResolveNamedResourceIds:
+    """Tests for resolving multi-target command arguments."""
+
+    def test_single_uses_name_filter(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [{"name": "dr-site", "$key": 7}]
+
+        assert resolve_named_resource_ids(manager, ["dr-site"], "Site") == [7]
+        manager.list.assert_called_once_with(name="dr-site")
+
+    def test_several_share_one_listing(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = [
+            {"name": "dr-site", "$key": 7},
+            {"name": "lab", "$key": 8},
+        ]
+
+        assert resolve_named_resource_ids(manager, ["lab", "dr-site"], "Site") == [8, 7]
+        manager.list.assert_called_once_with()
+
+
+class TestKeyOrNameFilter:
+    """Tests for key-or-name list filters."""
+
+    def test_digits_filter_by_key(self) -> None:
+        assert key_or_name_filter("12", "site_key", "site_name") == {"site_key": 12}
+
+    def test_key_prefix_filters_by_key(self) -> None:
+        assert key_or_name_filter("key:12", "site_key", "site_name") == {"site_key": 12}
+
+    def test_other_values_filter_by_name(self) -> None:
+        for value in ("dr-site", " 12", "1_000", "-1"):
+            assert key_or_name_filter(value, "site_key", "site_name") == {"site_name": value}
+
+
+class TestFetchResource:
+    """Tests for single-call fetch of integer-keyed resources."""
+
+    def test_name_returns_listed_object(self) -> None:
+        site = MagicMock()
+        site.name = "dr-site"
+        manager = MagicMock()
+        manager.list.return_value = [site]
+
+        assert fetch_resource(manager, "dr-site", "Site") is site
+        manager.list.assert_called_once_with(name="dr-site")
+        manager.get.assert_not_called()
+
+    def test_numeric_key_fallback(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = []
+
+        assert fetch_resource(manager, "42", "Site") is manager.get.return_value
+        manager.get.assert_called_once_with(42)
+
+    def test_key_prefix_gets_directly(self) -> None:
+        manager = MagicMock()
+
+        assert fetch_resource(manager, "key:42", "Site") is manager.get.return_value
+        manager.get.assert_called_once_with(42)
+        manager.list.assert_not_called()
+
+    def test_unknown_name(self) -> None:
+        manager = MagicMock()
+        manager.list.return_value = []
+
+        with pytest.raises(ResourceNotFoundError):
+            fetch_resource(manager, "missing", "Site")
+
+
+class TestFetchNasResource:
+    """Tests for single-call fetch of hex-keyed resources."""
+
+    def test_name_uses_server_filter(self) -> None:
+        recipe = MagicMock()
+        recipe.name = "web"
+        recipe.key = "a" * 40
+        manager = MagicMock()
+        manager.list.return_value = [recipe]
+
+        assert fetch_nas_resource(manager, "web", "recipe") is recipe
+        manager.list.assert_called_once_with(name="web")
+        manager.get.assert_not_called()
+
+    def test_wildcard_matches_are_rechecked(self) -> None:
+        other = MagicMock()
+        other.name = "web-1"
+        manager = MagicMock()
+        manager.list.return_value = [other]
+
+        with pytest.raises(ResourceNotFoundError):
+            fetch_nas_resource(manager, "web*", "recipe")
+
+    def test_duplicate_names(self) -> None:
+        first, second = MagicMock(), MagicMock()
+        first.name = second.name = "web"
+        manager = MagicMock()
+        manager.list.return_value = [first, second]
+
+        with pytest.raises(MultipleMatchesError):
+            fetch_nas_resource(manager, "web", "recipe")
+
+
+class TestListPaged:
+    """Tests for --page-size/--continuation/--all handling."""
+
+    def test_no_paging_options_is_plain_list(self) -> None:
+        list_fn = MagicMock(return_value=[1, 2])
+
+        assert list_paged(list_fn, table="vms") == [1, 2]
+        list_fn.assert_called_once_with(table="vms")
+
+    def test_full_page_prints_next_token(self, capsys) -> None:
+        list_fn = MagicMock(return_value=[1, 2])
+
+        assert list_paged(list_fn, page_size=2) == [1, 2]
+        list_fn.assert_called_once_with(limit=2, offset=0)
+        assert encode_continuation(2) in capsys.readouterr().err
+
+    def test_short_page_prints_nothing(self, capsys) -> None:
+        list_fn = MagicMock(return_value=[1])
+
+        list_paged(list_fn, page_size=2, continuation=encode_continuation(4))
+        list_fn.assert_called_once_with(limit=2, offset=4)
+        assert capsys.readouterr().err == ""
+
+    def test_all_pages_fetched_lazily(self) -> None:
+        list_fn = MagicMock(side_effect=[[1, 2], [3, 4], [5]])
+
+        rows = list_paged(list_fn, page_size=2, all_pages=True)
+        list_fn.assert_not_called()
+        assert list(rows) == [1, 2, 3, 4, 5]
+        assert [c.kwargs["offset"] for c in list_fn.call_args_list] == [0, 2, 4]
+
+    def test_limit_conflicts_with_paging(self) -> None:
+        with pytest.raises(ValidationCliError):
+            list_paged(MagicMock(), page_size=2, limit=5)
+
+    def test_token_round_trip(self) -> None:
+        assert decode_continuation(encode_continuation(1500)) == 1500
+
+    @pytest.mark.parametrize("token", ["!!", "bm9wZQ", "o:12"])
+    def test_invalid_token(self, token: str) -> None:
+        with pytest.raises(ValidationCliError):
+            decode_continuation(token)
+
+
 class TestMultipleMatchesError:
     """Tests for MultipleMatchesError."""
 